@@ -8,25 +8,38 @@ from datetime import timedelta
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from database.connection import get_db
-from auth import models, schemas, utils
+from auth import models, schemas, token_cache, utils
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
+HASHING_RETRY_AFTER_SECONDS: int = 1
 
-@router.post("/register", response_model=schemas.UserResponse)
-def register(user: schemas.UserCreate, db: Session = Depends(get_db)) -> schemas.UserResponse:
+
+def hashing_overloaded() -> HTTPException:
     """
-    Register a new user account.
+    Build the error returned when the password hashing queue is full.
+    
+    Returns:
+        HTTP 503 exception with a Retry-After hint.
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Server is busy, please retry",
+        headers={"Retry-After": str(HASHING_RETRY_AFTER_SECONDS)}
+    )
+
+
+def check_user_available(db: Session, user: schemas.UserCreate) -> None:
+    """
+    Make sure a registration's email and username are not taken.
     
     Args:
-        user: User registration data.
         db: Database session.
-    
-    Returns:
-        Created user data.
+        user: User registration data.
     
     Raises:
         HTTPException: If email or username already exists.
@@ -44,8 +57,20 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)) -> schemas
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
+
+
+def create_user(db: Session, user: schemas.UserCreate, hashed_password: str) -> models.User:
+    """
+    Store a new user account.
+    
+    Args:
+        db: Database session.
+        user: User registration data.
+        hashed_password: Argon2 hash of the user's password.
     
-    hashed_password = utils.get_password_hash(user.password)
+    Returns:
+        Created user.
+    """
     db_user = models.User(
         email=user.email,
         username=user.username,
@@ -55,6 +80,35 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)) -> schemas
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    return db_user
+
+
+@router.post("/register", response_model=schemas.UserResponse)
+async def register(user: schemas.UserCreate, db: Session = Depends(get_db)) -> schemas.UserResponse:
+    """
+    Register a new user account.
+    
+    Database work runs on the request threadpool; the password hash is
+    awaited on the hashing pool without holding a request thread.
+    
+    Args:
+        user: User registration data.
+        db: Database session.
+    
+    Returns:
+        Created user data.
+    
+    Raises:
+        HTTPException: If email or username already exists, or the server
+            is too busy to hash the password.
+    """
+    await run_in_threadpool(check_user_available, db, user)
+    
+    try:
+        hashed_password = await utils.get_password_hash(user.password)
+    except utils.HashingOverloadedError:
+        raise hashing_overloaded()
+    db_user = await run_in_threadpool(create_user, db, user, hashed_password)
     
     return schemas.UserResponse(
         id=db_user.id,
@@ -65,11 +119,28 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)) -> schemas
     )
 
 
+def find_user(db: Session, username: str) -> Optional[models.User]:
+    """
+    Look up a user by username.
+    
+    Args:
+        db: Database session.
+        username: Username.
+    
+    Returns:
+        User, or None if no such user exists.
+    """
+    return db.query(models.User).filter(models.User.username == username).first()
+
+
 @router.post("/login", response_model=schemas.Token)
-def login(user: schemas.UserLogin, db: Session = Depends(get_db)) -> schemas.Token:
+async def login(user: schemas.UserLogin, db: Session = Depends(get_db)) -> schemas.Token:
     """
     Authenticate user and return access token.
     
+    The user lookup runs on the request threadpool; password verification
+    is awaited on the hashing pool without holding a request thread.
+    
     Args:
         user: Login credentials.
         db: Database session.
@@ -78,11 +149,19 @@ def login(user: schemas.UserLogin, db: Session = Depends(get_db)) -> schemas.Tok
         JWT access token.
     
     Raises:
-        HTTPException: If credentials are invalid.
+        HTTPException: If credentials are invalid or the server is too busy
+            to verify them.
     """
-    db_user = db.query(models.User).filter(models.User.username == user.username).first()
+    db_user = await run_in_threadpool(find_user, db, user.username)
+
+    try:
+        password_valid = db_user is not None and await utils.verify_password(
+            user.password, db_user.hashed_password
+        )
+    except utils.HashingOverloadedError:
+        raise hashing_overloaded()
 
-    if not db_user or not utils.verify_password(user.password, db_user.hashed_password):
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password"
@@ -90,7 +169,8 @@ def login(user: schemas.UserLogin, db: Session = Depends(get_db)) -> schemas.Tok
 
     access_token_expires = timedelta(minutes=utils.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = utils.create_access_token(
-        data={"sub": db_user.username}, expires_delta=access_token_expires
+        data={"sub": db_user.username, "user_id": db_user.id},
+        expires_delta=access_token_expires
     )
 
     return schemas.Token(access_token=access_token, token_type="bearer")
@@ -111,14 +191,18 @@ def get_current_user(token: str, db: Session = Depends(get_db)) -> schemas.UserR
     Raises:
         HTTPException: If token is invalid or user not found.
     """
-    username: Optional[str] = utils.verify_token(token)
-    if username is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
-        )
+    try:
+        identity = token_cache.resolve_token(token, db)
+    except token_cache.UnknownUserError:
+        identity = None
+    else:
+        if identity is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token"
+            )
     
-    user = db.query(models.User).filter(models.User.username == username).first()
+    user = db.get(models.User, identity.id) if identity is not None else None
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,174 @@
+"""
+Verified token cache.
+
+Maps access tokens to the identity they resolve to, so repeated requests with
+the same token skip JWT verification and the users lookup. Entries expire no
+later than the token itself and are dropped when the user is deactivated.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config import settings
+from auth import models, utils
+
+
+@dataclass(frozen=True)
+class TokenIdentity:
+    """
+    Identity a verified token resolves to.
+
+    Attributes:
+        id: User ID.
+        username: Username.
+        is_active: Whether the account is active.
+    """
+
+    id: int
+    username: str
+    is_active: bool
+
+
+class TokenCache:
+    """Thread-safe LRU cache of token identities with per-entry expiry."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[TokenIdentity, float]]" = OrderedDict()
+        self._tokens_by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[TokenIdentity]:
+        """
+        Look up a token.
+
+        Args:
+            token: Access token.
+
+        Returns:
+            Cached identity, or None if absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                return None
+            identity, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(token)
+                return None
+            self._entries.move_to_end(token)
+            return identity
+
+    def set(self, token: str, identity: TokenIdentity, token_expires_at: Optional[float] = None) -> None:
+        """
+        Cache a token resolution.
+
+        Args:
+            token: Access token.
+            identity: Identity the token resolved to.
+            token_expires_at: Token expiry as a UNIX timestamp, if known.
+        """
+        ttl = float(self.ttl_seconds)
+        if token_expires_at is not None:
+            ttl = min(ttl, token_expires_at - time.time())
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._remove(token)
+            self._entries[token] = (identity, time.monotonic() + ttl)
+            self._tokens_by_user.setdefault(identity.id, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Drop every cached token of a user.
+
+        Args:
+            user_id: User ID.
+        """
+        with self._lock:
+            for token in list(self._tokens_by_user.get(user_id, ())):
+                self._remove(token)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def _remove(self, token: str) -> None:
+        """Remove a token; the caller must hold the lock."""
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        user_tokens = self._tokens_by_user.get(entry[0].id)
+        if user_tokens is not None:
+            user_tokens.discard(token)
+            if not user_tokens:
+                del self._tokens_by_user[entry[0].id]
+
+
+class UnknownUserError(LookupError):
+    """Raised when a valid token refers to a user that no longer exists."""
+
+
+token_cache = TokenCache(settings.TOKEN_CACHE_SIZE, settings.TOKEN_CACHE_TTL_SECONDS)
+
+
+def resolve_token(token: str, db: Session) -> Optional[TokenIdentity]:
+    """
+    Resolve a token to a user identity, using the cache when possible.
+
+    Tokens carrying a user_id claim are looked up by primary key; older
+    tokens fall back to a username lookup.
+
+    Args:
+        token: Access token.
+        db: Database session, used only on a cache miss.
+
+    Returns:
+        Identity of the token's user, or None if the token is invalid.
+
+    Raises:
+        UnknownUserError: If the token's user no longer exists.
+    """
+    identity = token_cache.get(token)
+    if identity is not None:
+        return identity
+
+    payload = utils.decode_token(token)
+    if payload is None:
+        return None
+
+    user_id = payload.get("user_id")
+    if user_id is not None:
+        user = db.get(models.User, user_id)
+    else:
+        user = db.query(models.User).filter(models.User.username == payload["sub"]).first()
+    if user is None:
+        raise UnknownUserError(payload["sub"])
+
+    identity = TokenIdentity(id=user.id, username=user.username, is_active=bool(user.is_active))
+    token_cache.set(token, identity, payload.get("exp"))
+    return identity
+
+
+@event.listens_for(models.User, "after_update")
+def invalidate_updated_user(mapper: Any, connection: Any, target: models.User) -> None:
+    """Drop cached tokens of a user whose row was updated (e.g. deactivated)."""
+    token_cache.invalidate_user(target.id)
+
+
+@event.listens_for(models.User, "after_delete")
+def invalidate_deleted_user(mapper: Any, connection: Any, target: models.User) -> None:
+    """Drop cached tokens of a deleted user."""
+    token_cache.invalidate_user(target.id)
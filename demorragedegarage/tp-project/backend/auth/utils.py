@@ -2,22 +2,88 @@
 Authentication utility functions.
 
 Provides password hashing, verification, and JWT token operations.
+
+Argon2 work runs on a dedicated, size-limited thread pool and is awaited from
+the event loop, so a burst of logins queues on that pool without holding any
+request thread; when the pool and its queue are full, callers get
+HashingOverloadedError instead of waiting.
 """
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from config import settings
+from monitoring import metrics
 
 ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+T = TypeVar("T")
+
+pwd_context = CryptContext(
+    schemes=["argon2"],
+    deprecated="auto",
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
+
+hash_executor = ThreadPoolExecutor(
+    max_workers=settings.HASH_WORKERS,
+    thread_name_prefix="argon2"
+)
+hash_slots = threading.BoundedSemaphore(settings.HASH_WORKERS + settings.HASH_QUEUE_SIZE)
+
+
+class HashingOverloadedError(RuntimeError):
+    """Raised when the password hashing pool and its queue are full."""
+
+
+def _timed(func: Callable[..., T], *args: str) -> T:
+    """Call func and record its duration under its name ("hash", "verify")."""
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        metrics.PASSWORD_HASH_DURATION.labels(func.__name__).observe(time.perf_counter() - started)
+
+
+async def run_hashing_task(func: Callable[..., T], *args: str) -> T:
+    """
+    Run an Argon2 operation on the hashing pool and await its result.
+    
+    The queue slot is released when the operation finishes rather than when
+    the caller stops waiting, so cancelled requests cannot overfill the pool.
+    
+    Args:
+        func: Hashing or verification function.
+        *args: Arguments passed to func.
+    
+    Returns:
+        Result of func.
+    
+    Raises:
+        HashingOverloadedError: If no queue slot is free.
+    """
+    if not hash_slots.acquire(blocking=False):
+        metrics.PASSWORD_HASH_REJECTED.inc()
+        raise HashingOverloadedError("Password hashing queue is full")
+    try:
+        future = hash_executor.submit(_timed, func, *args)
+    except BaseException:
+        hash_slots.release()
+        raise
+    future.add_done_callback(lambda _: hash_slots.release())
+    return await asyncio.wrap_future(future)
 
 
-def get_password_hash(password: str) -> str:
+async def get_password_hash(password: str) -> str:
     """
     Hash a password using Argon2.
     
@@ -26,11 +92,14 @@ def get_password_hash(password: str) -> str:
     
     Returns:
         Hashed password string.
+    
+    Raises:
+        HashingOverloadedError: If the hashing queue is full.
     """
-    return pwd_context.hash(password)
+    return await run_hashing_task(pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
     
@@ -40,8 +109,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     
     Returns:
         True if password matches, False otherwise.
+    
+    Raises:
+        HashingOverloadedError: If the hashing queue is full.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await run_hashing_task(pwd_context.verify, plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -65,21 +137,37 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def verify_token(token: str) -> Optional[str]:
+def decode_token(token: str) -> Optional[Dict[str, Any]]:
     """
-    Verify and decode a JWT token.
+    Verify a JWT token and return its claims.
     
     Args:
         token: JWT token string to verify.
     
     Returns:
-        Username from token if valid, None otherwise.
+        Token claims if the signature and expiry are valid and a subject
+        is present, None otherwise.
     """
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        username: Optional[str] = payload.get("sub")
-        if username is None:
-            return None
-        return username
     except JWTError:
         return None
+    if payload.get("sub") is None:
+        return None
+    return payload
+
+
+def verify_token(token: str) -> Optional[str]:
+    """
+    Verify and decode a JWT token.
+    
+    Args:
+        token: JWT token string to verify.
+    
+    Returns:
+        Username from token if valid, None otherwise.
+    """
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return payload["sub"]
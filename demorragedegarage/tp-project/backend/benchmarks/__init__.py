@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the Startup Platform API.
+
+Scripts are run from the backend directory, e.g.
+``python -m benchmarks.bench_startup``.
+"""
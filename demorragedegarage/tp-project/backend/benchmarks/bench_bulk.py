@@ -0,0 +1,108 @@
+"""
+Measure bulk import throughput.
+
+Creates --users users, imports --projects projects and then --likes unique
+likes through projects.bulk from generated NDJSON files, and reports rows per
+second for each import. Run against a migrated, disposable database.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_bulk --likes 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Iterator
+
+from sqlalchemy import func, insert, select
+
+from database.connection import SessionLocal, get_engine
+from auth import models as auth_models
+from projects import bulk, models, schemas
+
+
+def write_ndjson(path: str, records: Iterator[dict]) -> None:
+    """Write records to an NDJSON file."""
+    with open(path, "w", encoding="utf-8") as output:
+        for record in records:
+            output.write(json.dumps(record))
+            output.write("\n")
+
+
+def timed_import(entity: schemas.BulkEntity, path: str, finalize: bool) -> None:
+    """Import one file and print its throughput."""
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        with open(path, encoding="utf-8") as stream:
+            report = bulk.import_records(db, entity, stream, schemas.BulkFormat.ndjson, finalize=finalize)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - started
+    print(
+        f"{entity.value:>8}: {report.inserted} inserted, {report.skipped} skipped, "
+        f"{report.failed} failed in {elapsed:.1f}s -> {report.inserted / elapsed:,.0f} rows/s"
+    )
+
+
+def main() -> None:
+    """Seed the database through the bulk importer and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--likes", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    get_engine()
+    db = SessionLocal()
+    try:
+        first_user = (db.scalar(select(func.max(auth_models.User.id))) or 0) + 1
+        db.execute(insert(auth_models.User), [
+            {
+                "email": f"bulk{first_user + i}@example.com",
+                "username": f"bulk{first_user + i}",
+                "hashed_password": "!",
+                "is_active": True,
+            }
+            for i in range(args.users)
+        ])
+        db.commit()
+        first_project = (db.scalar(select(func.max(models.Project.id))) or 0) + 1
+    finally:
+        db.close()
+    user_ids = range(first_user, first_user + args.users)
+
+    def projects() -> Iterator[dict]:
+        for i in range(args.projects):
+            yield {
+                "id": first_project + i,
+                "title": f"Project {i}",
+                "description": "Generated by bench_bulk",
+                "project_url": "https://example.com",
+                "user_id": rng.choice(user_ids),
+            }
+
+    def likes() -> Iterator[dict]:
+        pairs = args.users * args.projects
+        for index in rng.sample(range(pairs), min(args.likes, pairs)):
+            user_offset, project_offset = divmod(index, args.projects)
+            yield {"user_id": first_user + user_offset, "project_id": first_project + project_offset}
+
+    steps = [
+        (schemas.BulkEntity.projects, projects, False),
+        (schemas.BulkEntity.likes, likes, True),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        for entity, records, finalize in steps:
+            path = os.path.join(directory, f"{entity.value}.ndjson")
+            write_ndjson(path, records())
+            timed_import(entity, path, finalize)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Compare HTTP throughput of a sync and an async database endpoint.
+
+Serves a two-route app with uvicorn on the configured database: /sync runs
+the first listing page query in a threadpool endpoint on the sync engine
+(capped at THREADPOOL_SIZE concurrent requests, as every sync endpoint is),
+/async runs the same query on the event loop through the async engine, as
+GET /projects/ does on a cache miss. Each route is driven in turn by
+--concurrency closed-loop clients for --duration seconds and the requests
+per second are printed.
+
+Usage:
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.seed --size 10k
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.bench_db_modes --concurrency 200
+"""
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Tuple
+
+import httpx
+from anyio import to_thread
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from config import settings
+from database.connection import dispose_async_engine, get_async_db, get_db
+from auth import models as auth_models  # noqa: F401  (registers the User mapper)
+from projects import pagination, queries, schemas
+
+PAGE_SIZE: int = pagination.DEFAULT_PAGE_SIZE
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Apply THREADPOOL_SIZE as main.app does, and close the async engine."""
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    yield
+    await dispose_async_engine()
+
+
+app = FastAPI(lifespan=lifespan)
+
+
+@app.get("/sync")
+def sync_page(db: Session = Depends(get_db)) -> int:
+    """Fetch the first newest page on the sync engine."""
+    rows, _ = queries.fetch_projects_page(db, schemas.ProjectSort.newest, None, PAGE_SIZE)
+    return len(rows)
+
+
+@app.get("/async")
+async def async_page(db: AsyncSession = Depends(get_async_db)) -> int:
+    """Fetch the first newest page on the async engine."""
+    rows, _ = await db.run_sync(
+        queries.fetch_projects_page, schemas.ProjectSort.newest, None, PAGE_SIZE
+    )
+    return len(rows)
+
+
+def start_server(port: int) -> subprocess.Popen:
+    """Start uvicorn with the benchmark app and wait until it answers."""
+    server = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "benchmarks.bench_db_modes:app",
+        "--port", str(port), "--log-level", "warning",
+    ])
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/sync").status_code == 200:
+                return server
+        except httpx.HTTPError:
+            pass
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not become ready within 30s")
+
+
+async def drive(url: str, concurrency: int, duration: float) -> Tuple[int, int]:
+    """
+    Request url from concurrency closed-loop clients for duration seconds.
+
+    Args:
+        url: Endpoint URL.
+        concurrency: Clients with one request in flight each.
+        duration: Seconds to keep sending requests.
+
+    Returns:
+        Numbers of successful and failed requests.
+    """
+    counts = {"ok": 0, "failed": 0}
+    deadline = time.perf_counter() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        async def one_client() -> None:
+            while time.perf_counter() < deadline:
+                try:
+                    response = await client.get(url)
+                except httpx.HTTPError:
+                    counts["failed"] += 1
+                    continue
+                counts["ok" if response.status_code == 200 else "failed"] += 1
+
+        await asyncio.gather(*(one_client() for _ in range(concurrency)))
+    return counts["ok"], counts["failed"]
+
+
+def main() -> None:
+    """Serve the app, drive both routes and print requests per second."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    server = start_server(args.port)
+    try:
+        results: Dict[str, Tuple[int, int]] = {}
+        for mode in ("sync", "async"):
+            url = f"http://127.0.0.1:{args.port}/{mode}"
+            asyncio.run(drive(url, args.concurrency, args.warmup))
+            results[mode] = asyncio.run(drive(url, args.concurrency, args.duration))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(
+        f"concurrency={args.concurrency}, threadpool={settings.THREADPOOL_SIZE}, "
+        f"page={PAGE_SIZE}, database={settings.DATABASE_URL.split(':', 1)[0]}"
+    )
+    for mode, (ok, failed) in results.items():
+        print(f"{mode:>5}: {ok / args.duration:10.1f} req/s ({failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measure Argon2 login throughput through the bounded hashing pool.
+
+Awaits password verifications from more concurrent clients than there are
+hashing workers, the way the async login endpoint does, and reports
+verifications per second, per CPU core, and how many requests were shed
+with HashingOverloadedError. Argon2 is CPU-bound, so the per-core figure is
+the one to compare across machines and HASH_WORKERS settings.
+
+Usage:
+    HASH_WORKERS=4 python -m benchmarks.bench_login --logins 200 --clients 64
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from config import settings
+from auth import utils
+
+
+async def run(logins: int, clients: int, hashed: str) -> int:
+    """
+    Verify a password logins times from clients concurrent tasks.
+
+    Args:
+        logins: Total verifications to attempt.
+        clients: Verifications in flight at once.
+        hashed: Stored hash to verify against.
+
+    Returns:
+        Number of verifications accepted by the pool.
+    """
+    gate = asyncio.Semaphore(clients)
+
+    async def one_login() -> bool:
+        async with gate:
+            try:
+                return await utils.verify_password("benchmark-password", hashed)
+            except utils.HashingOverloadedError:
+                return False
+
+    results = await asyncio.gather(*(one_login() for _ in range(logins)))
+    return sum(results)
+
+
+def main() -> None:
+    """Run the benchmark and print throughput figures."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=32)
+    args = parser.parse_args()
+
+    hashed = utils.pwd_context.hash("benchmark-password")
+    cpus = os.cpu_count() or 1
+
+    started = time.perf_counter()
+    accepted = asyncio.run(run(args.logins, args.clients, hashed))
+    elapsed = time.perf_counter() - started
+
+    rejected = args.logins - accepted
+    per_second = accepted / elapsed
+    print(
+        f"argon2 t={settings.ARGON2_TIME_COST} m={settings.ARGON2_MEMORY_COST} "
+        f"p={settings.ARGON2_PARALLELISM}, workers={settings.HASH_WORKERS}, "
+        f"cpus={cpus}"
+    )
+    print(f"verified: {accepted} in {elapsed:.2f}s -> {per_second:.1f}/s")
+    print(f"per core: {per_second / cpus:.1f}/s, shed: {rejected}")
+
+
+if __name__ == "__main__":
+    main()
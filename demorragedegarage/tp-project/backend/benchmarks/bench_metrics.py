@@ -0,0 +1,77 @@
+"""
+Measure the per-request overhead of the metrics and timing middleware.
+
+Calls a minimal ASGI app directly, bare and wrapped in MetricsMiddleware and
+RequestTimingMiddleware, with a scope that already carries a matched route,
+and reports the mean wall time each wrapper adds per request. Pass
+--multiprocess to measure prometheus_client's memory-mapped multiprocess
+mode, which is what several uvicorn workers use.
+
+Usage:
+    python -m benchmarks.bench_metrics --requests 100000 --multiprocess
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any, Callable
+
+
+class Route:
+    """Stand-in for the route FastAPI stores in the scope."""
+
+    path = "/projects/{project_id}"
+
+
+async def endpoint(scope: Any, receive: Any, send: Callable) -> None:
+    """Send an empty 200 response."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def per_request_us(app: Any, requests: int) -> float:
+    """Return the mean wall time of one request through app in microseconds."""
+    async def receive() -> dict:
+        return {"type": "http.request"}
+
+    async def send(message: dict) -> None:
+        return None
+
+    for _ in range(1000):
+        await app({"type": "http", "method": "GET", "route": Route()}, receive, send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app({"type": "http", "method": "GET", "route": Route()}, receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Time each configuration and print the overhead."""
+    from monitoring.metrics import MULTIPROCESS, MetricsMiddleware
+    from monitoring.timing import RequestTimingMiddleware
+
+    bare = await per_request_us(endpoint, args.requests)
+    measured = await per_request_us(MetricsMiddleware(endpoint), args.requests)
+    both = await per_request_us(MetricsMiddleware(RequestTimingMiddleware(endpoint)), args.requests)
+    print(f"mode: {'multiprocess' if MULTIPROCESS else 'single process'}")
+    print(f"bare app:        {bare:7.2f} us/request")
+    print(f"+ metrics:       {measured - bare:7.2f} us/request")
+    print(f"+ metrics+timing:{both - bare:7.2f} us/request")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--multiprocess", action="store_true")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        if args.multiprocess:
+            os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+        asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
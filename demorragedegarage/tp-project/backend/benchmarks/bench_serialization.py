@@ -0,0 +1,104 @@
+"""
+Measure per-request CPU spent serializing project listings.
+
+Builds --rows synthetic listing rows and times turning them into a
+GET /projects/ response body two ways: the Pydantic path (schema objects,
+FastAPI response_model validation, JSONResponse) and the fast path
+(projects.serialization dicts encoded with orjson). Timings are process CPU
+time per response, so they exclude I/O and the database.
+
+Usage:
+    python -m benchmarks.bench_serialization --rows 1000 10000
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from main import app
+from projects import queries, schemas, serialization
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    """Generate listing rows shaped like queries.fetch_projects_page output."""
+    started = datetime(2024, 1, 1)
+    return [
+        {
+            "id": i,
+            "title": f"Project {i}",
+            "description": "Generated by bench_serialization " * 4,
+            "project_url": f"https://example.com/projects/{i}",
+            "user_id": i % 500 + 1,
+            "created_at": started + timedelta(seconds=i),
+            "username": f"user{i % 500 + 1}",
+            "likes_count": i % 97,
+            "reviews_count": i % 13,
+            "rating_total": (i % 13) * 4,
+            "version": 1,
+            "trending_score": 0.0,
+        }
+        for i in range(count, 0, -1)
+    ]
+
+
+def listing_route() -> APIRoute:
+    """Find the GET /projects/ route to reuse its response_model field."""
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == "/projects/" and "GET" in route.methods:
+            return route
+    raise LookupError("GET /projects/ is not registered")
+
+
+def cpu_ms(render: Callable[[], bytes], repeat: int) -> float:
+    """Return the mean process CPU time of render in milliseconds."""
+    render()
+    started = time.process_time()
+    for _ in range(repeat):
+        render()
+    return (time.process_time() - started) / repeat * 1000
+
+
+def main() -> None:
+    """Time both serialization paths and print CPU per response."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    field = listing_route().response_field
+    loop = asyncio.new_event_loop()
+
+    for count in args.rows:
+        rows = make_rows(count)
+        liked = {row["id"] for row in rows[::3]}
+
+        def pydantic_path() -> bytes:
+            items = [queries.row_to_project_with_user(row) for row in rows]
+            for item in items:
+                item.liked_by_me = item.id in liked
+            page = schemas.Page[schemas.ProjectWithUser](items=items, next_cursor=None)
+            content = loop.run_until_complete(
+                serialize_response(field=field, response_content=page, is_coroutine=False)
+            )
+            return JSONResponse(content).body
+
+        def fast_path() -> bytes:
+            return serialization.FastJSONResponse(serialization.projects_page(rows, None, liked)).body
+
+        slow = cpu_ms(pydantic_path, args.repeat)
+        fast = cpu_ms(fast_path, args.repeat)
+        print(
+            f"{count:>7} rows: pydantic {slow:8.2f} ms  orjson {fast:8.2f} ms  "
+            f"({slow / fast:.1f}x, {len(fast_path()) / 1024:,.0f} KiB)"
+        )
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
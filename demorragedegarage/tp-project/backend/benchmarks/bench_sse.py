@@ -0,0 +1,162 @@
+"""
+Load-test the realtime event stream with many idle subscribers.
+
+Opens --subscribers concurrent GET /events streams against a running server,
+then toggles a like --writes times and measures how long each counts event
+takes to reach every subscriber, counted from when the write was sent.
+Reports connection setup time, refused streams, delivery ratio and latency
+percentiles, and the server's resident memory per stream when --server-pid is
+given. Needs a file descriptor limit above the subscriber count on both ends.
+
+Usage:
+    uvicorn main:app --port 8000 &
+    python -m benchmarks.bench_sse --url http://localhost:8000 --subscribers 10000 --server-pid $!
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import time
+import urllib.request
+import uuid
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+def request_json(url: str, method: str = "GET", body: Optional[Dict[str, Any]] = None) -> Any:
+    """Send a JSON request and decode the response."""
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read() or b"null")
+
+
+def resident_kib(pid: int) -> int:
+    """Read a process's resident set size in KiB from /proc."""
+    with open(f"/proc/{pid}/status", encoding="ascii") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+class Stream:
+    """One raw SSE connection that timestamps the versions it receives."""
+
+    def __init__(self) -> None:
+        self.arrivals: Dict[int, float] = {}
+        self.refused = False
+
+    async def run(self, host: str, port: int, ready: asyncio.Event, opened: List["Stream"]) -> None:
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"GET /events HTTP/1.1\r\nHost: {host}\r\nAccept: text/event-stream\r\n\r\n".encode())
+        await writer.drain()
+        status = await reader.readline()
+        if b" 200 " not in status:
+            self.refused = True
+            writer.close()
+            ready.set()
+            return
+        opened.append(self)
+        ready.set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                if line.startswith(b"data: "):
+                    item = json.loads(line[6:])
+                    self.arrivals.setdefault(item.get("version", -1), time.perf_counter())
+        finally:
+            writer.close()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Return a percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Open the streams, drive writes and print the results."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (max(soft, min(hard, args.subscribers + 1024)), hard))
+    base = args.url.rstrip("/")
+    target = urlsplit(base)
+
+    rss_before = resident_kib(args.server_pid) if args.server_pid else 0
+    opened: List[Stream] = []
+    streams = [Stream() for _ in range(args.subscribers)]
+    tasks = []
+    started = time.perf_counter()
+    for offset in range(0, len(streams), args.connect_batch):
+        batch = []
+        for stream in streams[offset:offset + args.connect_batch]:
+            ready = asyncio.Event()
+            tasks.append(asyncio.create_task(stream.run(target.hostname, target.port or 80, ready, opened)))
+            batch.append(ready.wait())
+        await asyncio.gather(*batch)
+    connect_seconds = time.perf_counter() - started
+    refused = sum(stream.refused for stream in streams)
+    print(f"streams: {len(opened)} open, {refused} refused in {connect_seconds:.1f}s")
+    if args.server_pid:
+        rss = resident_kib(args.server_pid)
+        per_stream = (rss - rss_before) / max(len(opened), 1)
+        print(f"server rss: {rss / 1024:.0f} MiB ({per_stream:.1f} KiB per stream)")
+
+    name = f"sse{uuid.uuid4().hex[:8]}"
+    await asyncio.to_thread(request_json, f"{base}/auth/register", "POST", {
+        "email": f"{name}@example.com", "username": name, "password": "benchmark-password",
+    })
+    token = (await asyncio.to_thread(request_json, f"{base}/auth/login", "POST", {
+        "username": name, "password": "benchmark-password",
+    }))["access_token"]
+    project = await asyncio.to_thread(request_json, f"{base}/projects/?token={token}", "POST", {
+        "title": name, "description": "Generated by bench_sse", "project_url": "https://example.com",
+    })
+
+    sent: Dict[int, float] = {}
+    for write in range(args.writes):
+        method = "PUT" if write % 2 == 0 else "DELETE"
+        sent[write + 2] = time.perf_counter()
+        await asyncio.to_thread(request_json, f"{base}/projects/{project['id']}/like?token={token}", method)
+        await asyncio.sleep(args.interval)
+    await asyncio.sleep(args.settle)
+
+    latencies = [
+        (stream.arrivals[version] - at) * 1000
+        for stream in opened
+        for version, at in sent.items()
+        if version in stream.arrivals
+    ]
+    expected = len(opened) * len(sent)
+    print(f"delivered: {len(latencies)}/{expected} ({len(latencies) / max(expected, 1):.1%})")
+    if latencies:
+        print(
+            f"latency ms: p50 {statistics.median(latencies):.1f}  p95 {percentile(latencies, 0.95):.1f}  "
+            f"p99 {percentile(latencies, 0.99):.1f}  max {max(latencies):.1f}"
+        )
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def main() -> None:
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--subscribers", type=int, default=10000)
+    parser.add_argument("--connect-batch", type=int, default=500)
+    parser.add_argument("--writes", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.25)
+    parser.add_argument("--settle", type=float, default=2.0)
+    parser.add_argument("--server-pid", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
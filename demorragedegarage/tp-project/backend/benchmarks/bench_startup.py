@@ -0,0 +1,79 @@
+"""
+Measure cold start of an application worker.
+
+Starts fresh interpreters that import the app and run its lifespan startup
+(schema check included), and reports the import time, the startup time and
+their sum. With --max-ms the script exits non-zero when the median cold start
+exceeds the budget, so it can guard startup latency in CI.
+
+Usage:
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_startup --runs 5 --max-ms 1500
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+
+async def startup():
+    async with main.app.router.lifespan_context(main.app):
+        return time.perf_counter()
+
+ready = asyncio.run(startup())
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "startup_ms": (ready - imported) * 1000,
+}))
+"""
+
+
+def measure_once() -> Dict[str, float]:
+    """
+    Cold-start one interpreter and time its phases.
+
+    Returns:
+        Import, startup and total milliseconds.
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], capture_output=True, text=True, check=True
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["ready_ms"] = timings["import_ms"] + timings["startup_ms"]
+    timings["process_ms"] = wall_ms
+    return timings
+
+
+def main() -> None:
+    """Run the benchmark and print median timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Fail if the median ready time exceeds this budget")
+    args = parser.parse_args()
+
+    runs: List[Dict[str, float]] = [measure_once() for _ in range(args.runs)]
+    medians = {
+        key: statistics.median(run[key] for run in runs)
+        for key in ("import_ms", "startup_ms", "ready_ms", "process_ms")
+    }
+    for key, value in medians.items():
+        print(f"{key:>11}: {value:8.1f} (median of {args.runs})")
+
+    if args.max_ms is not None and medians["ready_ms"] > args.max_ms:
+        print(f"ready time {medians['ready_ms']:.1f}ms exceeds budget {args.max_ms:.1f}ms")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
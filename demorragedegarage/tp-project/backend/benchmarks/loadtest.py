@@ -0,0 +1,440 @@
+"""
+Load-test every API endpoint and compare runs against a baseline.
+
+"run" drives each endpoint of auth.router and projects.router in turn with
+--concurrency closed-loop clients for --duration seconds (after --warmup),
+against a database seeded by benchmarks.seed. Project IDs are drawn with the
+seed's Zipf skew, so hot projects stay hot. Each endpoint's throughput,
+latency percentiles, unexpected statuses and SQL statements per request (read
+from the Server-Timing header) are written to a JSON report. With --serve the
+script starts and stops its own uvicorn server on the configured database,
+logging to --server-log. Write endpoints change the data set, so restore the
+seeded database (or seed again) before each run whose numbers are compared.
+The admin-only bulk endpoints are left to bench_bulk.
+
+"compare" exits non-zero when a report regresses a tracked metric of the
+baseline beyond its threshold: p50/p95/p99 latency, throughput, queries per
+request or error rate.
+
+Usage:
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.seed --size 10k
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.loadtest run --serve --output baseline.json
+    ... change the code ...
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.loadtest run --serve --output candidate.json
+    python -m benchmarks.loadtest compare baseline.json candidate.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import re
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.seed import Zipf
+
+QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+@dataclass
+class Context:
+    """Shared state the request builders draw from."""
+
+    manifest: Dict[str, Any]
+    tokens: List[str]
+    popularity: Zipf
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    counter: "itertools.count[int]" = field(default_factory=itertools.count)
+
+    def project_id(self, rng: random.Random) -> int:
+        """Draw a project ID, favouring popular projects."""
+        return self.manifest["projects"]["first_id"] + self.popularity.sample(rng)
+
+    def token(self, rng: random.Random) -> str:
+        """Draw a logged-in user's token."""
+        return rng.choice(self.tokens)
+
+    def username(self, rng: random.Random) -> str:
+        """Draw a seeded username."""
+        users = self.manifest["users"]
+        return f"{users['username_prefix']}{users['first_id'] + rng.randrange(users['count'])}"
+
+    def unique(self) -> str:
+        """Return a name not used before in this run."""
+        return f"lt{self.run_id}x{next(self.counter)}"
+
+
+@dataclass
+class Endpoint:
+    """One endpoint under test and how to build its requests."""
+
+    name: str
+    build: Callable[[Context, random.Random], Request]
+    expected: Tuple[int, ...] = (200,)
+
+
+def project_body(name: str) -> Dict[str, Any]:
+    """Build a project creation payload."""
+    return {"title": name, "description": "Created by benchmarks.loadtest", "project_url": "https://example.com"}
+
+
+ENDPOINTS: List[Endpoint] = [
+    Endpoint("GET /projects/", lambda c, r: ("GET", "/projects/", None)),
+    Endpoint(
+        "GET /projects/?sort=most_liked",
+        lambda c, r: ("GET", f"/projects/?sort=most_liked&token={c.token(r)}", None),
+    ),
+    Endpoint("GET /projects/my", lambda c, r: ("GET", f"/projects/my?token={c.token(r)}", None)),
+    Endpoint("GET /projects/stream", lambda c, r: ("GET", "/projects/stream?limit=1000", None)),
+    Endpoint("GET /projects/trending", lambda c, r: ("GET", "/projects/trending", None)),
+    Endpoint(
+        "GET /projects/search",
+        lambda c, r: ("GET", f"/projects/search?q={r.choice(c.manifest['search_words'])}", None),
+    ),
+    Endpoint(
+        "POST /projects/liked",
+        lambda c, r: ("POST", f"/projects/liked?token={c.token(r)}", {
+            "project_ids": [c.project_id(r) for _ in range(20)],
+        }),
+    ),
+    Endpoint("GET /projects/{project_id}", lambda c, r: ("GET", f"/projects/{c.project_id(r)}", None)),
+    Endpoint(
+        "GET /projects/{project_id}/liked",
+        lambda c, r: ("GET", f"/projects/{c.project_id(r)}/liked?token={c.token(r)}", None),
+    ),
+    Endpoint(
+        "GET /projects/{project_id}/reviews",
+        lambda c, r: ("GET", f"/projects/{c.project_id(r)}/reviews", None),
+    ),
+    Endpoint("GET /projects/analytics/top", lambda c, r: ("GET", "/projects/analytics/top", None)),
+    Endpoint("GET /auth/me", lambda c, r: ("GET", f"/auth/me?token={c.token(r)}", None)),
+    Endpoint(
+        "POST /auth/login",
+        lambda c, r: ("POST", "/auth/login", {"username": c.username(r), "password": c.manifest["password"]}),
+    ),
+    Endpoint(
+        "POST /auth/register",
+        lambda c, r: ("POST", "/auth/register", {
+            "email": f"{c.unique()}@example.com", "username": c.unique(), "password": c.manifest["password"],
+        }),
+    ),
+    Endpoint(
+        "POST /projects/",
+        lambda c, r: ("POST", f"/projects/?token={c.token(r)}", project_body(c.unique())),
+    ),
+    Endpoint(
+        "PUT /projects/{project_id}/like",
+        lambda c, r: ("PUT", f"/projects/{c.project_id(r)}/like?token={c.token(r)}", None),
+        expected=(200, 202),
+    ),
+    Endpoint(
+        "DELETE /projects/{project_id}/like",
+        lambda c, r: ("DELETE", f"/projects/{c.project_id(r)}/like?token={c.token(r)}", None),
+        expected=(200, 202),
+    ),
+    Endpoint(
+        "POST /projects/{project_id}/like",
+        lambda c, r: ("POST", f"/projects/{c.project_id(r)}/like?token={c.token(r)}", None),
+        expected=(200, 400),
+    ),
+    Endpoint(
+        "POST /projects/{project_id}/review",
+        lambda c, r: ("POST", f"/projects/{c.project_id(r)}/review?token={c.token(r)}", {
+            "content": "Load test review", "rating": r.randint(1, 5),
+        }),
+        expected=(200, 400),
+    ),
+]
+
+TRACKED: Tuple[str, ...] = ("p50_ms", "p95_ms", "p99_ms", "throughput_rps", "queries_per_request", "error_rate")
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of a sorted, non-empty list."""
+    return ordered[max(math.ceil(len(ordered) * fraction) - 1, 0)]
+
+
+@dataclass
+class Samples:
+    """Raw results of one endpoint."""
+
+    latencies: List[float] = field(default_factory=list)
+    queries: List[int] = field(default_factory=list)
+    statuses: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+
+    def summarize(self, seconds: float) -> Dict[str, Any]:
+        """Reduce the samples to report metrics."""
+        ordered = sorted(self.latencies)
+        count = len(ordered)
+        summary: Dict[str, Any] = {
+            "requests": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "throughput_rps": round(count / seconds, 2),
+            "statuses": self.statuses,
+            "queries_per_request": round(sum(self.queries) / len(self.queries), 2) if self.queries else None,
+        }
+        if ordered:
+            summary.update({
+                "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+                "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+                "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            })
+        return summary
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    endpoint: Endpoint,
+    context: Context,
+    concurrency: int,
+    seconds: float,
+    seed: int,
+) -> Samples:
+    """Run closed-loop clients against one endpoint for a fixed time."""
+    samples = Samples()
+    deadline = time.perf_counter() + seconds
+
+    async def worker(rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            method, url, body = endpoint.build(context, rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body)
+            except httpx.HTTPError:
+                samples.errors += 1
+                continue
+            samples.latencies.append(time.perf_counter() - started)
+            status = str(response.status_code)
+            samples.statuses[status] = samples.statuses.get(status, 0) + 1
+            if response.status_code not in endpoint.expected:
+                samples.errors += 1
+            match = QUERIES.search(response.headers.get("server-timing", ""))
+            if match:
+                samples.queries.append(int(match.group(1)))
+
+    await asyncio.gather(*(worker(random.Random(f"{seed}:{i}")) for i in range(concurrency)))
+    return samples
+
+
+async def log_in(client: httpx.AsyncClient, manifest: Dict[str, Any], count: int) -> List[str]:
+    """Log in the first seeded users and return their tokens."""
+    users = manifest["users"]
+    tokens = []
+    for user_id in range(users["first_id"], users["first_id"] + min(count, users["count"])):
+        response = await client.post("/auth/login", json={
+            "username": f"{users['username_prefix']}{user_id}", "password": manifest["password"],
+        })
+        response.raise_for_status()
+        tokens.append(response.json()["access_token"])
+    return tokens
+
+
+async def run_async(args: argparse.Namespace, url: str) -> Dict[str, Any]:
+    """Drive every selected endpoint and build the report."""
+    with open(args.manifest, encoding="utf-8") as source:
+        manifest = json.load(source)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=args.timeout) as client:
+        context = Context(
+            manifest=manifest,
+            tokens=await log_in(client, manifest, args.users),
+            popularity=Zipf(manifest["projects"]["count"], manifest["skew"]),
+        )
+        endpoints = [
+            endpoint for endpoint in ENDPOINTS
+            if not args.endpoints or any(part in endpoint.name for part in args.endpoints)
+        ]
+        results: Dict[str, Any] = {}
+        for endpoint in endpoints:
+            if args.warmup > 0:
+                await drive(client, endpoint, context, args.concurrency, args.warmup, args.seed)
+            samples = await drive(client, endpoint, context, args.concurrency, args.duration, args.seed)
+            results[endpoint.name] = summary = samples.summarize(args.duration)
+            print(
+                f"{endpoint.name:<40} {summary['throughput_rps']:>9.1f} rps  "
+                f"p50 {summary.get('p50_ms', 0):>8.2f}  p95 {summary.get('p95_ms', 0):>8.2f}  "
+                f"p99 {summary.get('p99_ms', 0):>8.2f} ms  queries {summary['queries_per_request']}  "
+                f"errors {summary['errors']}"
+            )
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "url": url,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "seed": args.seed,
+            "dataset": {key: manifest[key] for key in ("database", "seed", "skew", "projects", "users", "likes", "reviews")},
+            "commit": git_commit(),
+        },
+        "endpoints": results,
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Return the checked-out commit, if this is a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def start_server(port: int, workers: int, log: IO[str]) -> subprocess.Popen:
+    """Start uvicorn on the configured database and wait until it is ready."""
+    server = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+        "--workers", str(workers), "--log-level", "warning",
+    ], stdout=log, stderr=subprocess.STDOUT)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health/ready").status_code == 200:
+                return server
+        except httpx.HTTPError:
+            pass
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not become ready within 30s")
+
+
+def run(args: argparse.Namespace) -> int:
+    """Run the load test and write the report."""
+    if not args.serve:
+        report = asyncio.run(run_async(args, args.url))
+    else:
+        with open(args.server_log, "w", encoding="utf-8") as log:
+            server = start_server(args.port, args.workers, log)
+            try:
+                report = asyncio.run(run_async(args, f"http://127.0.0.1:{args.port}"))
+            finally:
+                server.terminate()
+                server.wait()
+    with open(args.output, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2)
+    print(f"report written to {args.output}")
+    return 0
+
+
+def regressions(
+    baseline: Dict[str, Any],
+    candidate: Dict[str, Any],
+    latency: float,
+    throughput: float,
+    queries: float,
+    errors: float,
+    min_latency_ms: float,
+) -> List[str]:
+    """
+    List tracked metrics of candidate that regressed beyond their thresholds.
+
+    Args:
+        baseline: Reference report.
+        candidate: Report under review.
+        latency: Allowed relative increase of p50/p95/p99.
+        throughput: Allowed relative decrease of throughput.
+        queries: Allowed absolute increase of queries per request.
+        errors: Allowed absolute increase of the error rate.
+        min_latency_ms: Latency increases below this are treated as noise.
+
+    Returns:
+        One line per regression.
+    """
+    found = []
+    for name, before in baseline["endpoints"].items():
+        after = candidate["endpoints"].get(name)
+        if after is None:
+            continue
+        for metric in TRACKED:
+            old, new = before.get(metric), after.get(metric)
+            if old is None or new is None:
+                continue
+            if metric.endswith("_ms"):
+                failed = new - old > max(old * latency, min_latency_ms)
+            elif metric == "throughput_rps":
+                failed = new < old * (1 - throughput)
+            elif metric == "queries_per_request":
+                failed = new - old > queries
+            else:
+                failed = new - old > errors
+            if failed:
+                change = f"{(new - old) / old:+.1%}" if old else "new"
+                found.append(f"{name}: {metric} {old} -> {new} ({change})")
+    return found
+
+
+def compare(args: argparse.Namespace) -> int:
+    """Compare two reports and fail on regressions."""
+    with open(args.baseline, encoding="utf-8") as source:
+        baseline = json.load(source)
+    with open(args.candidate, encoding="utf-8") as source:
+        candidate = json.load(source)
+    for name in sorted(set(baseline["endpoints"]) ^ set(candidate["endpoints"])):
+        print(f"warning: {name} is only in one report")
+    found = regressions(
+        baseline, candidate, args.latency_threshold, args.throughput_threshold,
+        args.query_threshold, args.error_threshold, args.min_latency_delta_ms,
+    )
+    for line in found:
+        print(f"REGRESSION {line}")
+    compared = len(set(baseline["endpoints"]) & set(candidate["endpoints"]))
+    print(f"{len(found)} regressions across {compared} endpoints")
+    return 1 if found else 0
+
+
+def main() -> None:
+    """Parse arguments and run a subcommand."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="load-test the API and write a report")
+    run_parser.add_argument("--url", default="http://127.0.0.1:8000")
+    run_parser.add_argument("--serve", action="store_true", help="start uvicorn on DATABASE_URL")
+    run_parser.add_argument("--port", type=int, default=8765)
+    run_parser.add_argument("--workers", type=int, default=1)
+    run_parser.add_argument("--server-log", default="loadtest-server.log")
+    run_parser.add_argument("--manifest", default="seed.json")
+    run_parser.add_argument("--output", default="loadtest.json")
+    run_parser.add_argument("--concurrency", type=int, default=32)
+    run_parser.add_argument("--duration", type=float, default=10.0)
+    run_parser.add_argument("--warmup", type=float, default=2.0)
+    run_parser.add_argument("--users", type=int, default=50, help="seeded users to log in")
+    run_parser.add_argument("--timeout", type=float, default=30.0)
+    run_parser.add_argument("--seed", type=int, default=1)
+    run_parser.add_argument("--endpoints", nargs="*", help="only endpoints whose name contains one of these")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="fail if a report regresses against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    compare_parser.add_argument("--latency-threshold", type=float, default=0.15)
+    compare_parser.add_argument("--throughput-threshold", type=float, default=0.15)
+    compare_parser.add_argument("--query-threshold", type=float, default=0.5)
+    compare_parser.add_argument("--error-threshold", type=float, default=0.01)
+    compare_parser.add_argument("--min-latency-delta-ms", type=float, default=1.0)
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""
+Read-through cache backends.
+
+Provides one small key/value interface with an in-process LRU+TTL
+implementation, an optional Redis implementation for sharing entries between
+worker processes, and a no-op implementation for disabling caching.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from config import settings
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+
+class CacheStats:
+    """
+    Thread-safe hit/miss counters.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no live entry.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool) -> None:
+        """Count one lookup."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+class CacheBackend:
+    """
+    Interface shared by all cache backends.
+
+    Values must be picklable. Missing and expired keys read as None, so None
+    itself cannot be cached.
+    """
+
+    name = "base"
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value, or None if absent or expired.
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl_seconds: Entry lifetime (defaults to the backend's TTL).
+        """
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        """
+        Remove keys.
+
+        Args:
+            *keys: Cache keys.
+        """
+        raise NotImplementedError
+
+    def incr(self, key: str) -> int:
+        """
+        Atomically increment an integer counter that never expires.
+
+        Args:
+            key: Counter key.
+
+        Returns:
+            The new counter value.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop all entries owned by this cache."""
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describe the backend and its hit/miss counters.
+
+        Returns:
+            Backend name, hits, misses and hit ratio.
+        """
+        total = self.stats.hits + self.stats.misses
+        return {
+            "backend": self.name,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_ratio": round(self.stats.hits / total, 4) if total else None,
+        }
+
+
+class NullCache(CacheBackend):
+    """Backend that stores nothing; every lookup is a miss."""
+
+    name = "none"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        self.stats.record(False)
+        return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        return None
+
+    def delete(self, *keys: str) -> None:
+        return None
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+class MemoryCache(CacheBackend):
+    """Thread-safe in-process LRU cache with per-entry expiry."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.stats.record(False)
+                return None
+            self._entries.move_to_end(key)
+            self.stats.record(True)
+            return entry[0]
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+            value = (entry[0] if entry is not None else 0) + 1
+            self._entries[key] = (value, float("inf"))
+            self._entries.move_to_end(key)
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def describe(self) -> Dict[str, Any]:
+        description = super().describe()
+        description["entries"] = len(self._entries)
+        return description
+
+
+class RedisCache(CacheBackend):
+    """
+    Redis-backed cache shared by all worker processes.
+
+    Requires the optional redis package. Keys are namespaced with a prefix so
+    clear() only removes this application's entries.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, ttl_seconds: float, prefix: str = "luxury:") -> None:
+        if redis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package")
+        super().__init__()
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(self.prefix + key)
+        self.stats.record(raw is not None)
+        return None if raw is None else pickle.loads(raw)
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+        self._client.set(self.prefix + key, pickle.dumps(value), px=int(ttl * 1000))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._client.delete(*(self.prefix + key for key in keys))
+
+    def incr(self, key: str) -> int:
+        return int(self._client.incr(self.prefix + key))
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+def create_cache() -> CacheBackend:
+    """
+    Create the backend selected by CACHE_BACKEND.
+
+    Returns:
+        Configured cache backend.
+
+    Raises:
+        ValueError: If CACHE_BACKEND names an unknown backend.
+    """
+    backend = settings.CACHE_BACKEND.lower()
+    if backend == "memory":
+        return MemoryCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+    if backend == "redis":
+        return RedisCache(settings.REDIS_URL, settings.CACHE_TTL_SECONDS)
+    if backend == "none":
+        return NullCache()
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND}")
@@ -5,7 +5,6 @@ This module handles all environment variable loading and application settings.
 """
 
 import os
-from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,10 +20,92 @@ class Settings:
         DB_NAME: Name of the database.
         DB_USER: Database username.
         DB_PASSWORD: Database password.
+        DB_POOL_SIZE: Persistent connections kept per engine.
+        DB_MAX_OVERFLOW: Extra connections allowed above DB_POOL_SIZE.
+        DB_POOL_TIMEOUT: Seconds to wait for a free connection before failing.
+        DB_POOL_RECYCLE: Seconds after which pooled connections are replaced.
+        DB_POOL_PRE_PING: Test connections for liveness on checkout.
+        DB_STATEMENT_TIMEOUT_MS: Server-side statement timeout (0 disables it).
+        DB_PGBOUNCER: PgBouncer-compatible mode (no client-side pooling and no
+            server-side prepared statements).
+        DB_SCHEMA_CHECK: Startup schema revision check: "strict" refuses to
+            start on a mismatch, "warn" logs it, "off" skips it.
+        THREADPOOL_SIZE: Worker threads available to sync endpoints. A sync
+            endpoint keeps its connection until its response is serialized,
+            which needs a thread again, so with more requests in flight than
+            DB_POOL_SIZE + DB_MAX_OVERFLOW they can stall for
+            DB_POOL_TIMEOUT whatever this is set to. The project listing and
+            detail reads are async and use neither these threads nor the
+            sync pool.
         SECRET_KEY: JWT secret key for token signing.
         ALGORITHM: JWT algorithm (default: HS256).
         ACCESS_TOKEN_EXPIRE_MINUTES: Token expiration time in minutes.
+        TOKEN_CACHE_SIZE: Verified tokens kept in the in-process cache.
+        TOKEN_CACHE_TTL_SECONDS: Upper bound on how long a token resolution
+            is reused (also bounded by the token's own expiry).
+        ARGON2_TIME_COST: Argon2 iterations.
+        ARGON2_MEMORY_COST: Argon2 memory usage in KiB.
+        ARGON2_PARALLELISM: Argon2 lanes per hash.
+        HASH_WORKERS: Threads dedicated to password hashing.
+        HASH_QUEUE_SIZE: Hash requests allowed to wait for a worker before
+            new ones are rejected. Waiting requests are awaited on the
+            event loop and hold no request thread.
         DEBUG: Debug mode flag.
+        HTTP_CACHE_MAX_AGE: Seconds browsers may reuse public read responses.
+        HTTP_CACHE_S_MAXAGE: Seconds shared caches (CDN, reverse proxy) may
+            reuse public read responses.
+        CACHE_BACKEND: Read-through cache backend: "memory" (per process),
+            "redis" (shared, needs the redis package) or "none".
+        CACHE_TTL_SECONDS: Lifetime of cached project reads; also bounds
+            staleness across processes when the memory backend is used.
+        CACHE_MAX_ENTRIES: Entries kept by the memory backend.
+        LISTING_CACHE_TTL_SECONDS: Lifetime of cached listing page orders;
+            rows are read from the project entries, so only the order of a
+            page can lag behind likes and reviews by this long.
+        REDIS_URL: Redis connection URL for the redis backend.
+        TRENDING_HALF_LIFE_HOURS: Time after which a like or review counts
+            half as much towards a project's trending score.
+        BULK_BATCH_SIZE: Rows written and committed per bulk import batch.
+        ADMIN_API_KEY: Key expected in the X-Admin-Key header of the bulk
+            endpoints (empty disables them).
+        LIKE_WRITE_BEHIND: Accept idempotent like/unlike requests into the
+            write-behind buffer instead of writing them synchronously. The
+            buffer is per process, so this requires a single uvicorn worker
+            and a single instance; startup fails with several workers.
+        LIKE_FLUSH_INTERVAL_MS: Period between write-behind buffer flushes.
+        LIKE_FLUSH_BATCH_SIZE: Buffered changes that trigger an early flush
+            and the maximum written per statement.
+        LIKE_JOURNAL_DIR: Directory of the buffer's crash-recovery journal;
+            should be on persistent local storage.
+        LIKE_JOURNAL_FSYNC: fsync each journal entry before acknowledging
+            the request.
+        REALTIME_FANOUT: How counter updates reach the event streams of every
+            worker: "postgres" (LISTEN/NOTIFY), "local" (this process only)
+            or "auto" (postgres on PostgreSQL, local otherwise).
+        REALTIME_QUEUE_LIMIT: Projects with undelivered updates a stream may
+            accumulate before it is told to resync instead.
+        REALTIME_HEARTBEAT_SECONDS: Idle time after which a stream sends a
+            keep-alive comment.
+        REALTIME_MAX_SUBSCRIBERS: Open event streams allowed per worker.
+        SERVER_TIMING: Report each request's total and DB time and statement
+            count in a Server-Timing response header.
+        SLOW_QUERY_MS: Statements at least this slow are logged with their
+            route (0 disables the log).
+        QUERY_BUDGET: Requests issuing more SQL statements than this are
+            logged as over budget (0 disables the check).
+        READY_CACHE_MS: How long a readiness result is reused.
+        READY_DB_TIMEOUT_MS: Time the readiness SELECT 1 may take.
+        READY_MAX_POOL_SATURATION: Share of pool connections checked out at
+            which the worker reports not ready.
+        READY_MAX_LOOP_LAG_MS: Event loop scheduling delay at which the
+            worker reports not ready.
+        READY_MAX_THREADPOOL_LAG_MS: Threadpool start delay at which the
+            worker reports not ready.
+        ANALYTICS_SNAPSHOT_MAX_AGE_SECONDS: Age after which a request starts a
+            background refresh of the analytics snapshot; the request is
+            still served the existing snapshot.
+        ANALYTICS_REFRESH_INTERVAL_SECONDS: Background snapshot refresh period
+            (0 disables the periodic task).
     """
     
     DB_HOST: str = os.getenv("PGHOST", os.getenv("DB_HOST", "localhost"))
@@ -32,13 +113,68 @@ class Settings:
     DB_NAME: str = os.getenv("PGDATABASE", os.getenv("DB_NAME", "startup_db"))
     DB_USER: str = os.getenv("PGUSER", os.getenv("DB_USER", "postgres"))
     DB_PASSWORD: str = os.getenv("PGPASSWORD", os.getenv("DB_PASSWORD", ""))
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+    DB_PGBOUNCER: bool = os.getenv("DB_PGBOUNCER", "False").lower() == "true"
+    DB_SCHEMA_CHECK: str = os.getenv("DB_SCHEMA_CHECK", "strict").lower()
+    THREADPOOL_SIZE: int = int(os.getenv("THREADPOOL_SIZE", "40"))
     
     SECRET_KEY: str = os.getenv("SECRET_KEY", os.getenv("SESSION_SECRET", "fallback-secret-key"))
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    TOKEN_CACHE_SIZE: int = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+    TOKEN_CACHE_TTL_SECONDS: int = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "60"))
+    
+    ARGON2_TIME_COST: int = int(os.getenv("ARGON2_TIME_COST", "3"))
+    ARGON2_MEMORY_COST: int = int(os.getenv("ARGON2_MEMORY_COST", "65536"))
+    ARGON2_PARALLELISM: int = int(os.getenv("ARGON2_PARALLELISM", "4"))
+    HASH_WORKERS: int = int(os.getenv("HASH_WORKERS", str(os.cpu_count() or 1)))
+    HASH_QUEUE_SIZE: int = int(os.getenv("HASH_QUEUE_SIZE", "32"))
     
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     
+    HTTP_CACHE_MAX_AGE: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "0"))
+    HTTP_CACHE_S_MAXAGE: int = int(os.getenv("HTTP_CACHE_S_MAXAGE", "5"))
+    
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_TTL_SECONDS: float = float(os.getenv("CACHE_TTL_SECONDS", "10"))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+    LISTING_CACHE_TTL_SECONDS: float = float(os.getenv("LISTING_CACHE_TTL_SECONDS", "2"))
+    REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    
+    TRENDING_HALF_LIFE_HOURS: float = float(os.getenv("TRENDING_HALF_LIFE_HOURS", "24"))
+    
+    BULK_BATCH_SIZE: int = int(os.getenv("BULK_BATCH_SIZE", "5000"))
+    ADMIN_API_KEY: str = os.getenv("ADMIN_API_KEY", "")
+    
+    LIKE_WRITE_BEHIND: bool = os.getenv("LIKE_WRITE_BEHIND", "False").lower() == "true"
+    LIKE_FLUSH_INTERVAL_MS: int = int(os.getenv("LIKE_FLUSH_INTERVAL_MS", "50"))
+    LIKE_FLUSH_BATCH_SIZE: int = int(os.getenv("LIKE_FLUSH_BATCH_SIZE", "1000"))
+    LIKE_JOURNAL_DIR: str = os.getenv("LIKE_JOURNAL_DIR", "like-journal")
+    LIKE_JOURNAL_FSYNC: bool = os.getenv("LIKE_JOURNAL_FSYNC", "True").lower() == "true"
+    
+    REALTIME_FANOUT: str = os.getenv("REALTIME_FANOUT", "auto").lower()
+    REALTIME_QUEUE_LIMIT: int = int(os.getenv("REALTIME_QUEUE_LIMIT", "256"))
+    REALTIME_HEARTBEAT_SECONDS: float = float(os.getenv("REALTIME_HEARTBEAT_SECONDS", "15"))
+    REALTIME_MAX_SUBSCRIBERS: int = int(os.getenv("REALTIME_MAX_SUBSCRIBERS", "20000"))
+    
+    SERVER_TIMING: bool = os.getenv("SERVER_TIMING", "True").lower() == "true"
+    SLOW_QUERY_MS: float = float(os.getenv("SLOW_QUERY_MS", "100"))
+    QUERY_BUDGET: int = int(os.getenv("QUERY_BUDGET", "20"))
+    
+    READY_CACHE_MS: int = int(os.getenv("READY_CACHE_MS", "250"))
+    READY_DB_TIMEOUT_MS: int = int(os.getenv("READY_DB_TIMEOUT_MS", "500"))
+    READY_MAX_POOL_SATURATION: float = float(os.getenv("READY_MAX_POOL_SATURATION", "0.9"))
+    READY_MAX_LOOP_LAG_MS: int = int(os.getenv("READY_MAX_LOOP_LAG_MS", "200"))
+    READY_MAX_THREADPOOL_LAG_MS: int = int(os.getenv("READY_MAX_THREADPOOL_LAG_MS", "500"))
+    
+    ANALYTICS_SNAPSHOT_MAX_AGE_SECONDS: int = int(os.getenv("ANALYTICS_SNAPSHOT_MAX_AGE_SECONDS", "60"))
+    ANALYTICS_REFRESH_INTERVAL_SECONDS: int = int(os.getenv("ANALYTICS_REFRESH_INTERVAL_SECONDS", "30"))
+    
     @property
     def DATABASE_URL(self) -> str:
         """Construct and return the PostgreSQL connection URL."""
@@ -1,22 +1,128 @@
 """
 Database connection module.
 
-Provides SQLAlchemy engine, session factory, and base class for ORM models.
+Provides SQLAlchemy engines, session factories, and base class for ORM models.
+The sync engine serves the threadpool endpoints; the async engine serves the
+hot read endpoints (project listing and detail), which run on the event loop
+and so are not limited by THREADPOOL_SIZE. Both are created on first use, so
+importing the application neither loads database drivers nor connects
+anywhere.
 """
 
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session, declarative_base
+from sqlalchemy.pool import NullPool
 from config import settings
+from database.pool import InstrumentedQueuePool, instrument_engine
+from monitoring.timing import instrument_queries
 
 SQLALCHEMY_DATABASE_URL: str = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ASYNC_DRIVERS: Dict[str, str] = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def engine_options(url: str) -> Dict[str, Any]:
+    """
+    Build pool and connection keyword arguments for an engine.
+    
+    Args:
+        url: Database URL the engine connects to.
+    
+    Returns:
+        Keyword arguments for create_engine / create_async_engine.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        return {}
+    
+    is_async = parsed.get_driver_name() == "asyncpg"
+    options: Dict[str, Any] = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    connect_args: Dict[str, Any] = {}
+    
+    if settings.DB_PGBOUNCER:
+        options["poolclass"] = NullPool
+        if is_async:
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+    else:
+        options.update({
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        })
+        if not is_async:
+            options["poolclass"] = InstrumentedQueuePool
+    
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        timeout = str(settings.DB_STATEMENT_TIMEOUT_MS)
+        if is_async:
+            connect_args["server_settings"] = {"statement_timeout": timeout}
+        else:
+            connect_args["options"] = f"-c statement_timeout={timeout}"
+    
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def async_database_url(url: str) -> str:
+    """
+    Rewrite a database URL to use the backend's asyncio driver.
+    
+    Args:
+        url: Sync database URL.
+    
+    Returns:
+        URL with the asyncio driver selected.
+    
+    Raises:
+        ValueError: If the backend has no supported asyncio driver.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend}")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+_engine: Optional[Engine] = None
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+_async_engine: Optional[AsyncEngine] = None
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
 
+def get_engine() -> Engine:
+    """
+    Return the sync engine, creating it on first use.
+    
+    Also binds SessionLocal, so sessions may be opened once this was called.
+    
+    Returns:
+        Engine bound to the configured database.
+    """
+    global _engine
+    if _engine is None:
+        _engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
+        instrument_engine(_engine)
+        instrument_queries(_engine)
+        SessionLocal.configure(bind=_engine)
+    return _engine
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency function that provides a database session.
@@ -27,8 +133,48 @@ def get_db() -> Generator[Session, None, None]:
     Note:
         The session is automatically closed after the request completes.
     """
+    get_engine()
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the async engine, creating it on first use.
+    
+    Returns:
+        AsyncEngine bound to the configured database.
+    """
+    global _async_engine
+    if _async_engine is None:
+        url = async_database_url(SQLALCHEMY_DATABASE_URL)
+        _async_engine = create_async_engine(url, **engine_options(url))
+        instrument_queries(_async_engine.sync_engine)
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function that provides an async database session.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session.
+    
+    Note:
+        The session is automatically closed after the request completes.
+    """
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's pooled connections, if it was ever created."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
@@ -0,0 +1,152 @@
+"""
+Schema migration runner.
+
+Applies the Alembic revisions in migrations/ from application code and
+checks at startup that the database is at the expected revision. Databases
+created before migrations existed (tables present, no alembic_version table)
+are stamped at the baseline revision first, so only the newer revisions run.
+
+Alembic is imported inside the functions: importing it costs a few hundred
+milliseconds, which workers started with DB_SCHEMA_CHECK=off never pay.
+"""
+
+import logging
+import os
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+if TYPE_CHECKING:
+    from alembic.config import Config
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_REVISION: str = "0001_baseline"
+MIGRATION_LOCK_ID: int = 72_410_001
+
+
+def alembic_config(connection: Optional[Connection] = None) -> "Config":
+    """
+    Build the Alembic configuration.
+
+    Args:
+        connection: Connection to migrate; defaults to the configured database.
+
+    Returns:
+        Alembic configuration pointing at migrations/.
+    """
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def is_legacy_schema(connection: Connection) -> bool:
+    """
+    Check whether tables were created without migrations.
+
+    Args:
+        connection: Database connection.
+
+    Returns:
+        True if the users table exists but alembic_version does not.
+    """
+    tables = set(inspect(connection).get_table_names())
+    return "users" in tables and "alembic_version" not in tables
+
+
+def upgrade_database(engine: Engine, revision: str = "head") -> None:
+    """
+    Migrate a database to the given revision.
+
+    On PostgreSQL a session-level advisory lock serialises concurrent callers,
+    e.g. several workers starting at once.
+
+    Args:
+        engine: Engine of the database to migrate.
+        revision: Target revision.
+    """
+    from alembic import command
+
+    with engine.connect() as connection:
+        locked = connection.dialect.name == "postgresql"
+        if locked:
+            connection.execute(text("SELECT pg_advisory_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+        legacy = is_legacy_schema(connection)
+        connection.commit()
+
+        config = alembic_config(connection)
+        try:
+            if legacy:
+                command.stamp(config, BASELINE_REVISION)
+            command.upgrade(config, revision)
+        finally:
+            if locked:
+                connection.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": MIGRATION_LOCK_ID})
+                connection.commit()
+
+
+class SchemaVersionError(RuntimeError):
+    """Raised when the database is not at the revision the code expects."""
+
+
+def head_revision() -> Optional[str]:
+    """
+    Return the newest revision shipped with the code.
+
+    Returns:
+        Head revision ID.
+    """
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def schema_problem(engine: Engine) -> Optional[str]:
+    """
+    Compare the database revision with the code's head revision.
+
+    Args:
+        engine: Engine of the database to inspect.
+
+    Returns:
+        Description of the mismatch, or None if the schema is current.
+    """
+    from alembic.runtime.migration import MigrationContext
+
+    expected = head_revision()
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+    if current == expected:
+        return None
+    return (
+        f"database schema is at revision {current or 'none'}, expected {expected}; "
+        "run `python manage.py migrate`"
+    )
+
+
+def verify_schema(engine: Engine, mode: str) -> None:
+    """
+    Check the schema revision according to DB_SCHEMA_CHECK.
+
+    Args:
+        engine: Engine of the database to inspect.
+        mode: "strict" raises on mismatch, "warn" logs it, "off" skips the check.
+
+    Raises:
+        SchemaVersionError: In strict mode, if the schema is not current.
+    """
+    if mode == "off":
+        return
+    problem = schema_problem(engine)
+    if problem is None:
+        return
+    if mode == "strict":
+        raise SchemaVersionError(problem)
+    logger.warning("Schema check failed: %s", problem)
@@ -0,0 +1,125 @@
+"""
+Connection pool instrumentation.
+
+Tracks how many connections are checked out and how long requests wait for
+one, so worker and pool sizes can be tuned from observed numbers. The same
+numbers are exported as Prometheus metrics (see monitoring.metrics).
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+from monitoring import metrics
+
+
+class PoolMetrics:
+    """
+    Thread-safe counters describing pool usage.
+
+    Attributes:
+        checked_out: Connections currently handed out.
+        checkouts: Number of checkouts that went through the pool queue.
+        wait_seconds_total: Cumulative time spent waiting for a connection.
+        wait_seconds_max: Longest single wait observed.
+        timeouts: Checkouts that gave up after DB_POOL_TIMEOUT.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+
+    def record_wait(self, seconds: float) -> None:
+        """Record the time one checkout spent waiting for a connection."""
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            if seconds > self.wait_seconds_max:
+                self.wait_seconds_max = seconds
+        metrics.DB_POOL_WAIT.observe(seconds)
+
+    def record_timeout(self) -> None:
+        """Record a checkout that timed out."""
+        with self._lock:
+            self.timeouts += 1
+        metrics.DB_POOL_TIMEOUTS.inc()
+
+    def record_checkout(self, delta: int) -> None:
+        """Adjust the number of checked-out connections."""
+        with self._lock:
+            self.checked_out += delta
+        metrics.DB_POOL_CHECKED_OUT.inc(delta)
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records checkout wait times in pool_metrics."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Track checked-out connections of an engine in pool_metrics.
+
+    Args:
+        engine: Engine whose pool events are observed.
+    """
+    if isinstance(engine.pool, QueuePool):
+        metrics.DB_POOL_SIZE.set(engine.pool.size())
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        pool_metrics.record_checkout(1)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        pool_metrics.record_checkout(-1)
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """
+    Describe the current state of an engine's connection pool.
+
+    Args:
+        engine: Engine to inspect.
+
+    Returns:
+        Pool class, capacity and usage counters.
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {
+        "class": type(pool).__name__,
+        "checked_out": pool_metrics.checked_out,
+        "checkouts": pool_metrics.checkouts,
+        "wait_seconds_total": round(pool_metrics.wait_seconds_total, 6),
+        "wait_seconds_max": round(pool_metrics.wait_seconds_max, 6),
+        "timeouts": pool_metrics.timeouts,
+    }
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        })
+    return stats
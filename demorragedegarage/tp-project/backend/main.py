@@ -4,21 +4,79 @@ Main FastAPI application module.
 Entry point for the Startup Platform API.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
-from database.connection import engine, Base
+from database.connection import SessionLocal, dispose_async_engine, get_engine
+from database.migrations import verify_schema
+from database.pool import pool_stats
 from auth.router import router as auth_router
 from projects.router import router as projects_router
+from realtime.router import router as realtime_router
+from realtime.broker import broker
+from monitoring import metrics
+from monitoring.metrics import MetricsMiddleware
+from monitoring.router import router as monitoring_router
+from monitoring.timing import RequestTimingMiddleware
+from projects import analytics, read_cache
+from projects.like_buffer import like_buffer
 from config import settings
 
-Base.metadata.create_all(bind=engine)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Start and stop background tasks around the application lifetime.
+    
+    Migrations are not applied here (see `python manage.py migrate`); startup
+    only checks that the database is at the expected schema revision. With
+    LIKE_WRITE_BEHIND, the like buffer replays orphaned journals on startup
+    and flushes what is pending on shutdown. The realtime broker delivers
+    counter updates to event streams while the app runs.
+    
+    Args:
+        app: FastAPI application.
+    
+    Raises:
+        SchemaVersionError: If DB_SCHEMA_CHECK is strict and the schema is
+            not current.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    await run_in_threadpool(verify_schema, get_engine(), settings.DB_SCHEMA_CHECK)
+    
+    refresher: Optional[asyncio.Task] = None
+    if settings.ANALYTICS_REFRESH_INTERVAL_SECONDS > 0:
+        refresher = asyncio.create_task(
+            analytics.run_snapshot_refresher(settings.ANALYTICS_REFRESH_INTERVAL_SECONDS)
+        )
+    
+    if settings.LIKE_WRITE_BEHIND:
+        await run_in_threadpool(like_buffer.start, SessionLocal)
+    broker.start(asyncio.get_running_loop(), get_engine(), settings.REALTIME_FANOUT)
+    
+    yield
+    
+    await run_in_threadpool(broker.stop)
+    if refresher is not None:
+        refresher.cancel()
+    if like_buffer.running:
+        await run_in_threadpool(like_buffer.stop)
+    await dispose_async_engine()
+    metrics.mark_process_dead()
+
 
 app = FastAPI(
     title="Startup Platform API",
     description="API for sharing and discovering startup projects",
     version="1.0.0",
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -27,10 +85,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(RequestTimingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth_router)
 app.include_router(projects_router)
+app.include_router(realtime_router)
+app.include_router(monitoring_router)
 
 
 @app.get("/")
@@ -49,10 +112,20 @@ def health_check() -> dict:
     """
     Health check endpoint for monitoring.
     
+    Reports statistics only; load balancers should use /health/ready and
+    /health/live instead.
+    
     Returns:
-        Health status.
+        Health status, connection pool, read cache, like buffer and realtime
+        broker statistics.
     """
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "pool": pool_stats(get_engine()),
+        "cache": read_cache.project_cache.describe(),
+        "like_buffer": like_buffer.describe(),
+        "realtime": broker.describe()
+    }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,217 @@
+"""
+Management commands for the Startup Platform API.
+
+Usage:
+    python manage.py migrate [revision]
+    python manage.py reconcile-counters
+    python manage.py recompute-trending
+    python manage.py import {projects,likes,reviews} FILE [--format ndjson|csv]
+    python manage.py export {projects,likes,reviews} [--output FILE] [--format ndjson|csv]
+"""
+
+import argparse
+import sys
+from typing import IO, Callable, Dict, List, Optional
+
+from database.connection import SessionLocal, get_engine
+from database.migrations import upgrade_database
+from auth import models as auth_models  # noqa: F401  (registers the User mapper)
+from projects import bulk, counters, read_cache, schemas, trending
+
+
+def migrate_command(args: argparse.Namespace) -> int:
+    """
+    Apply schema migrations.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Process exit code.
+    """
+    upgrade_database(get_engine(), args.revision)
+    print(f"Database migrated to {args.revision}")
+    return 0
+
+
+def reconcile_counters_command(args: argparse.Namespace) -> int:
+    """
+    Recompute drifted like/review counters on all projects.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Process exit code.
+    """
+    get_engine()
+    db = SessionLocal()
+    try:
+        corrected = counters.reconcile_counters(db)
+    finally:
+        db.close()
+    if corrected:
+        read_cache.invalidate_all()
+    print(f"Reconciled counters on {corrected} project(s)")
+    return 0
+
+
+def recompute_trending_command(args: argparse.Namespace) -> int:
+    """
+    Rebuild trending scores from likes and reviews.
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Process exit code.
+    """
+    get_engine()
+    db = SessionLocal()
+    try:
+        updated = trending.recompute_scores(db)
+    finally:
+        db.close()
+    read_cache.invalidate_all()
+    print(f"Recomputed trending scores of {updated} project(s)")
+    return 0
+
+
+def file_format(path: str, explicit: Optional[str]) -> schemas.BulkFormat:
+    """
+    Pick the bulk file format from an explicit choice or the file name.
+
+    Args:
+        path: File path.
+        explicit: Format given on the command line, if any.
+
+    Returns:
+        Bulk file format.
+    """
+    if explicit:
+        return schemas.BulkFormat(explicit)
+    return schemas.BulkFormat.csv if path.lower().endswith(".csv") else schemas.BulkFormat.ndjson
+
+
+def import_command(args: argparse.Namespace) -> int:
+    """
+    Import records from an NDJSON or CSV file ("-" reads stdin).
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Process exit code (1 if any row was rejected).
+    """
+    entity = schemas.BulkEntity(args.entity)
+    fmt = file_format(args.file, args.format)
+    get_engine()
+    db = SessionLocal()
+    stream: IO[str] = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8", newline="")
+    try:
+        report = bulk.import_records(
+            db, entity, stream, fmt,
+            finalize=not args.no_finalize,
+            batch_size=args.batch_size
+        )
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        db.close()
+
+    print(
+        f"{entity.value}: processed {report.processed}, inserted {report.inserted}, "
+        f"skipped {report.skipped}, failed {report.failed}"
+    )
+    for error in report.errors:
+        print(f"  line {error.line}: {error.error}", file=sys.stderr)
+    return 1 if report.failed else 0
+
+
+def export_command(args: argparse.Namespace) -> int:
+    """
+    Export records to an NDJSON or CSV file ("-" writes stdout).
+
+    Args:
+        args: Parsed command line arguments.
+
+    Returns:
+        Process exit code.
+    """
+    entity = schemas.BulkEntity(args.entity)
+    fmt = file_format(args.output, args.format)
+    get_engine()
+    db = SessionLocal()
+    output: IO[str] = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        for chunk in bulk.export_records(db, entity, fmt):
+            output.write(chunk)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        db.close()
+    return 0
+
+
+COMMANDS: Dict[str, Callable[[argparse.Namespace], int]] = {
+    "migrate": migrate_command,
+    "reconcile-counters": reconcile_counters_command,
+    "recompute-trending": recompute_trending_command,
+    "import": import_command,
+    "export": export_command,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser.
+
+    Returns:
+        Argument parser with one subcommand per management command.
+    """
+    parser = argparse.ArgumentParser(description="Startup Platform API management")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate = subparsers.add_parser("migrate", help="Apply schema migrations")
+    migrate.add_argument("revision", nargs="?", default="head", help="Target revision")
+    subparsers.add_parser(
+        "reconcile-counters",
+        help="Recompute denormalized like/review counters"
+    )
+    subparsers.add_parser(
+        "recompute-trending",
+        help="Rebuild time-decayed trending scores"
+    )
+    entities = [entity.value for entity in schemas.BulkEntity]
+    formats = [fmt.value for fmt in schemas.BulkFormat]
+    importer = subparsers.add_parser("import", help="Bulk import NDJSON or CSV records")
+    importer.add_argument("entity", choices=entities)
+    importer.add_argument("file", help='Input file, or "-" for stdin')
+    importer.add_argument("--format", choices=formats, help="Defaults to the file extension")
+    importer.add_argument("--batch-size", type=int, default=None)
+    importer.add_argument(
+        "--no-finalize", action="store_true",
+        help="Skip counter/score repair (run it once after the last file)"
+    )
+    exporter = subparsers.add_parser("export", help="Bulk export records as NDJSON or CSV")
+    exporter.add_argument("entity", choices=entities)
+    exporter.add_argument("--output", default="-", help='Output file, or "-" for stdout')
+    exporter.add_argument("--format", choices=formats, help="Defaults to the file extension")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run a management command.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv).
+
+    Returns:
+        Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+"""
+Alembic migration environment.
+
+Runs migrations against the application database, or against a connection
+handed over through ``config.attributes["connection"]`` when migrations are
+started from code. Each revision runs in its own transaction, so revisions
+that build indexes concurrently can leave the transaction for that step.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Connection
+from sqlalchemy.pool import NullPool
+
+from config import settings
+from database.connection import Base
+from auth import models as auth_models  # noqa: F401  (registers the users table)
+from projects import models as project_models  # noqa: F401  (registers project tables)
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Emit migration SQL to stdout instead of executing it."""
+    context.configure(
+        url=settings.DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        transaction_per_migration=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_on(connection: Connection) -> None:
+    """
+    Run migrations on an open connection.
+
+    Args:
+        connection: Database connection.
+    """
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=True,
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations against the configured database."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations_on(connection)
+        return
+
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    with engine.connect() as connection:
+        run_migrations_on(connection)
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
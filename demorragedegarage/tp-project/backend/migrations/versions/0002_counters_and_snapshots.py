@@ -0,0 +1,52 @@
+"""
+Denormalized project counters, project version and analytics snapshots.
+
+Adds likes_count, reviews_count, rating_total and version to projects,
+backfills the counters from the likes and reviews tables, and creates the
+analytics_snapshots table.
+
+Revision ID: 0002_counters_and_snapshots
+Revises: 0001_baseline
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0002_counters_and_snapshots"
+down_revision: Union[str, None] = "0001_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("projects", sa.Column("likes_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("projects", sa.Column("reviews_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("projects", sa.Column("rating_total", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("projects", sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+    op.execute(
+        "UPDATE projects SET "
+        "likes_count = (SELECT count(*) FROM likes WHERE likes.project_id = projects.id), "
+        "reviews_count = (SELECT count(*) FROM reviews WHERE reviews.project_id = projects.id), "
+        "rating_total = (SELECT coalesce(sum(rating), 0) FROM reviews "
+        "WHERE reviews.project_id = projects.id)"
+    )
+
+    op.create_table(
+        "analytics_snapshots",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("analytics_snapshots")
+    with op.batch_alter_table("projects") as batch:
+        batch.drop_column("version")
+        batch.drop_column("rating_total")
+        batch.drop_column("reviews_count")
+        batch.drop_column("likes_count")
@@ -0,0 +1,51 @@
+"""
+Secondary indexes for listings, per-project lookups and user projects.
+
+On PostgreSQL the indexes are built with CREATE INDEX CONCURRENTLY outside
+the migration transaction, so the tables stay writable while they build.
+IF NOT EXISTS makes a rerun after an interrupted build safe; an interrupted
+concurrent build can leave an INVALID index behind, which has to be dropped
+by hand before rerunning.
+
+Revision ID: 0003_secondary_indexes
+Revises: 0002_counters_and_snapshots
+Create Date: 2026-10-18
+"""
+
+from typing import List, Sequence, Tuple, Union
+
+from alembic import op
+
+revision: str = "0003_secondary_indexes"
+down_revision: Union[str, None] = "0002_counters_and_snapshots"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES: List[Tuple[str, str, List[str]]] = [
+    ("ix_projects_created_at_id", "projects", ["created_at", "id"]),
+    ("ix_projects_likes_count_created_at_id", "projects", ["likes_count", "created_at", "id"]),
+    ("ix_projects_reviews_count_created_at_id", "projects", ["reviews_count", "created_at", "id"]),
+    ("ix_projects_user_id_created_at_id", "projects", ["user_id", "created_at", "id"]),
+    ("ix_likes_project_id_created_at", "likes", ["project_id", "created_at"]),
+    ("ix_reviews_project_id_created_at_id", "reviews", ["project_id", "created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                if_not_exists=True,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True
+            )
@@ -0,0 +1,51 @@
+"""
+Full-text search vector on projects.
+
+PostgreSQL only: adds projects.search_vector, a stored generated tsvector
+over the title (weight A) and description (weight B), and indexes it with a
+concurrently built GIN index. Adding a stored generated column rewrites the
+projects table once. Other databases use the in-process search index.
+
+Revision ID: 0004_project_search
+Revises: 0003_secondary_indexes
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0004_project_search"
+down_revision: Union[str, None] = "0003_secondary_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def is_postgresql() -> bool:
+    """Check whether the migration runs against PostgreSQL."""
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def upgrade() -> None:
+    if not is_postgresql():
+        return
+    op.execute(
+        "ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+        ") STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_projects_search_vector "
+            "ON projects USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    if not is_postgresql():
+        return
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_projects_search_vector")
+    op.execute("ALTER TABLE projects DROP COLUMN IF EXISTS search_vector")
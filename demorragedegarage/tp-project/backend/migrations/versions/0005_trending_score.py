@@ -0,0 +1,42 @@
+"""
+Trending score column and index.
+
+Adds projects.trending_score and a concurrently built (trending_score, id)
+index for the trending listing. Existing rows start at 0; run
+`python manage.py recompute-trending` afterwards to backfill them.
+
+Revision ID: 0005_trending_score
+Revises: 0004_project_search
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0005_trending_score"
+down_revision: Union[str, None] = "0004_project_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("projects", sa.Column("trending_score", sa.Float(), nullable=False, server_default="0"))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_projects_trending_score_id", "projects", ["trending_score", "id"],
+            if_not_exists=True,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_projects_trending_score_id", table_name="projects",
+            if_exists=True,
+            postgresql_concurrently=True
+        )
+    with op.batch_alter_table("projects") as batch:
+        batch.drop_column("trending_score")
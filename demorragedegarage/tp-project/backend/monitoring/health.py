@@ -0,0 +1,205 @@
+"""
+Readiness probe.
+
+A worker is ready when it can serve a request quickly, not merely when its
+process is up. The probe therefore checks the things requests wait on:
+
+- the database, with a SELECT 1 bounded by READY_DB_TIMEOUT_MS;
+- the connection pool, whose share of checked-out connections must stay
+  below READY_MAX_POOL_SATURATION;
+- the event loop, measured as the delay before a callback scheduled now
+  runs;
+- the threadpool that serves sync endpoints, measured as the delay before
+  a submitted call starts.
+
+Any check outside its limit makes the worker not ready, so the load balancer
+sheds traffic before latency explodes and brings it back once the backlog
+drains. The SELECT 1 runs on a dedicated thread, so it is not queued behind
+the overloaded threadpool it is meant to detect, and at most one runs at a
+time. Results are cached for READY_CACHE_MS and concurrent probes share one
+evaluation, so frequent probing does not add load.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from anyio import to_thread
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from config import settings
+from database.pool import pool_stats
+
+
+def select_one(engine: Engine) -> float:
+    """
+    Run SELECT 1 through the engine's pool.
+
+    Args:
+        engine: Engine to check.
+
+    Returns:
+        Seconds the round trip took, including the checkout.
+    """
+    started = time.perf_counter()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    return time.perf_counter() - started
+
+
+async def event_loop_lag() -> float:
+    """
+    Measure how long a callback scheduled now waits to run.
+
+    Returns:
+        Delay in seconds.
+    """
+    loop = asyncio.get_running_loop()
+    ran: asyncio.Future = loop.create_future()
+    scheduled = time.perf_counter()
+    loop.call_soon(lambda: ran.done() or ran.set_result(time.perf_counter()))
+    return await ran - scheduled
+
+
+async def threadpool_lag(timeout: float) -> float:
+    """
+    Measure how long a call submitted to the request threadpool waits to start.
+
+    Args:
+        timeout: Seconds after which to stop waiting.
+
+    Returns:
+        Delay in seconds, or timeout if the call did not start in time.
+    """
+    submitted = time.perf_counter()
+    try:
+        started = await asyncio.wait_for(run_in_threadpool(time.perf_counter), timeout)
+    except asyncio.TimeoutError:
+        return timeout
+    return started - submitted
+
+
+def pool_saturation(stats: Dict[str, Any]) -> Optional[float]:
+    """
+    Compute the share of a pool's connections that are checked out.
+
+    Args:
+        stats: Output of database.pool.pool_stats.
+
+    Returns:
+        Ratio in [0, 1], or None for pools without a fixed capacity.
+    """
+    if "size" not in stats:
+        return None
+    capacity = stats["size"] + stats["max_overflow"]
+    return min(stats["checked_out"] / capacity, 1.0) if capacity > 0 else None
+
+
+class ReadinessProbe:
+    """Cached evaluation of whether this worker should receive traffic."""
+
+    def __init__(
+        self,
+        cache_ms: int,
+        db_timeout_ms: int,
+        max_pool_saturation: float,
+        max_loop_lag_ms: int,
+        max_threadpool_lag_ms: int,
+    ) -> None:
+        self.cache_seconds = cache_ms / 1000
+        self.db_timeout = db_timeout_ms / 1000
+        self.max_pool_saturation = max_pool_saturation
+        self.max_loop_lag = max_loop_lag_ms / 1000
+        self.max_threadpool_lag = max_threadpool_lag_ms / 1000
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="readiness")
+        self._db_check: Optional[Future] = None
+        self._result: Optional[Dict[str, Any]] = None
+        self._expires = 0.0
+        self._pending: Optional[asyncio.Task] = None
+
+    async def check(self, engine: Engine) -> Dict[str, Any]:
+        """
+        Return the readiness report, evaluating it at most once per cache period.
+
+        Args:
+            engine: Engine whose database and pool are checked.
+
+        Returns:
+            Report with "ready", the reasons it is not, and each check.
+        """
+        if self._result is not None and time.monotonic() < self._expires:
+            return self._result
+        pending = self._pending
+        if pending is None or pending.done() or pending.get_loop() is not asyncio.get_running_loop():
+            pending = self._pending = asyncio.ensure_future(self._evaluate(engine))
+        return await asyncio.shield(pending)
+
+    async def _evaluate(self, engine: Engine) -> Dict[str, Any]:
+        """Run every check and cache the report."""
+        reasons: List[str] = []
+
+        loop_lag = await event_loop_lag()
+        if loop_lag > self.max_loop_lag:
+            reasons.append("event loop lag")
+
+        stats = pool_stats(engine)
+        saturation = pool_saturation(stats)
+        if saturation is not None and saturation >= self.max_pool_saturation:
+            reasons.append("connection pool saturated")
+            database: Dict[str, Any] = {"ok": False, "error": "skipped: pool saturated"}
+            lag = await threadpool_lag(self.max_threadpool_lag)
+        else:
+            database, lag = await asyncio.gather(
+                self._check_database(engine),
+                threadpool_lag(self.max_threadpool_lag),
+            )
+            if not database["ok"]:
+                reasons.append("database unavailable")
+        if lag >= self.max_threadpool_lag:
+            reasons.append("threadpool lag")
+
+        limiter = to_thread.current_default_thread_limiter()
+        report = {
+            "ready": not reasons,
+            "reasons": reasons,
+            "database": database,
+            "pool": {
+                "checked_out": stats["checked_out"],
+                "saturation": None if saturation is None else round(saturation, 3),
+            },
+            "event_loop_lag_ms": round(loop_lag * 1000, 3),
+            "threadpool": {
+                "lag_ms": round(lag * 1000, 3),
+                "busy": limiter.borrowed_tokens,
+                "size": limiter.total_tokens,
+            },
+        }
+        self._result = report
+        self._expires = time.monotonic() + self.cache_seconds
+        return report
+
+    async def _check_database(self, engine: Engine) -> Dict[str, Any]:
+        """Run SELECT 1 on the probe thread, reusing a check still in flight."""
+        if self._db_check is None or self._db_check.done():
+            self._db_check = self._executor.submit(select_one, engine)
+        try:
+            seconds = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(self._db_check)), self.db_timeout
+            )
+        except asyncio.TimeoutError:
+            return {"ok": False, "error": f"no response within {self.db_timeout * 1000:.0f} ms"}
+        except Exception as exc:
+            return {"ok": False, "error": type(exc).__name__}
+        return {"ok": True, "latency_ms": round(seconds * 1000, 3)}
+
+
+readiness = ReadinessProbe(
+    settings.READY_CACHE_MS,
+    settings.READY_DB_TIMEOUT_MS,
+    settings.READY_MAX_POOL_SATURATION,
+    settings.READY_MAX_LOOP_LAG_MS,
+    settings.READY_MAX_THREADPOOL_LAG_MS,
+)
@@ -0,0 +1,191 @@
+"""
+Prometheus metrics.
+
+MetricsMiddleware counts requests and errors and records their latency per
+method and route template ("/projects/{project_id}", never the raw path, so
+label cardinality stays bounded), plus a gauge of requests in flight. The
+connection pool and the Argon2 hashing pool update their own metrics defined
+here, and GET /metrics renders everything in the Prometheus text format.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR in the
+environment to an empty directory shared by the workers. prometheus_client
+then keeps every value in a memory-mapped file per process, and a scrape of
+any worker aggregates the files of all of them. The variable is read when
+prometheus_client is first imported and the directory must be emptied
+before the server starts. Without it, /metrics reports the scraped process
+only.
+
+Recording is a dictionary lookup plus a few lock-protected additions per
+request; benchmarks/bench_metrics.py measures it.
+"""
+
+import os
+import time
+from typing import Dict, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from monitoring.timing import route_template
+
+MULTIPROCESS: bool = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+HASH_BUCKETS: Tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ["method", "route", "status"],
+)
+REQUEST_ERRORS = Counter(
+    "http_request_errors_total",
+    "HTTP requests that ended in a 5xx response or an unhandled exception.",
+    ["method", "route"],
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time from receiving a request until its response finished.",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being served, including open event streams.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Persistent connections the pool keeps.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT.",
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Argon2 work per operation, excluding time queued for a hashing thread.",
+    ["operation"],
+    buckets=HASH_BUCKETS,
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Hash requests rejected because the hashing queue was full.",
+)
+
+
+class _RouteMetrics:
+    """Labelled children of the request metrics for one method and route."""
+
+    __slots__ = ("duration", "errors", "statuses", "method", "route")
+
+    def __init__(self, method: str, route: str) -> None:
+        self.method = method
+        self.route = route
+        self.duration = REQUEST_DURATION.labels(method, route)
+        self.errors = REQUEST_ERRORS.labels(method, route)
+        self.statuses: Dict[int, Counter] = {}
+
+    def record(self, status: int, seconds: float) -> None:
+        counter = self.statuses.get(status)
+        if counter is None:
+            counter = self.statuses[status] = REQUESTS.labels(self.method, self.route, str(status))
+        counter.inc()
+        self.duration.observe(seconds)
+        if status >= 500:
+            self.errors.inc()
+
+
+_routes: Dict[Tuple[str, str], _RouteMetrics] = {}
+_in_progress: Dict[str, Gauge] = {}
+
+
+def record_request(method: str, route: str, status: int, seconds: float) -> None:
+    """
+    Record a finished request.
+
+    Args:
+        method: HTTP method.
+        route: Route template, or "unmatched".
+        status: Response status code (500 for unhandled exceptions).
+        seconds: Request duration.
+    """
+    metrics = _routes.get((method, route))
+    if metrics is None:
+        metrics = _routes[(method, route)] = _RouteMetrics(method, route)
+    metrics.record(status, seconds)
+
+
+class MetricsMiddleware:
+    """ASGI middleware that records request counts, errors and latency."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_progress = _in_progress.get(method)
+        if in_progress is None:
+            in_progress = _in_progress[method] = REQUESTS_IN_PROGRESS.labels(method)
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            record_request(method, route_template(scope), status, time.perf_counter() - started)
+
+
+def render() -> Tuple[bytes, str]:
+    """
+    Render all metrics in the Prometheus text format.
+
+    Returns:
+        Exposition body and its content type.
+    """
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess aggregate."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,57 @@
+"""
+Monitoring router module.
+
+Serves the Prometheus metrics endpoint and the liveness and readiness probes.
+"""
+
+from fastapi import APIRouter, Response, status
+from fastapi.responses import JSONResponse
+
+from database.connection import get_engine
+from monitoring import metrics
+from monitoring.health import readiness
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """
+    Export metrics in the Prometheus text format.
+    
+    Returns:
+        Metrics of this worker, or of every worker in multiprocess mode.
+    """
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
+
+@router.get("/health/live")
+async def liveness() -> dict:
+    """
+    Liveness probe.
+    
+    Answers from the event loop without touching any dependency, so a slow
+    database never gets the worker restarted.
+    
+    Returns:
+        Alive status.
+    """
+    return {"status": "alive"}
+
+
+@router.get("/health/ready")
+async def readiness_probe() -> JSONResponse:
+    """
+    Readiness probe.
+    
+    Returns:
+        200 with the checks when the worker should receive traffic, 503
+        with the reasons when it should not.
+    """
+    report = await readiness.check(get_engine())
+    return JSONResponse(
+        {"status": "ready" if report["ready"] else "not_ready", **report},
+        status_code=status.HTTP_200_OK if report["ready"] else status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Cache-Control": "no-store"}
+    )
@@ -0,0 +1,179 @@
+"""
+Per-request timing and SQL statement accounting.
+
+RequestTimingMiddleware opens a RequestTiming for every HTTP request and keeps
+it in a context variable. Sync endpoints run in the threadpool with a copy of
+the request's context, so the cursor hooks installed by instrument_queries()
+find the same object and add each statement's duration to it. When the
+response starts, its wall time, DB time and statement count go out in a
+Server-Timing header; when it ends, requests that issued more than
+QUERY_BUDGET statements are logged as over budget.
+
+Independently of the budget, every statement slower than SLOW_QUERY_MS is
+logged together with the route template that issued it, or "-" for
+background work outside a request.
+"""
+
+import logging
+import time
+from contextvars import ContextVar
+from typing import Any, List, MutableMapping, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_LOG_CHARS: int = 500
+
+_current: ContextVar[Optional["RequestTiming"]] = ContextVar("request_timing", default=None)
+
+
+def route_template(scope: MutableMapping[str, Any]) -> str:
+    """
+    Return the template of the route a request matched.
+
+    Args:
+        scope: ASGI scope, after routing when a route matched.
+
+    Returns:
+        e.g. "/projects/{project_id}", or "unmatched" before routing or when
+        no route matched.
+    """
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+def route_name(scope: MutableMapping[str, Any]) -> str:
+    """
+    Name a request by its method and matched route template.
+
+    Args:
+        scope: ASGI scope.
+
+    Returns:
+        e.g. "GET /projects/{project_id}".
+    """
+    return f"{scope.get('method', '-')} {route_template(scope)}"
+
+
+class RequestTiming:
+    """
+    Timing of one request.
+
+    Attributes:
+        started: perf_counter() when the request arrived.
+        db_seconds: Time spent executing SQL statements.
+        statements: SQL statements executed.
+    """
+
+    def __init__(self, scope: MutableMapping[str, Any]) -> None:
+        self.scope = scope
+        self.started = time.perf_counter()
+        self.db_seconds = 0.0
+        self.statements = 0
+
+    @property
+    def route(self) -> str:
+        """Method and route template of the request."""
+        return route_name(self.scope)
+
+    def elapsed(self) -> float:
+        """Seconds since the request arrived."""
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """
+        Format the timing as a Server-Timing header value.
+
+        Returns:
+            Total and DB durations in milliseconds, with the statement count.
+        """
+        return (
+            f"total;dur={self.elapsed() * 1000:.1f}, "
+            f'db;dur={self.db_seconds * 1000:.1f};desc="{self.statements} queries"'
+        )
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    started: List[float] = conn.info.get("query_started") or []
+    if not started:
+        return
+    seconds = time.perf_counter() - started.pop()
+    timing = _current.get()
+    if timing is not None:
+        timing.db_seconds += seconds
+        timing.statements += 1
+    if settings.SLOW_QUERY_MS > 0 and seconds * 1000 >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query (%.1f ms) in %s: %s",
+            seconds * 1000,
+            timing.route if timing is not None else "-",
+            " ".join(statement.split())[:STATEMENT_LOG_CHARS],
+        )
+
+
+def _handle_error(exception_context: Any) -> None:
+    connection = exception_context.connection
+    if connection is not None:
+        started = connection.info.get("query_started")
+        if started:
+            started.pop()
+
+
+def instrument_queries(engine: Engine) -> None:
+    """
+    Time the SQL statements an engine executes.
+
+    Args:
+        engine: Sync engine (for an AsyncEngine, pass its sync_engine).
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class RequestTimingMiddleware:
+    """ASGI middleware that times requests and reports them in Server-Timing."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming(scope)
+        token = _current.set(timing)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.SERVER_TIMING:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            if 0 < settings.QUERY_BUDGET < timing.statements:
+                logger.warning(
+                    "%s issued %d queries (budget %d) in %.1f ms",
+                    timing.route,
+                    timing.statements,
+                    settings.QUERY_BUDGET,
+                    timing.elapsed() * 1000,
+                )
+
@@ -0,0 +1,224 @@
+"""
+Analytics snapshot module.
+
+Computes platform analytics and keeps a precomputed copy in the
+analytics_snapshots table, so the analytics endpoint reads one row instead
+of aggregating the whole catalogue on every call. A background task
+refreshes the snapshot periodically; a request that finds it too old
+starts a refresh on another thread and is still served the last snapshot,
+so no request waits for the aggregation except the very first one. On
+PostgreSQL an advisory lock lets only one worker refresh at a time.
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database.connection import SessionLocal, get_engine
+from projects import models, queries, schemas
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ID: int = 1
+ANALYTICS_LOCK_ID: int = 72_410_002
+TOP_PROJECTS_LIMIT: int = 10
+
+_refresh_lock = threading.Lock()
+
+
+def utcnow() -> datetime:
+    """Return the current UTC time as a naive datetime."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def compute_analytics(db: Session) -> schemas.AnalyticsResponse:
+    """
+    Compute analytics directly from the projects table.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        Analytics data with top projects and totals.
+    """
+    rows = db.execute(
+        queries.project_listing_query().order_by(
+            models.Project.likes_count.desc(),
+            models.Project.created_at.desc(),
+            models.Project.id.desc()
+        ).limit(TOP_PROJECTS_LIMIT)
+    ).all()
+    top_projects: List[schemas.ProjectWithUser] = [
+        queries.row_to_project_with_user(row._mapping) for row in rows
+    ]
+
+    totals = db.execute(
+        select(
+            func.count(models.Project.id),
+            func.coalesce(func.sum(models.Project.likes_count), 0),
+            func.coalesce(func.sum(models.Project.reviews_count), 0)
+        )
+    ).one()
+
+    return schemas.AnalyticsResponse(
+        top_projects=top_projects,
+        total_projects=totals[0],
+        total_likes=totals[1],
+        total_reviews=totals[2]
+    )
+
+
+def refresh_snapshot(
+    db: Session,
+    min_age_seconds: float = 0.0,
+    wait: bool = True
+) -> Optional[models.AnalyticsSnapshot]:
+    """
+    Recompute analytics and store them as the current snapshot.
+
+    On PostgreSQL a transaction-level advisory lock serialises refreshes
+    across workers. Once the lock is held, a snapshot younger than
+    min_age_seconds is kept, so workers that wake up shortly after another
+    one refreshed do not recompute it again.
+
+    Args:
+        db: Database session.
+        min_age_seconds: Age below which the current snapshot is kept.
+        wait: Wait for a refresh running in another process instead of
+            giving up.
+
+    Returns:
+        The current snapshot row, or None if wait is False and another
+        process is refreshing.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        params = {"id": ANALYTICS_LOCK_ID}
+        if wait:
+            db.execute(text("SELECT pg_advisory_xact_lock(:id)"), params)
+        elif not db.scalar(text("SELECT pg_try_advisory_xact_lock(:id)"), params):
+            db.rollback()
+            return None
+
+    refreshed_at = utcnow()
+    snapshot = db.get(models.AnalyticsSnapshot, SNAPSHOT_ID, populate_existing=True)
+    if snapshot is not None and (refreshed_at - snapshot.refreshed_at).total_seconds() < min_age_seconds:
+        db.rollback()
+        return snapshot
+
+    payload = compute_analytics(db).model_dump_json()
+    if snapshot is None:
+        snapshot = models.AnalyticsSnapshot(id=SNAPSHOT_ID)
+        db.add(snapshot)
+    snapshot.payload = payload
+    snapshot.refreshed_at = refreshed_at
+
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker inserted the snapshot row first; theirs is as fresh.
+        db.rollback()
+        snapshot = db.get(models.AnalyticsSnapshot, SNAPSHOT_ID)
+    return snapshot
+
+
+def refresh_in_background(bind: Engine, min_age_seconds: float) -> Optional[threading.Thread]:
+    """
+    Refresh the snapshot on a separate thread unless a refresh is running.
+
+    Args:
+        bind: Engine of the database holding the snapshot.
+        min_age_seconds: Age below which the current snapshot is kept.
+
+    Returns:
+        The started thread, or None if a refresh was already in progress.
+    """
+    if not _refresh_lock.acquire(blocking=False):
+        return None
+
+    def refresh() -> None:
+        try:
+            with Session(bind=bind) as db:
+                refresh_snapshot(db, min_age_seconds, wait=False)
+        except Exception:
+            logger.exception("Analytics snapshot refresh failed")
+        finally:
+            _refresh_lock.release()
+
+    thread = threading.Thread(target=refresh, name="analytics-refresh", daemon=True)
+    thread.start()
+    return thread
+
+
+def load_analytics(db: Session, max_age_seconds: int) -> schemas.AnalyticsResponse:
+    """
+    Serve analytics from the snapshot.
+
+    Only a missing snapshot is computed in the request. An older one than
+    max_age_seconds is still served while a background refresh replaces it.
+
+    Args:
+        db: Database session.
+        max_age_seconds: Age after which the snapshot is refreshed.
+
+    Returns:
+        Analytics data annotated with snapshot time and staleness.
+    """
+    snapshot = db.get(models.AnalyticsSnapshot, SNAPSHOT_ID)
+    now = utcnow()
+    if snapshot is None:
+        snapshot = refresh_snapshot(db, max_age_seconds)
+        now = utcnow()
+    elif (now - snapshot.refreshed_at).total_seconds() > max_age_seconds:
+        refresh_in_background(db.get_bind(), max_age_seconds)
+
+    analytics = schemas.AnalyticsResponse.model_validate_json(snapshot.payload)
+    analytics.generated_at = snapshot.refreshed_at
+    analytics.stale_seconds = round(max((now - snapshot.refreshed_at).total_seconds(), 0.0), 3)
+    return analytics
+
+
+def refresh_snapshot_in_new_session(min_age_seconds: float) -> None:
+    """
+    Refresh the snapshot using a dedicated session.
+
+    Skipped while this process or, on PostgreSQL, another worker is
+    already refreshing.
+
+    Args:
+        min_age_seconds: Age below which the current snapshot is kept.
+    """
+    if not _refresh_lock.acquire(blocking=False):
+        return
+    try:
+        get_engine()
+        with SessionLocal() as db:
+            refresh_snapshot(db, min_age_seconds, wait=False)
+    finally:
+        _refresh_lock.release()
+
+
+async def run_snapshot_refresher(interval_seconds: int) -> None:
+    """
+    Periodically refresh the analytics snapshot until cancelled.
+
+    Every worker runs this task, but a snapshot refreshed by any of them
+    within the last interval is kept, so the aggregation runs about once
+    per interval however many workers there are.
+
+    Args:
+        interval_seconds: Delay between refreshes.
+    """
+    while True:
+        try:
+            await run_in_threadpool(refresh_snapshot_in_new_session, interval_seconds)
+        except Exception:
+            logger.exception("Analytics snapshot refresh failed")
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,346 @@
+"""
+Bulk import and export of projects, likes and reviews.
+
+Records are streamed as NDJSON or CSV, validated with the import schemas and
+written in batches, so memory use stays constant however large the input is.
+On PostgreSQL each batch is loaded with COPY FROM STDIN into a temporary
+table and moved over with INSERT ... SELECT ... ON CONFLICT DO NOTHING;
+other databases use batched INSERT ... ON CONFLICT DO NOTHING. Rows that
+fail validation or reference unknown users/projects are reported per line;
+duplicates are skipped. Each batch commits on its own.
+"""
+
+import csv
+import io
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Table, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from auth import models as auth_models
+from config import settings
+from projects import counters, models, read_cache, schemas, search, trending
+
+MAX_REPORTED_ERRORS: int = 100
+EXPORT_CHUNK_ROWS: int = 1000
+
+
+@dataclass(frozen=True)
+class EntitySpec:
+    """
+    How one record type maps onto its table.
+
+    Attributes:
+        table: Target table.
+        schema: Pydantic schema validating one record.
+        columns: Imported and exported columns, in file order.
+        references: Foreign key columns mapped to the table they reference.
+    """
+
+    table: Table
+    schema: Type[BaseModel]
+    columns: Tuple[str, ...]
+    references: Dict[str, Table]
+
+
+ENTITIES: Dict[schemas.BulkEntity, EntitySpec] = {
+    schemas.BulkEntity.projects: EntitySpec(
+        table=models.Project.__table__,
+        schema=schemas.ProjectImport,
+        columns=("id", "title", "description", "project_url", "user_id", "created_at"),
+        references={"user_id": auth_models.User.__table__},
+    ),
+    schemas.BulkEntity.likes: EntitySpec(
+        table=models.Like.__table__,
+        schema=schemas.LikeImport,
+        columns=("user_id", "project_id", "created_at"),
+        references={"user_id": auth_models.User.__table__, "project_id": models.Project.__table__},
+    ),
+    schemas.BulkEntity.reviews: EntitySpec(
+        table=models.Review.__table__,
+        schema=schemas.ReviewImport,
+        columns=("user_id", "project_id", "content", "rating", "created_at"),
+        references={"user_id": auth_models.User.__table__, "project_id": models.Project.__table__},
+    ),
+}
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    """Normalise a datetime to naive UTC, as stored in the database."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def read_records(stream: IO[str], fmt: schemas.BulkFormat) -> Iterator[Tuple[int, Any]]:
+    """
+    Iterate over the raw records of an NDJSON or CSV stream.
+
+    Args:
+        stream: Text stream.
+        fmt: File format.
+
+    Yields:
+        (line number, record) pairs; a record that cannot be parsed is
+        yielded as the ValueError describing the problem.
+    """
+    if fmt == schemas.BulkFormat.csv:
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, {key: (value if value != "" else None) for key, value in record.items()}
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as exc:
+            yield line_number, ValueError(f"Invalid JSON: {exc}")
+
+
+class Importer:
+    """Validates records and writes them in batches for one entity."""
+
+    def __init__(self, db: Session, entity: schemas.BulkEntity, batch_size: int) -> None:
+        self.db = db
+        self.spec = ENTITIES[entity]
+        self.batch_size = batch_size
+        self.report = schemas.BulkImportReport(entity=entity)
+        self._batch: List[Tuple[int, Dict[str, Any]]] = []
+        self._now = _to_naive_utc(datetime.now(timezone.utc))
+
+    def add(self, line: int, record: Any) -> None:
+        """
+        Validate one record and queue it for insertion.
+
+        Args:
+            line: Line number in the input.
+            record: Parsed record, or the parse error.
+        """
+        self.report.processed += 1
+        if isinstance(record, Exception):
+            self._fail(line, str(record))
+            return
+        try:
+            item = self.spec.schema.model_validate(record)
+        except ValidationError as exc:
+            self._fail(line, "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in exc.errors()
+            ))
+            return
+
+        row = item.model_dump(include=set(self.spec.columns))
+        row["created_at"] = _to_naive_utc(row["created_at"]) if row.get("created_at") else self._now
+        self._batch.append((line, row))
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Insert and commit the queued batch."""
+        if not self._batch:
+            return
+        rows = self._drop_unknown_references(self._batch)
+        self._batch = []
+        if rows:
+            inserted = self._insert(rows)
+            self.db.commit()
+            self.report.inserted += inserted
+            self.report.skipped += len(rows) - inserted
+
+    def _fail(self, line: int, error: str) -> None:
+        """Record a rejected row."""
+        self.report.failed += 1
+        if len(self.report.errors) < MAX_REPORTED_ERRORS:
+            self.report.errors.append(schemas.BulkRowError(line=line, error=error))
+
+    def _drop_unknown_references(self, batch: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Reject rows whose foreign keys point at missing rows (one IN query per key)."""
+        known = {
+            column: set(self.db.scalars(
+                select(table.c.id).where(table.c.id.in_({row[column] for _, row in batch}))
+            ))
+            for column, table in self.spec.references.items()
+        }
+        rows = []
+        for line, row in batch:
+            missing = [column for column in known if row[column] not in known[column]]
+            if missing:
+                self._fail(line, ", ".join(f"unknown {column} {row[column]}" for column in missing))
+            else:
+                rows.append(row)
+        return rows
+
+    def _insert(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert rows, skipping conflicts; returns the number inserted."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            return self._copy_insert(rows)
+        statement = sqlite.insert(self.spec.table).on_conflict_do_nothing()
+        return self.db.execute(statement, rows).rowcount
+
+    def _copy_insert(self, rows: List[Dict[str, Any]]) -> int:
+        """Load rows with COPY into a temporary table, then INSERT ... SELECT them."""
+        table = self.spec.table
+        dialect = postgresql.dialect()
+        columns = self.spec.columns
+        staging = f"bulk_{table.name}"
+        column_list = ", ".join(columns)
+
+        self.db.execute(text(
+            f"CREATE TEMP TABLE {staging} ("
+            + ", ".join(f"{name} {table.c[name].type.compile(dialect)}" for name in columns)
+            + ") ON COMMIT DROP"
+        ))
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_value(row.get(name)) for name in columns))
+            buffer.write("\n")
+        buffer.seek(0)
+        cursor = self.db.connection().connection.driver_connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+
+        selected = ", ".join(
+            f"coalesce(id, nextval(pg_get_serial_sequence('{table.name}', 'id')))" if name == "id" else name
+            for name in columns
+        )
+        result = self.db.execute(text(
+            f"INSERT INTO {table.name} ({column_list}) "
+            f"SELECT {selected} FROM {staging} ON CONFLICT DO NOTHING"
+        ))
+        return result.rowcount
+
+
+def _copy_value(value: Any) -> str:
+    """Render one value in COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def finalize_import(db: Session, entity: schemas.BulkEntity) -> None:
+    """
+    Bring derived data in line with imported rows.
+
+    Repairs counters and trending scores, advances the projects ID sequence
+    on PostgreSQL and drops cached reads and the in-memory search index.
+
+    Args:
+        db: Database session.
+        entity: Imported record type.
+    """
+    if entity == schemas.BulkEntity.projects and db.get_bind().dialect.name == "postgresql":
+        db.execute(text(
+            "SELECT setval(pg_get_serial_sequence('projects', 'id'), "
+            "coalesce((SELECT max(id) FROM projects), 1))"
+        ))
+        db.commit()
+    if entity != schemas.BulkEntity.projects:
+        counters.reconcile_counters(db)
+    trending.recompute_scores(db)
+    read_cache.invalidate_all()
+    search.search_index.clear()
+
+
+def import_records(
+    db: Session,
+    entity: schemas.BulkEntity,
+    stream: IO[str],
+    fmt: schemas.BulkFormat,
+    finalize: bool = True,
+    batch_size: Optional[int] = None
+) -> schemas.BulkImportReport:
+    """
+    Import records from a stream.
+
+    Args:
+        db: Database session.
+        entity: Record type.
+        stream: Text stream with NDJSON or CSV records.
+        fmt: File format.
+        finalize: Repair counters, scores and caches afterwards; disable when
+            loading several files in a row and finalize once at the end.
+        batch_size: Rows per batch (defaults to BULK_BATCH_SIZE).
+
+    Returns:
+        Import outcome with per-row errors.
+    """
+    importer = Importer(db, entity, batch_size or settings.BULK_BATCH_SIZE)
+    for line, record in read_records(stream, fmt):
+        importer.add(line, record)
+    importer.flush()
+    importer.report.errors.sort(key=lambda error: error.line)
+    if finalize and importer.report.inserted:
+        finalize_import(db, entity)
+    return importer.report
+
+
+def export_records(db: Session, entity: schemas.BulkEntity, fmt: schemas.BulkFormat) -> Iterator[str]:
+    """
+    Stream all records of an entity in import-compatible form.
+
+    Rows are fetched with a server-side cursor in ID order and yielded in
+    chunks of EXPORT_CHUNK_ROWS lines.
+
+    Args:
+        db: Database session.
+        entity: Record type.
+        fmt: Output format.
+
+    Yields:
+        Chunks of output text.
+    """
+    spec = ENTITIES[entity]
+    table = spec.table
+    rows = db.execute(
+        select(*(table.c[name] for name in spec.columns))
+        .order_by(table.c.id)
+        .execution_options(yield_per=EXPORT_CHUNK_ROWS)
+    )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if fmt == schemas.BulkFormat.csv:
+        writer.writerow(spec.columns)
+
+    for count, row in enumerate(rows, start=1):
+        values = row._mapping
+        if fmt == schemas.BulkFormat.csv:
+            writer.writerow([
+                values[name].isoformat() if isinstance(values[name], datetime) else values[name]
+                for name in spec.columns
+            ])
+        else:
+            buffer.write(json.dumps(
+                {
+                    name: values[name].isoformat() if isinstance(values[name], datetime) else values[name]
+                    for name in spec.columns
+                },
+                ensure_ascii=False
+            ))
+            buffer.write("\n")
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
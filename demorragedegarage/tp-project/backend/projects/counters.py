@@ -0,0 +1,143 @@
+"""
+Denormalized project counters.
+
+Keeps likes_count, reviews_count and rating_total on the projects table in
+step with the likes and reviews tables, and repairs them when they drift.
+Counters changed by a transaction are remembered in the session's info under
+CHANGED_COUNTERS_KEY, so they can be pushed to clients once it commits.
+"""
+
+from typing import Any, Mapping, Optional
+
+from sqlalchemy import ColumnElement, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from projects import models
+
+CHANGED_COUNTERS_KEY = "changed_counters"
+
+
+def note_counters(db: Session, counters: Mapping[str, Any]) -> None:
+    """
+    Remember a project's counters as changed by the current transaction.
+
+    Args:
+        db: Database session.
+        counters: Project id, likes_count, reviews_count, rating_total and
+            version after the change.
+    """
+    db.info.setdefault(CHANGED_COUNTERS_KEY, {})[counters["id"]] = dict(counters)
+
+
+def adjust_counters(
+    db: Session,
+    project_id: int,
+    likes: int = 0,
+    reviews: int = 0,
+    rating: int = 0,
+    trending_score: Optional[ColumnElement] = None
+) -> None:
+    """
+    Atomically add deltas to a project's counters.
+
+    The UPDATE runs inside the caller's transaction, so the counters are
+    committed together with the like or review row that changed them. The
+    project's version is bumped as well, and the new values are returned by
+    the same statement and recorded with note_counters().
+
+    Args:
+        db: Database session.
+        project_id: Project ID.
+        likes: Change in the number of likes.
+        reviews: Change in the number of reviews.
+        rating: Change in the sum of review ratings.
+        trending_score: New trending score expression (see
+            trending.added_score), set by the same statement.
+    """
+    values = {
+        "likes_count": models.Project.likes_count + likes,
+        "reviews_count": models.Project.reviews_count + reviews,
+        "rating_total": models.Project.rating_total + rating,
+        "version": models.Project.version + 1,
+    }
+    if trending_score is not None:
+        values["trending_score"] = trending_score
+    changed = db.execute(
+        update(models.Project)
+        .where(models.Project.id == project_id)
+        .values(**values)
+        .returning(
+            models.Project.id,
+            models.Project.likes_count,
+            models.Project.reviews_count,
+            models.Project.rating_total,
+            models.Project.version
+        )
+        .execution_options(synchronize_session=False)
+    ).first()
+    if changed is not None:
+        note_counters(db, changed._mapping)
+
+
+def average_rating(reviews_count: int, rating_total: int) -> Optional[float]:
+    """
+    Compute the mean review rating from denormalized counters.
+
+    Args:
+        reviews_count: Number of reviews.
+        rating_total: Sum of review ratings.
+
+    Returns:
+        Average rating, or None if the project has no reviews.
+    """
+    if not reviews_count:
+        return None
+    return round(rating_total / reviews_count, 2)
+
+
+def reconcile_counters(db: Session) -> int:
+    """
+    Recompute drifted counters from the likes and reviews tables.
+
+    Runs as a single bulk UPDATE that only touches projects whose stored
+    counters disagree with the source rows, then commits.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        Number of projects that were corrected.
+    """
+    actual_likes = (
+        select(func.count(models.Like.id))
+        .where(models.Like.project_id == models.Project.id)
+        .scalar_subquery()
+    )
+    actual_reviews = (
+        select(func.count(models.Review.id))
+        .where(models.Review.project_id == models.Project.id)
+        .scalar_subquery()
+    )
+    actual_rating = (
+        select(func.coalesce(func.sum(models.Review.rating), 0))
+        .where(models.Review.project_id == models.Project.id)
+        .scalar_subquery()
+    )
+
+    result = db.execute(
+        update(models.Project)
+        .where(or_(
+            models.Project.likes_count != actual_likes,
+            models.Project.reviews_count != actual_reviews,
+            models.Project.rating_total != actual_rating
+        ))
+        .values(
+            likes_count=actual_likes,
+            reviews_count=actual_reviews,
+            rating_total=actual_rating,
+            version=models.Project.version + 1
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
@@ -0,0 +1,108 @@
+"""
+HTTP caching helpers.
+
+Builds strong ETags from data versions and answers conditional GET requests
+with 304 Not Modified, so unchanged payloads are neither rebuilt nor resent.
+"""
+
+import hashlib
+from typing import Any, Dict
+
+from fastapi import Request, Response, status
+
+from config import settings
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+    """
+    Build an ETag from the values a response depends on.
+
+    Args:
+        *parts: Values identifying the response version (IDs, data
+            versions, pagination parameters, ...).
+        weak: Build a weak validator, for payloads that also carry
+            per-request fields.
+
+    Returns:
+        Quoted ETag string.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weakness indicator, as If-None-Match uses weak comparison."""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the client's If-None-Match matches an ETag.
+
+    Args:
+        request: Incoming request.
+        etag: Current ETag of the resource.
+
+    Returns:
+        True if the client already holds this version.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {_opaque_tag(candidate.strip()) for candidate in header.split(",")}
+    return "*" in candidates or _opaque_tag(etag) in candidates
+
+
+def cache_headers(etag: str, private: bool = False) -> Dict[str, str]:
+    """
+    Build validator and freshness headers for a cacheable response.
+
+    Args:
+        etag: ETag of the response.
+        private: Whether the response is specific to the requesting user.
+
+    Returns:
+        ETag and Cache-Control headers.
+    """
+    if private:
+        cache_control = "private, max-age=0, must-revalidate"
+    else:
+        cache_control = (
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+            f"s-maxage={settings.HTTP_CACHE_S_MAXAGE}, must-revalidate"
+        )
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def conditional(request: Request, response: Response, etag: str, private: bool = False) -> bool:
+    """
+    Apply caching headers and report whether a 304 should be returned.
+
+    Args:
+        request: Incoming request.
+        response: Response whose headers are populated.
+        etag: Current ETag of the resource.
+        private: Whether the response is specific to the requesting user.
+
+    Returns:
+        True if the client's cached copy is current.
+    """
+    response.headers.update(cache_headers(etag, private))
+    return is_not_modified(request, etag)
+
+
+def not_modified(etag: str, private: bool = False) -> Response:
+    """
+    Build a 304 Not Modified response.
+
+    Args:
+        etag: Current ETag of the resource.
+        private: Whether the response is specific to the requesting user.
+
+    Returns:
+        Empty 304 response carrying the caching headers.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=cache_headers(etag, private)
+    )
@@ -0,0 +1,449 @@
+"""
+Write-behind buffer for likes.
+
+When LIKE_WRITE_BEHIND is on, idempotent like/unlike requests are not written
+to the database by the request itself. They are recorded as the desired final
+state per (user_id, project_id), so repeated clicks collapse into one change,
+and a background thread writes everything pending every LIKE_FLUSH_INTERVAL_MS
+with likes.write_batch(). A burst on one viral project then costs one
+multi-row INSERT and one counter UPDATE per flush instead of a transaction per
+request contending on the same row.
+
+Every change is appended (and by default fsynced) to a local journal before
+the request is acknowledged. Journal segments are deleted only after the
+changes they hold are committed; segments left behind by a crash are
+replayed on the next start. Replaying is idempotent because the batch writes
+are.
+
+Until a change is flushed, overlay() applies it to the liking user's own
+liked flags, so their reads reflect their writes. Counts catch up at the
+next flush.
+
+The queue lives in the memory of one process, and read-your-writes as well
+as the ordering of POST /like after buffered changes (settle()) only hold
+for requests served by that process. Write-behind therefore requires a
+single worker: start() refuses to run when WEB_CONCURRENCY asks uvicorn
+for several workers, or when another process holds the journal directory's
+owner lock. Instances on separate hosts cannot detect each other, so a
+deployment with more than one instance must leave LIKE_WRITE_BEHIND off.
+"""
+
+import fcntl
+import glob
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from config import settings
+from projects import likes, read_cache
+
+logger = logging.getLogger(__name__)
+
+Key = Tuple[int, int]
+Change = Tuple[bool, datetime]
+
+OWNER_LOCK: str = "owner.lock"
+
+
+@dataclass
+class Segment:
+    """An open, locked journal file."""
+
+    path: str
+    fd: int
+
+    def discard(self) -> None:
+        """Delete the file, then release it."""
+        try:
+            os.unlink(self.path)
+        finally:
+            os.close(self.fd)
+
+
+def _lock(path: str) -> Optional[Segment]:
+    """Open and exclusively lock a journal file, or return None if it is in use."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    return Segment(path, fd)
+
+
+def _read_changes(segment: Segment, changes: Dict[Key, Change]) -> None:
+    """
+    Replay a journal file's entries into changes.
+
+    An entry replaces the change held for its pair only if it is at least
+    as recent, so the result does not depend on the order in which segments
+    of different processes are read. A torn last line is ignored.
+    """
+    with open(segment.path, encoding="utf-8") as journal:
+        for line in journal:
+            try:
+                entry = json.loads(line)
+                key = (int(entry["user_id"]), int(entry["project_id"]))
+                at = datetime.fromisoformat(entry["at"])
+                if at.tzinfo is None:
+                    at = at.replace(tzinfo=timezone.utc)
+                change = (bool(entry["liked"]), at)
+            except (ValueError, KeyError, TypeError):
+                continue
+            held = changes.get(key)
+            if held is None or change[1] >= held[1]:
+                changes.pop(key, None)
+                changes[key] = change
+
+
+def write_changes(db: Session, changes: Dict[Key, Change], batch_size: int) -> Set[int]:
+    """
+    Write buffered changes, committing every batch_size of them.
+
+    Args:
+        db: Database session.
+        changes: Desired like state per (user_id, project_id).
+        batch_size: Changes written per transaction.
+
+    Returns:
+        IDs of projects whose likes changed.
+    """
+    items = list(changes.items())
+    batch_size = max(batch_size, 1)
+    affected: Set[int] = set()
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        affected |= likes.write_batch(
+            db,
+            ((user_id, project_id, at) for (user_id, project_id), (liked, at) in batch if liked),
+            (key for key, (liked, _) in batch if not liked)
+        )
+        db.commit()
+    return affected
+
+
+class LikeBuffer:
+    """Deduplicating, journaled like queue flushed by a background thread."""
+
+    def __init__(
+        self,
+        journal_dir: str,
+        flush_interval_ms: int,
+        batch_size: int,
+        fsync: bool = True
+    ) -> None:
+        self.journal_dir = journal_dir
+        self.flush_interval_ms = flush_interval_ms
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.flushed = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Key, Change] = {}
+        self._inflight: Dict[Key, Change] = {}
+        self._segments: List[Segment] = []
+        self._journal: Optional[Segment] = None
+        self._owner: Optional[Segment] = None
+        self._sequence = 0
+        self._session_factory: Optional[Callable[[], Session]] = None
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the buffer accepts changes."""
+        return self._journal is not None
+
+    def start(self, session_factory: Callable[[], Session], background: bool = True) -> int:
+        """
+        Replay orphaned journals and start accepting changes.
+
+        Args:
+            session_factory: Creates the sessions flushes write with.
+            background: Start the periodic flush thread.
+
+        Returns:
+            Number of changes recovered from orphaned journals.
+
+        Raises:
+            RuntimeError: If the server runs several workers, or another
+                process already runs a buffer on the journal directory.
+        """
+        workers = int(os.environ.get("WEB_CONCURRENCY", "1"))
+        if workers > 1:
+            raise RuntimeError(
+                f"LIKE_WRITE_BEHIND requires a single worker, WEB_CONCURRENCY is {workers}"
+            )
+        os.makedirs(self.journal_dir, exist_ok=True)
+        self._owner = _lock(os.path.join(self.journal_dir, OWNER_LOCK))
+        if self._owner is None:
+            raise RuntimeError(
+                f"Another process runs the like buffer in {self.journal_dir}; "
+                "LIKE_WRITE_BEHIND requires a single worker"
+            )
+        self._session_factory = session_factory
+        recovered = self.recover()
+        with self._lock:
+            self._journal = self._open_segment()
+        if background:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="like-buffer", daemon=True)
+            self._thread.start()
+        return recovered
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop accepting changes and release the journal.
+
+        Args:
+            flush: Write pending changes first. Without it the journal stays
+                on disk, as after a crash, and is replayed by the next start.
+        """
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if flush:
+            self.flush()
+        with self._lock:
+            segments = self._segments + ([self._journal] if self._journal else [])
+            self._segments, self._journal = [], None
+            self._pending.clear()
+        for segment in segments:
+            if flush and os.fstat(segment.fd).st_size == 0:
+                segment.discard()
+            else:
+                os.close(segment.fd)
+        if self._owner is not None:
+            os.close(self._owner.fd)
+            self._owner = None
+
+    def enqueue(self, user_id: int, project_id: int, liked: bool, at: Optional[datetime] = None) -> None:
+        """
+        Journal a like or unlike and queue it for the next flush.
+
+        Returns once the change is durable in the journal.
+
+        Args:
+            user_id: User ID.
+            project_id: Project ID.
+            liked: Desired state: True to like, False to unlike.
+            at: Time of the change; defaults to now, taken under the journal
+                lock so entries are written in time order.
+
+        Raises:
+            RuntimeError: If the buffer is not running.
+        """
+        with self._lock:
+            if self._journal is None:
+                raise RuntimeError("Like buffer is not running")
+            at = at or datetime.now(timezone.utc)
+            line = json.dumps({
+                "user_id": user_id, "project_id": project_id, "liked": liked, "at": at.isoformat()
+            }) + "\n"
+            os.write(self._journal.fd, line.encode())
+            if self.fsync:
+                os.fsync(self._journal.fd)
+            key = (user_id, project_id)
+            self._pending.pop(key, None)
+            self._pending[key] = (liked, at)
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def state(self, user_id: int, project_id: int) -> Optional[bool]:
+        """
+        Return the not yet committed like state of a pair, if any.
+
+        Args:
+            user_id: User ID.
+            project_id: Project ID.
+
+        Returns:
+            True or False if a change is pending, None otherwise.
+        """
+        key = (user_id, project_id)
+        with self._lock:
+            change = self._pending.get(key) or self._inflight.get(key)
+        return None if change is None else change[0]
+
+    def settle(self, user_id: int, project_id: int) -> bool:
+        """
+        Commit any buffered change of a pair before it is written directly.
+
+        Flushes the whole buffer if the pair has a pending or in-flight
+        change, so the change cannot be applied after, and undo, a write
+        that bypasses the buffer.
+
+        Args:
+            user_id: User ID.
+            project_id: Project ID.
+
+        Returns:
+            True if no change of the pair is left uncommitted.
+        """
+        if self.state(user_id, project_id) is None:
+            return True
+        self.flush()
+        return self.state(user_id, project_id) is None
+
+    def overlay(self, user_id: int, liked: Set[int], project_ids: Iterable[int]) -> Set[int]:
+        """
+        Apply a user's pending changes to liked IDs read from the database.
+
+        Args:
+            user_id: User ID.
+            liked: Liked project IDs according to the database.
+            project_ids: Project IDs the caller asked about.
+
+        Returns:
+            Liked project IDs including changes not yet flushed.
+        """
+        if not self._pending and not self._inflight:
+            return liked
+        result = set(liked)
+        for project_id in project_ids:
+            pending = self.state(user_id, project_id)
+            if pending is True:
+                result.add(project_id)
+            elif pending is False:
+                result.discard(project_id)
+        return result
+
+    def flush(self) -> int:
+        """
+        Write every pending change to the database.
+
+        On failure the changes are requeued (newer changes to the same pair
+        win) and their journal segments kept, so nothing acknowledged is lost.
+
+        Returns:
+            Number of changes written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending or self._journal is None:
+                    return 0
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+                segments = self._segments + [self._journal]
+                self._segments = []
+                self._journal = self._open_segment()
+
+            db = self._session_factory()
+            try:
+                affected = write_changes(db, batch, self.batch_size)
+            except Exception:
+                db.rollback()
+                logger.exception("Like buffer flush failed; %d changes requeued", len(batch))
+                with self._lock:
+                    self.failures += 1
+                    for key, change in batch.items():
+                        self._pending.setdefault(key, change)
+                    self._segments = segments + self._segments
+                    self._inflight = {}
+                return 0
+            finally:
+                db.close()
+
+            with self._lock:
+                self._inflight = {}
+                self.flushed += len(batch)
+            for segment in segments:
+                segment.discard()
+            for project_id in affected:
+                read_cache.invalidate_project(project_id)
+            return len(batch)
+
+    def recover(self) -> int:
+        """
+        Replay journal segments left behind by stopped or crashed processes.
+
+        Segments still locked by a live process are skipped.
+
+        Returns:
+            Number of changes replayed.
+        """
+        owned = {segment.path for segment in self._segments}
+        if self._journal is not None:
+            owned.add(self._journal.path)
+        orphans = []
+        for path in sorted(glob.glob(os.path.join(self.journal_dir, "likes-*.journal"))):
+            if path in owned:
+                continue
+            segment = _lock(path)
+            if segment is not None:
+                orphans.append(segment)
+        if not orphans:
+            return 0
+
+        changes: Dict[Key, Change] = {}
+        for segment in orphans:
+            _read_changes(segment, changes)
+        if changes:
+            db = self._session_factory()
+            try:
+                write_changes(db, changes, self.batch_size)
+            except Exception:
+                for segment in orphans:
+                    os.close(segment.fd)
+                raise
+            finally:
+                db.close()
+            for project_id in {project_id for _, project_id in changes}:
+                read_cache.invalidate_project(project_id)
+        for segment in orphans:
+            segment.discard()
+        logger.info("Replayed %d buffered like changes from %d journal files", len(changes), len(orphans))
+        return len(changes)
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describe the buffer for monitoring.
+
+        Returns:
+            Running flag, pending changes and flush counters.
+        """
+        with self._lock:
+            return {
+                "running": self.running,
+                "pending": len(self._pending) + len(self._inflight),
+                "flushed": self.flushed,
+                "failures": self.failures,
+            }
+
+    def _open_segment(self) -> Segment:
+        """Create a new journal segment; the caller must hold the lock."""
+        while True:
+            self._sequence += 1
+            path = os.path.join(self.journal_dir, f"likes-{os.getpid()}-{self._sequence:08d}.journal")
+            segment = _lock(path)
+            if segment is not None:
+                return segment
+
+    def _run(self) -> None:
+        """Flush periodically, or early when a batch fills up, until stopped."""
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval_ms / 1000)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Like buffer flush failed")
+
+
+like_buffer = LikeBuffer(
+    settings.LIKE_JOURNAL_DIR,
+    settings.LIKE_FLUSH_INTERVAL_MS,
+    settings.LIKE_FLUSH_BATCH_SIZE,
+    settings.LIKE_JOURNAL_FSYNC
+)
@@ -0,0 +1,189 @@
+"""
+Like and unlike writes.
+
+Each write is a single statement: INSERT ... SELECT ... ON CONFLICT DO NOTHING
+RETURNING for a like and DELETE ... RETURNING for an unlike. The unique
+(user_id, project_id) constraint turns concurrent duplicates into no-ops
+instead of IntegrityErrors, and the returned row tells whether anything
+changed, so counters and trending scores only move on real changes. Both
+move in one UPDATE ... RETURNING, so a like or unlike costs two statements.
+write_batch() applies many of them at once for the write-behind buffer.
+"""
+
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from functools import reduce
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import DateTime, Integer, Row, delete, literal, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from projects import counters, models, trending
+
+
+def _insert(db: Session) -> Any:
+    """Return the dialect's insert construct, which supports ON CONFLICT."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert
+    return sqlite.insert
+
+
+def add_like(
+    db: Session,
+    user_id: int,
+    project_id: int,
+    at: Optional[datetime] = None
+) -> Optional[Row]:
+    """
+    Like a project unless the user already does.
+
+    The row is selected from projects, so a missing project inserts nothing
+    rather than relying on the foreign key being enforced. Counters and the
+    trending score are updated inside the caller's transaction.
+
+    Args:
+        db: Database session.
+        user_id: Liking user's ID.
+        project_id: Project ID.
+        at: Like time; defaults to now.
+
+    Returns:
+        The inserted like (id, user_id, project_id, created_at), or None if
+        the like already existed or the project does not exist.
+    """
+    at = at or datetime.now(timezone.utc)
+    table = models.Like.__table__
+    source = (
+        select(literal(user_id, Integer()), models.Project.id, literal(at, DateTime()))
+        .where(models.Project.id == project_id)
+    )
+    statement = (
+        _insert(db)(table)
+        .from_select(["user_id", "project_id", "created_at"], source)
+        .on_conflict_do_nothing(index_elements=["user_id", "project_id"])
+        .returning(table.c.id, table.c.user_id, table.c.project_id, table.c.created_at)
+    )
+    like = db.execute(statement).first()
+    if like is not None:
+        counters.adjust_counters(
+            db, project_id, likes=1,
+            trending_score=trending.added_score(trending.event_score(trending.LIKE_WEIGHT, at))
+        )
+    return like
+
+
+def remove_like(db: Session, user_id: int, project_id: int) -> bool:
+    """
+    Remove a user's like from a project if there is one.
+
+    Args:
+        db: Database session.
+        user_id: User ID.
+        project_id: Project ID.
+
+    Returns:
+        True if a like was deleted.
+    """
+    liked_at = db.execute(
+        delete(models.Like)
+        .where(models.Like.user_id == user_id, models.Like.project_id == project_id)
+        .returning(models.Like.created_at)
+        .execution_options(synchronize_session=False)
+    ).scalar()
+    if liked_at is None:
+        return False
+    counters.adjust_counters(
+        db, project_id, likes=-1,
+        trending_score=trending.retracted_score(trending.event_score(trending.LIKE_WEIGHT, liked_at))
+    )
+    return True
+
+
+def project_exists(db: Session, project_id: int) -> bool:
+    """
+    Check whether a project exists.
+
+    Only needed to tell a no-op write apart from a missing project.
+
+    Args:
+        db: Database session.
+        project_id: Project ID.
+
+    Returns:
+        True if the project exists.
+    """
+    return db.scalar(select(models.Project.id).where(models.Project.id == project_id)) is not None
+
+
+def write_batch(
+    db: Session,
+    added: Iterable[Tuple[int, int, datetime]],
+    removed: Iterable[Tuple[int, int]]
+) -> Set[int]:
+    """
+    Apply many likes and unlikes with one multi-row INSERT and one DELETE.
+
+    Used by the write-behind buffer. Counters and trending scores get one
+    UPDATE per affected project however many likes it gained or lost, so a burst
+    on a single project does not serialize on its row. Likes of projects
+    that no longer exist are dropped. The caller commits.
+
+    Args:
+        db: Database session.
+        added: (user_id, project_id, liked_at) of likes to add.
+        removed: (user_id, project_id) of likes to remove.
+
+    Returns:
+        IDs of projects whose likes changed.
+    """
+    added = list(added)
+    removed = list(removed)
+    table = models.Like.__table__
+
+    inserted: List[Row] = []
+    if added:
+        existing = set(db.scalars(
+            select(models.Project.id).where(models.Project.id.in_({row[1] for row in added}))
+        ))
+        values = [
+            {"user_id": user_id, "project_id": project_id, "created_at": liked_at}
+            for user_id, project_id, liked_at in added
+            if project_id in existing
+        ]
+        if values:
+            inserted = db.execute(
+                _insert(db)(table)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=["user_id", "project_id"])
+                .returning(table.c.project_id, table.c.created_at)
+            ).all()
+
+    deleted: List[Row] = []
+    if removed:
+        deleted = db.execute(
+            delete(models.Like)
+            .where(tuple_(models.Like.user_id, models.Like.project_id).in_(removed))
+            .returning(models.Like.project_id, models.Like.created_at)
+            .execution_options(synchronize_session=False)
+        ).all()
+
+    deltas: Counter = Counter()
+    added_events: Dict[int, List[float]] = defaultdict(list)
+    removed_events: Dict[int, List[float]] = defaultdict(list)
+    for project_id, liked_at in inserted:
+        deltas[project_id] += 1
+        added_events[project_id].append(trending.event_score(trending.LIKE_WEIGHT, liked_at))
+    for project_id, liked_at in deleted:
+        deltas[project_id] -= 1
+        removed_events[project_id].append(trending.event_score(trending.LIKE_WEIGHT, liked_at))
+
+    for project_id in added_events.keys() | removed_events.keys():
+        score = None
+        if project_id in added_events:
+            score = trending.added_score(reduce(trending.log_add_exp, added_events[project_id]))
+        if project_id in removed_events:
+            score = trending.retracted_score(reduce(trending.log_add_exp, removed_events[project_id]), score)
+        counters.adjust_counters(db, project_id, likes=deltas[project_id], trending_score=score)
+
+    return {row[0] for row in inserted} | {row[0] for row in deleted}
@@ -5,9 +5,9 @@ Contains SQLAlchemy ORM models for projects, likes, and reviews.
 """
 
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Float, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapped
 
 from database.connection import Base
@@ -27,12 +27,26 @@ class Project(Base):
         project_url: Link to the project.
         user_id: Foreign key to owner user.
         created_at: Timestamp of project creation.
+        likes_count: Denormalized number of likes.
+        reviews_count: Denormalized number of reviews.
+        rating_total: Denormalized sum of review ratings.
+        version: Incremented on every change to the project, its likes or
+            its reviews; used to build HTTP cache validators.
+        trending_score: Log-space time-decayed popularity (see
+            projects.trending).
         user: Relationship to project owner.
         likes: Relationship to project likes.
         reviews: Relationship to project reviews.
     """
     
     __tablename__ = "projects"
+    __table_args__ = (
+        Index('ix_projects_created_at_id', 'created_at', 'id'),
+        Index('ix_projects_likes_count_created_at_id', 'likes_count', 'created_at', 'id'),
+        Index('ix_projects_reviews_count_created_at_id', 'reviews_count', 'created_at', 'id'),
+        Index('ix_projects_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_projects_trending_score_id', 'trending_score', 'id'),
+    )
     
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
     title: Mapped[str] = Column(String, nullable=False)
@@ -40,6 +54,11 @@ class Project(Base):
     project_url: Mapped[str] = Column(String, nullable=False)
     user_id: Mapped[int] = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at: Mapped[datetime] = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    likes_count: Mapped[int] = Column(Integer, nullable=False, default=0, server_default="0")
+    reviews_count: Mapped[int] = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_total: Mapped[int] = Column(Integer, nullable=False, default=0, server_default="0")
+    version: Mapped[int] = Column(Integer, nullable=False, default=1, server_default="1")
+    trending_score: Mapped[float] = Column(Float, nullable=False, default=0.0, server_default="0")
     
     user: Mapped["User"] = relationship("User", back_populates="projects")
     likes: Mapped[List["Like"]] = relationship("Like", back_populates="project", cascade="all, delete-orphan")
@@ -60,6 +79,7 @@ class Like(Base):
     __tablename__ = "likes"
     __table_args__ = (
         UniqueConstraint('user_id', 'project_id', name='unique_user_project_like'),
+        Index('ix_likes_project_id_created_at', 'project_id', 'created_at'),
     )
     
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
@@ -87,6 +107,7 @@ class Review(Base):
     __tablename__ = "reviews"
     __table_args__ = (
         UniqueConstraint('user_id', 'project_id', name='unique_user_project_review'),
+        Index('ix_reviews_project_id_created_at_id', 'project_id', 'created_at', 'id'),
     )
     
     id: Mapped[int] = Column(Integer, primary_key=True, index=True)
@@ -98,3 +119,20 @@ class Review(Base):
     
     user: Mapped["User"] = relationship("User")
     project: Mapped["Project"] = relationship("Project", back_populates="reviews")
+
+
+class AnalyticsSnapshot(Base):
+    """
+    Precomputed analytics payload served by the analytics endpoint.
+    
+    Attributes:
+        id: Primary key identifier (a single row with id 1 is used).
+        payload: Serialized analytics response.
+        refreshed_at: UTC timestamp of the last refresh.
+    """
+    
+    __tablename__ = "analytics_snapshots"
+    
+    id: Mapped[int] = Column(Integer, primary_key=True)
+    payload: Mapped[str] = Column(Text, nullable=False)
+    refreshed_at: Mapped[datetime] = Column(DateTime, nullable=False)
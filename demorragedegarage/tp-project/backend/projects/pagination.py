@@ -0,0 +1,146 @@
+"""
+Keyset pagination helpers.
+
+Provides opaque cursor encoding and keyset predicates so that listing
+endpoints page through rows in constant time regardless of table size.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, Type
+
+from sqlalchemy import ColumnElement, Select, tuple_
+
+DEFAULT_PAGE_SIZE: int = 20
+MAX_PAGE_SIZE: int = 100
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def _encode_value(value: Any) -> Any:
+    """Convert a sort key value into a JSON-compatible form."""
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """Restore a sort key value encoded by _encode_value."""
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page into an opaque token.
+
+    Args:
+        sort: Sort mode the cursor belongs to.
+        values: Sort key values of the last returned row.
+
+    Returns:
+        URL-safe cursor string.
+    """
+    payload = {"s": sort, "k": [_encode_value(value) for value in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _matches_type(value: Any, key_type: Type) -> bool:
+    """Check a decoded value against the Python type of its sort key."""
+    if isinstance(value, bool):
+        return False
+    if key_type is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, key_type)
+
+
+def decode_cursor(cursor: str, sort: str, key_types: Sequence[Type]) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor token.
+        sort: Sort mode of the current request.
+        key_types: Python type of each sort key (datetime, int or float).
+
+    Returns:
+        Sort key values of the last row of the previous page.
+
+    Raises:
+        InvalidCursorError: If the token is malformed, was issued for
+            a different sort mode, or holds a value of the wrong type.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_decode_value(value) for value in payload["k"]]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+    if payload.get("s") != sort or len(values) != len(key_types):
+        raise InvalidCursorError("Cursor does not match sort order")
+    if not all(_matches_type(value, key_type) for value, key_type in zip(values, key_types)):
+        raise InvalidCursorError("Cursor value does not match sort key type")
+    return values
+
+
+def paginate(
+    statement: Select,
+    sort: str,
+    keys: Sequence[ColumnElement],
+    cursor: Optional[str],
+    limit: int
+) -> Select:
+    """
+    Apply descending keyset ordering, cursor predicate and limit.
+
+    One extra row is requested so the caller can tell whether a next
+    page exists without issuing a separate count query.
+
+    Args:
+        statement: Base SELECT statement.
+        sort: Sort mode name, embedded in issued cursors.
+        keys: Sort key expressions, most significant first.
+        cursor: Cursor from a previous page, if any.
+        limit: Page size.
+
+    Returns:
+        Paginated SELECT statement.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    if cursor:
+        values = decode_cursor(cursor, sort, [key.type.python_type for key in keys])
+        statement = statement.where(tuple_(*keys) < tuple_(*values))
+    return statement.order_by(*[key.desc() for key in keys]).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[Any],
+    sort: str,
+    key_names: Sequence[str],
+    limit: int
+) -> Tuple[Sequence[Any], Optional[str]]:
+    """
+    Trim the look-ahead row and build the cursor for the next page.
+
+    Args:
+        rows: Rows returned by a statement built with paginate.
+        sort: Sort mode name.
+        key_names: Row attribute names matching the sort keys.
+        limit: Requested page size.
+
+    Returns:
+        Tuple of page rows and the next cursor (None on the last page).
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last = page[-1]
+    return page, encode_cursor(sort, [getattr(last, name) for name in key_names])
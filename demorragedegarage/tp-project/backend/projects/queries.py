@@ -0,0 +1,308 @@
+"""
+Project query builders.
+
+Contains SELECT statements shared by the project endpoints, so that
+listings are served from a single round trip instead of per-row lookups.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from auth import models as auth_models
+from projects import counters, models, pagination, schemas
+
+PROJECT_SORT_KEYS: Dict[schemas.ProjectSort, Tuple[str, ...]] = {
+    schemas.ProjectSort.newest: ("created_at", "id"),
+    schemas.ProjectSort.most_liked: ("likes_count", "created_at", "id"),
+    schemas.ProjectSort.most_reviewed: ("reviews_count", "created_at", "id"),
+    schemas.ProjectSort.trending: ("trending_score", "id"),
+}
+
+
+def project_listing_query() -> Select:
+    """
+    Build the project listing statement.
+
+    Joins each project to its owner and reads the denormalized like/review
+    counters, so the whole listing is resolved by one indexed query.
+
+    Returns:
+        SELECT statement yielding project columns, owner username and counts.
+    """
+    return (
+        select(
+            models.Project.id,
+            models.Project.title,
+            models.Project.description,
+            models.Project.project_url,
+            models.Project.user_id,
+            models.Project.created_at,
+            auth_models.User.username,
+            models.Project.likes_count,
+            models.Project.reviews_count,
+            models.Project.rating_total,
+            models.Project.version,
+            models.Project.trending_score,
+        )
+        .join(auth_models.User, auth_models.User.id == models.Project.user_id)
+    )
+
+
+def row_to_project_with_user(row: Mapping[str, Any]) -> schemas.ProjectWithUser:
+    """
+    Convert a listing record into a response schema.
+
+    Args:
+        row: Column mapping of a row produced by project_listing_query.
+
+    Returns:
+        Project data with owner username and counts.
+    """
+    return schemas.ProjectWithUser(
+        id=row["id"],
+        title=row["title"],
+        description=row["description"],
+        project_url=row["project_url"],
+        user_id=row["user_id"],
+        created_at=row["created_at"],
+        username=row["username"],
+        likes_count=row["likes_count"],
+        reviews_count=row["reviews_count"],
+        average_rating=counters.average_rating(row["reviews_count"], row["rating_total"])
+    )
+
+
+def fetch_project(db: Session, project_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the listing record of a single project.
+
+    Args:
+        db: Database session.
+        project_id: Project ID.
+
+    Returns:
+        Column mapping of the project row, or None if it does not exist.
+    """
+    row = db.execute(
+        project_listing_query().where(models.Project.id == project_id)
+    ).first()
+    return None if row is None else dict(row._mapping)
+
+
+def fetch_projects(db: Session, project_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetch the listing records of several projects with one IN query.
+
+    Args:
+        db: Database session.
+        project_ids: Project IDs.
+
+    Returns:
+        Column mappings keyed by project ID; missing projects are left out.
+    """
+    project_ids = set(project_ids)
+    if not project_ids:
+        return {}
+    rows = db.execute(
+        project_listing_query().where(models.Project.id.in_(project_ids))
+    ).all()
+    return {row.id: dict(row._mapping) for row in rows}
+
+
+def liked_project_ids(db: Session, user_id: int, project_ids: Iterable[int]) -> Set[int]:
+    """
+    Find which of the given projects a user has liked.
+
+    Resolved with one IN query served by the (user_id, project_id) unique index.
+
+    Args:
+        db: Database session.
+        user_id: User ID.
+        project_ids: Candidate project IDs.
+
+    Returns:
+        Set of liked project IDs.
+    """
+    project_ids = set(project_ids)
+    if not project_ids:
+        return set()
+    return set(db.scalars(
+        select(models.Like.project_id).where(
+            models.Like.user_id == user_id,
+            models.Like.project_id.in_(project_ids)
+        )
+    ))
+
+
+def fetch_projects_page(
+    db: Session,
+    sort: schemas.ProjectSort,
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Fetch the records of one keyset page of projects.
+
+    Args:
+        db: Database session.
+        sort: Listing order.
+        cursor: Cursor returned with the previous page, if any.
+        limit: Page size.
+
+    Returns:
+        Column mappings of the page's rows and the cursor for the next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    statement = project_listing_query()
+    key_names = PROJECT_SORT_KEYS[sort]
+    keys = [statement.selected_columns[name] for name in key_names]
+    statement = pagination.paginate(statement, sort.value, keys, cursor, limit)
+
+    rows, next_cursor = pagination.split_page(
+        db.execute(statement).all(), sort.value, key_names, limit
+    )
+    return [dict(row._mapping) for row in rows], next_cursor
+
+
+def iter_projects(
+    db: Session,
+    sort: schemas.ProjectSort,
+    limit: Optional[int] = None,
+    chunk_rows: int = 1000
+) -> Iterator[Mapping[str, Any]]:
+    """
+    Iterate over the whole listing in sort order without buffering it.
+
+    Rows are fetched through a server-side cursor chunk_rows at a time, so
+    memory use does not grow with the number of projects.
+
+    Args:
+        db: Database session.
+        sort: Listing order.
+        limit: Maximum number of projects, if any.
+        chunk_rows: Rows fetched per round trip.
+
+    Yields:
+        Column mappings of listing rows.
+    """
+    statement = project_listing_query()
+    statement = statement.order_by(
+        *[statement.selected_columns[name].desc() for name in PROJECT_SORT_KEYS[sort]]
+    )
+    if limit is not None:
+        statement = statement.limit(limit)
+    for row in db.execute(statement.execution_options(yield_per=chunk_rows)):
+        yield row._mapping
+
+
+def list_user_projects_page(
+    db: Session,
+    user_id: int,
+    cursor: Optional[str],
+    limit: int
+) -> schemas.Page[schemas.ProjectResponse]:
+    """
+    Load one keyset page of a user's projects, newest first.
+
+    Args:
+        db: Database session.
+        user_id: Owner user ID.
+        cursor: Cursor returned with the previous page, if any.
+        limit: Page size.
+
+    Returns:
+        Page of projects and the cursor for the next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    sort = schemas.ProjectSort.newest.value
+    statement = pagination.paginate(
+        select(models.Project).where(models.Project.user_id == user_id),
+        sort,
+        [models.Project.created_at, models.Project.id],
+        cursor,
+        limit
+    )
+
+    projects, next_cursor = pagination.split_page(
+        db.scalars(statement).all(), sort, ("created_at", "id"), limit
+    )
+    return schemas.Page[schemas.ProjectResponse](
+        items=[
+            schemas.ProjectResponse(
+                id=project.id,
+                title=project.title,
+                description=project.description,
+                project_url=project.project_url,
+                user_id=project.user_id,
+                created_at=project.created_at
+            )
+            for project in projects
+        ],
+        next_cursor=next_cursor
+    )
+
+
+def list_reviews_page(
+    db: Session,
+    project_id: int,
+    cursor: Optional[str],
+    limit: int
+) -> schemas.Page[schemas.ReviewResponse]:
+    """
+    Load one keyset page of a project's reviews, newest first.
+
+    Args:
+        db: Database session.
+        project_id: Reviewed project ID.
+        cursor: Cursor returned with the previous page, if any.
+        limit: Page size.
+
+    Returns:
+        Page of reviews with author usernames and the next cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    sort = schemas.ProjectSort.newest.value
+    statement = pagination.paginate(
+        select(
+            models.Review.id,
+            models.Review.user_id,
+            models.Review.project_id,
+            models.Review.content,
+            models.Review.rating,
+            models.Review.created_at,
+            auth_models.User.username
+        )
+        .join(auth_models.User, auth_models.User.id == models.Review.user_id)
+        .where(models.Review.project_id == project_id),
+        sort,
+        [models.Review.created_at, models.Review.id],
+        cursor,
+        limit
+    )
+
+    rows, next_cursor = pagination.split_page(
+        db.execute(statement).all(), sort, ("created_at", "id"), limit
+    )
+    return schemas.Page[schemas.ReviewResponse](
+        items=[
+            schemas.ReviewResponse(
+                id=row.id,
+                user_id=row.user_id,
+                project_id=row.project_id,
+                content=row.content,
+                rating=row.rating,
+                created_at=row.created_at,
+                username=row.username
+            )
+            for row in rows
+        ],
+        next_cursor=next_cursor
+    )
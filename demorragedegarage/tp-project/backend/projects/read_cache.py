@@ -0,0 +1,161 @@
+"""
+Read-through cache for project reads.
+
+Serves project detail records and anonymous listing pages from the configured
+cache backend. Detail entries are keyed by project ID and dropped when that
+project changes. Listing pages only store the IDs of their rows, for
+LISTING_CACHE_TTL_SECONDS, and are hydrated from the detail entries; a like
+or review therefore shows up in every cached page at once without flushing
+any of them, and only the page order may lag by the listing TTL. Creating a
+project bumps the generation of the sorts it can enter at the top (newest and
+trending), which retires just those pages. Writes invalidate after
+committing, so a read racing a write can at worst cache a stale entry for
+CACHE_TTL_SECONDS.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from cache.backends import CacheBackend, create_cache
+from config import settings
+from projects import queries, schemas
+
+LISTING_GENERATION_KEY: str = "projects:generation"
+
+CREATE_SORTS: Tuple[schemas.ProjectSort, ...] = (
+    schemas.ProjectSort.newest,
+    schemas.ProjectSort.trending,
+)
+
+project_cache: CacheBackend = create_cache()
+
+
+def project_key(project_id: int) -> str:
+    """Return the cache key of a project detail record."""
+    return f"project:{project_id}"
+
+
+def generation_key(sort: schemas.ProjectSort) -> str:
+    """Return the key of the generation counter of one listing order."""
+    return f"{LISTING_GENERATION_KEY}:{sort.value}"
+
+
+def listing_key(sort: schemas.ProjectSort, cursor: Optional[str], limit: int) -> str:
+    """Return the cache key of a listing page in its sort's current generation."""
+    generation = project_cache.get(generation_key(sort)) or 0
+    return f"projects:{generation}:{sort.value}:{limit}:{cursor or ''}"
+
+
+def get_project(db: Session, project_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Load a project's listing record, from the cache when possible.
+
+    Args:
+        db: Database session, used only on a cache miss.
+        project_id: Project ID.
+
+    Returns:
+        Column mapping of the project, or None if it does not exist.
+    """
+    key = project_key(project_id)
+    record = project_cache.get(key)
+    if record is None:
+        record = queries.fetch_project(db, project_id)
+        if record is not None:
+            project_cache.set(key, record)
+    return record
+
+
+def get_projects_page(
+    db: Session,
+    sort: schemas.ProjectSort,
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Load the records of one listing page, from the cache when possible.
+
+    Args:
+        db: Database session, used only on a cache miss.
+        sort: Listing order.
+        cursor: Cursor returned with the previous page, if any.
+        limit: Page size.
+
+    Returns:
+        Column mappings of the page's rows and the cursor for the next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    key = listing_key(sort, cursor, limit)
+    page = project_cache.get(key)
+    if page is not None:
+        project_ids, next_cursor = page
+        return hydrate(db, project_ids), next_cursor
+    
+    rows, next_cursor = queries.fetch_projects_page(db, sort, cursor, limit)
+    for row in rows:
+        project_cache.set(project_key(row["id"]), row)
+    project_cache.set(
+        key,
+        ([row["id"] for row in rows], next_cursor),
+        settings.LISTING_CACHE_TTL_SECONDS
+    )
+    return rows, next_cursor
+
+
+def hydrate(db: Session, project_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Load the records of a cached page's rows, fetching misses in one query.
+
+    Args:
+        db: Database session, used only for records missing from the cache.
+        project_ids: Project IDs in page order.
+
+    Returns:
+        Column mappings in page order; projects that no longer exist are
+        left out.
+    """
+    records = {}
+    missing = []
+    for project_id in project_ids:
+        record = project_cache.get(project_key(project_id))
+        if record is None:
+            missing.append(project_id)
+        else:
+            records[project_id] = record
+    
+    for project_id, record in queries.fetch_projects(db, missing).items():
+        project_cache.set(project_key(project_id), record)
+        records[project_id] = record
+    return [records[project_id] for project_id in project_ids if project_id in records]
+
+
+def invalidate_listings(
+    sorts: Tuple[schemas.ProjectSort, ...] = CREATE_SORTS
+) -> None:
+    """
+    Retire the cached listing pages of some orders.
+
+    Args:
+        sorts: Orders whose pages are retired; defaults to those a newly
+            created project enters at the top.
+    """
+    for sort in sorts:
+        project_cache.incr(generation_key(sort))
+
+
+def invalidate_project(project_id: int) -> None:
+    """
+    Drop cached data affected by a change to one project.
+
+    Args:
+        project_id: Changed project ID.
+    """
+    project_cache.delete(project_key(project_id))
+
+
+def invalidate_all() -> None:
+    """Drop every cached project read (e.g. after bulk counter repairs)."""
+    project_cache.clear()
@@ -4,45 +4,63 @@ Projects router module.
 Provides API endpoints for project CRUD, likes, reviews, and analytics.
 """
 
-from typing import List, Optional
+import io
+import secrets
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database.connection import get_db
-from auth import utils, models as auth_models
-from projects import models, schemas
+from database.connection import get_async_db, get_db
+from auth import token_cache
+from config import settings
+from projects import (
+    analytics, bulk, counters, http_cache, likes, models, pagination, queries, read_cache, schemas,
+    search, serialization, streaming, trending
+)
+from projects.like_buffer import like_buffer
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
-def get_authenticated_user(token: str, db: Session) -> auth_models.User:
+def get_authenticated_user(token: str, db: Session) -> token_cache.TokenIdentity:
     """
-    Validate token and return authenticated user.
+    Validate token and return the authenticated user's identity.
+    
+    Resolutions are cached per token, so repeated calls usually need no
+    database query.
     
     Args:
         token: JWT access token.
         db: Database session.
     
     Returns:
-        Authenticated user object.
+        Authenticated user identity (id, username, is_active).
     
     Raises:
-        HTTPException: If token is invalid or user not found.
+        HTTPException: If token is invalid, user not found or inactive.
     """
-    username: Optional[str] = utils.verify_token(token)
-    if username is None:
+    try:
+        user = token_cache.resolve_token(token, db)
+    except token_cache.UnknownUserError:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
         )
     
-    user = db.query(auth_models.User).filter(auth_models.User.username == username).first()
     if user is None:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token"
+        )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user"
         )
     return user
 
@@ -66,16 +84,28 @@ def create_project(
     """
     user = get_authenticated_user(token, db)
     
+    created_at = datetime.now(timezone.utc)
     db_project = models.Project(
         title=project.title,
         description=project.description,
         project_url=project.project_url,
-        user_id=user.id
+        user_id=user.id,
+        created_at=created_at,
+        trending_score=trending.event_score(trending.CREATE_WEIGHT, created_at)
     )
     
     db.add(db_project)
+    db.flush()
+    counters.note_counters(db, {
+        "id": db_project.id,
+        "likes_count": db_project.likes_count,
+        "reviews_count": db_project.reviews_count,
+        "rating_total": db_project.rating_total,
+        "version": db_project.version
+    })
     db.commit()
     db.refresh(db_project)
+    read_cache.invalidate_listings()
     
     return schemas.ProjectResponse(
         id=db_project.id,
@@ -87,110 +117,453 @@ def create_project(
     )
 
 
-@router.get("/", response_model=List[schemas.ProjectWithUser])
-def get_projects(db: Session = Depends(get_db)) -> List[schemas.ProjectWithUser]:
+def invalid_cursor() -> HTTPException:
+    """
+    Build the error returned for an undecodable pagination cursor.
+    
+    Returns:
+        HTTP 400 exception.
+    """
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+
+
+def viewer_liked_ids(db: Session, user_id: int, project_ids: Iterable[int]) -> Set[int]:
+    """
+    Find which projects a user likes, including changes not yet flushed.
+    
+    Args:
+        db: Database session.
+        user_id: Viewer's user ID.
+        project_ids: Candidate project IDs.
+    
+    Returns:
+        Set of liked project IDs.
+    """
+    project_ids = list(project_ids)
+    liked = queries.liked_project_ids(db, user_id, project_ids)
+    return like_buffer.overlay(user_id, liked, project_ids)
+
+
+def buffer_like_change(
+    db: Session,
+    response: Response,
+    user_id: int,
+    project_id: int,
+    liked: bool
+) -> schemas.LikeStatus:
     """
-    Get all projects with user info and stats.
+    Queue a like or unlike in the write-behind buffer.
+    
+    The project is looked up through the read cache, so a burst of likes on
+    one project does not touch the database until the buffer flushes.
     
     Args:
         db: Database session.
+        response: Response whose status is set to 202 Accepted.
+        user_id: User ID.
+        project_id: Project ID.
+        liked: Desired like state.
     
     Returns:
-        List of projects with owner username and counts.
-    """
-    projects = db.query(models.Project).join(auth_models.User).all()
-    result: List[schemas.ProjectWithUser] = []
-    for project in projects:
-        likes_count = db.query(func.count(models.Like.id)).filter(
-            models.Like.project_id == project.id
-        ).scalar() or 0
-        reviews_count = db.query(func.count(models.Review.id)).filter(
-            models.Review.project_id == project.id
-        ).scalar() or 0
-        
-        project_data = schemas.ProjectWithUser(
-            id=project.id,
-            title=project.title,
-            description=project.description,
-            project_url=project.project_url,
-            user_id=project.user_id,
-            created_at=project.created_at,
-            username=project.user.username,
-            likes_count=likes_count,
-            reviews_count=reviews_count
+        Like state of the project after the change.
+    
+    Raises:
+        HTTPException: If project not found.
+    """
+    if read_cache.get_project(db, project_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
         )
-        result.append(project_data)
-    return result
+    like_buffer.enqueue(user_id, project_id, liked)
+    response.status_code = status.HTTP_202_ACCEPTED
+    return schemas.LikeStatus(project_id=project_id, liked=liked)
 
 
-@router.get("/my", response_model=List[schemas.ProjectResponse])
-def get_my_projects(token: str, db: Session = Depends(get_db)) -> List[schemas.ProjectResponse]:
+def load_projects_page(
+    db: Session,
+    sort: schemas.ProjectSort,
+    cursor: Optional[str],
+    limit: int,
+    token: Optional[str]
+) -> Tuple[Optional[int], List[Dict[str, Any]], Optional[str], Optional[Set[int]]]:
     """
-    Get current user's projects.
+    Resolve the viewer and load a listing page with their liked flags.
+    
+    Args:
+        db: Database session.
+        sort: Listing order.
+        cursor: Cursor from the previous page.
+        limit: Page size.
+        token: Optional JWT access token.
+    
+    Returns:
+        Viewer's user ID (None when anonymous), the page's rows, the cursor
+        for the next page, and the IDs of the rows the viewer likes (None
+        when anonymous).
+    
+    Raises:
+        HTTPException: If the token is invalid.
+        InvalidCursorError: If the cursor is invalid.
+    """
+    viewer_id = get_authenticated_user(token, db).id if token else None
+    rows, next_cursor = read_cache.get_projects_page(db, sort, cursor, limit)
+    
+    liked = None
+    if viewer_id is not None:
+        liked = viewer_liked_ids(db, viewer_id, (row["id"] for row in rows))
+    return viewer_id, rows, next_cursor, liked
+
+
+@router.get("/", response_model=schemas.Page[schemas.ProjectWithUser])
+async def get_projects(
+    request: Request,
+    sort: schemas.ProjectSort = schemas.ProjectSort.newest,
+    cursor: Optional[str] = None,
+    limit: int = Query(pagination.DEFAULT_PAGE_SIZE, ge=1, le=pagination.MAX_PAGE_SIZE),
+    token: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+) -> Union[schemas.Page[schemas.ProjectWithUser], Response]:
+    """
+    Get a page of projects with user info and stats.
+    
+    Runs on the event loop with the async engine, so listing traffic is not
+    bounded by the request threadpool. Page rows come from the read-through
+    cache; liked_by_me is resolved per viewer. The ETag is derived from the IDs and versions of the page's
+    projects, so a matching If-None-Match is answered with 304 before the
+    page is serialized. Anonymous pages are publicly cacheable.
+    
+    The body is built straight from the cached rows and encoded with
+    orjson, skipping the Pydantic model round trip.
+    
+    Args:
+        request: Incoming request.
+        sort: Listing order.
+        cursor: Cursor from the previous page.
+        limit: Page size.
+        token: Optional JWT access token; when present, items carry liked_by_me.
+        db: Database session.
+    
+    Returns:
+        Page of projects with owner username and counts, or 304.
+    
+    Raises:
+        HTTPException: If the token or cursor is invalid.
+    """
+    try:
+        viewer_id, rows, next_cursor, liked = await db.run_sync(
+            load_projects_page, sort, cursor, limit, token
+        )
+    except pagination.InvalidCursorError:
+        raise invalid_cursor()
+    
+    etag = http_cache.make_etag(
+        "projects", sort.value, cursor, limit, next_cursor,
+        [(row["id"], row["version"]) for row in rows],
+        viewer_id, sorted(liked) if liked is not None else None
+    )
+    private = viewer_id is not None
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified(etag, private)
+    
+    return serialization.FastJSONResponse(
+        serialization.projects_page(rows, next_cursor, liked),
+        headers=http_cache.cache_headers(etag, private)
+    )
+
+
+@router.get("/my", response_model=schemas.Page[schemas.ProjectResponse])
+def get_my_projects(
+    token: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(pagination.DEFAULT_PAGE_SIZE, ge=1, le=pagination.MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+) -> schemas.Page[schemas.ProjectResponse]:
+    """
+    Get a page of the current user's projects, newest first.
     
     Args:
         token: JWT access token.
+        cursor: Cursor from the previous page.
+        limit: Page size.
         db: Database session.
     
     Returns:
-        List of user's projects.
+        Page of user's projects.
+    
+    Raises:
+        HTTPException: If the token or cursor is invalid.
     """
     user = get_authenticated_user(token, db)
     
-    projects = db.query(models.Project).filter(models.Project.user_id == user.id).all()
-    result: List[schemas.ProjectResponse] = []
-    for project in projects:
-        project_data = schemas.ProjectResponse(
-            id=project.id,
-            title=project.title,
-            description=project.description,
-            project_url=project.project_url,
-            user_id=project.user_id,
-            created_at=project.created_at
+    try:
+        return queries.list_user_projects_page(db, user.id, cursor, limit)
+    except pagination.InvalidCursorError:
+        raise invalid_cursor()
+
+
+def stream_with_session(db: Session, chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Yield response chunks produced with a request's session, then close it.
+    
+    The get_db dependency closes the session before a streaming body is
+    sent; a closed session transparently reconnects on use, so it has to be
+    closed again once the body is complete.
+    
+    Args:
+        db: Request database session.
+        chunks: Body chunks that query through db.
+    
+    Yields:
+        The chunks, unchanged.
+    """
+    try:
+        yield from chunks
+    finally:
+        db.close()
+
+
+@router.get("/stream")
+def stream_projects(
+    sort: schemas.ProjectSort = schemas.ProjectSort.newest,
+    format: schemas.StreamFormat = schemas.StreamFormat.ndjson,
+    limit: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Stream the whole project listing for export-style consumers.
+    
+    Rows are read through a server-side cursor and serialized as they
+    arrive, so memory stays flat and the first bytes go out immediately.
+    
+    Args:
+        sort: Listing order.
+        format: NDJSON lines or one chunked JSON array.
+        limit: Maximum number of projects, if any.
+        db: Database session.
+    
+    Returns:
+        Streaming response with projects, owner usernames and counts.
+    """
+    rows = queries.iter_projects(db, sort, limit)
+    return StreamingResponse(
+        stream_with_session(db, streaming.encode(rows, format)),
+        media_type=streaming.MEDIA_TYPES[format]
+    )
+
+
+@router.get("/trending", response_model=schemas.Page[schemas.ProjectWithUser])
+async def get_trending_projects(
+    request: Request,
+    cursor: Optional[str] = None,
+    limit: int = Query(pagination.DEFAULT_PAGE_SIZE, ge=1, le=pagination.MAX_PAGE_SIZE),
+    token: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+) -> Union[schemas.Page[schemas.ProjectWithUser], Response]:
+    """
+    Get a page of projects ordered by time-decayed popularity.
+    
+    Equivalent to the listing with sort=trending.
+    
+    Args:
+        request: Incoming request.
+        cursor: Cursor from the previous page.
+        limit: Page size.
+        token: Optional JWT access token; when present, items carry liked_by_me.
+        db: Database session.
+    
+    Returns:
+        Page of trending projects, or 304.
+    
+    Raises:
+        HTTPException: If the token or cursor is invalid.
+    """
+    return await get_projects(
+        request,
+        sort=schemas.ProjectSort.trending,
+        cursor=cursor,
+        limit=limit,
+        token=token,
+        db=db
+    )
+
+
+@router.get("/search", response_model=schemas.Page[schemas.ProjectWithUser])
+def search_projects(
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(pagination.DEFAULT_PAGE_SIZE, ge=1, le=pagination.MAX_PAGE_SIZE),
+    db: Session = Depends(get_db)
+) -> schemas.Page[schemas.ProjectWithUser]:
+    """
+    Search projects by title and description, best match first.
+    
+    Args:
+        q: Search text; all words must match.
+        cursor: Cursor from the previous page.
+        limit: Page size.
+        db: Database session.
+    
+    Returns:
+        Page of matching projects with owner username and counts.
+    
+    Raises:
+        HTTPException: If the cursor is invalid.
+    """
+    try:
+        return search.search_projects(db, q, cursor, limit)
+    except pagination.InvalidCursorError:
+        raise invalid_cursor()
+
+
+@router.post("/liked", response_model=schemas.LikedResponse)
+def get_liked_projects(
+    request: schemas.LikedRequest,
+    token: str,
+    db: Session = Depends(get_db)
+) -> schemas.LikedResponse:
+    """
+    Check which of several projects the current user liked.
+    
+    Args:
+        request: Project IDs to check.
+        token: JWT access token.
+        db: Database session.
+    
+    Returns:
+        IDs of the requested projects that are liked.
+    """
+    user = get_authenticated_user(token, db)
+    
+    liked = viewer_liked_ids(db, user.id, request.project_ids)
+    return schemas.LikedResponse(project_ids=sorted(liked))
+
+
+BULK_MEDIA_TYPES = {
+    schemas.BulkFormat.ndjson: "application/x-ndjson",
+    schemas.BulkFormat.csv: "text/csv",
+}
+
+
+def require_admin_key(x_admin_key: Optional[str] = Header(None)) -> None:
+    """
+    Guard bulk endpoints with the ADMIN_API_KEY shared secret.
+    
+    Args:
+        x_admin_key: Value of the X-Admin-Key header.
+    
+    Raises:
+        HTTPException: If bulk access is disabled or the key does not match.
+    """
+    if not settings.ADMIN_API_KEY or not x_admin_key or not secrets.compare_digest(
+        x_admin_key, settings.ADMIN_API_KEY
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin key required"
         )
-        result.append(project_data)
-    return result
+
+
+@router.post(
+    "/bulk/{entity}",
+    response_model=schemas.BulkImportReport,
+    dependencies=[Depends(require_admin_key)]
+)
+def import_bulk(
+    entity: schemas.BulkEntity,
+    file: UploadFile = File(...),
+    format: Optional[schemas.BulkFormat] = None,
+    db: Session = Depends(get_db)
+) -> schemas.BulkImportReport:
+    """
+    Import projects, likes or reviews from an NDJSON or CSV upload.
+    
+    Args:
+        entity: Record type.
+        file: Uploaded file; the format defaults to CSV for *.csv names and
+            NDJSON otherwise.
+        format: Explicit file format.
+        db: Database session.
+    
+    Returns:
+        Counts of inserted, skipped and failed rows with per-row errors.
+    """
+    if format is None:
+        is_csv = (file.filename or "").lower().endswith(".csv")
+        format = schemas.BulkFormat.csv if is_csv else schemas.BulkFormat.ndjson
+    
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    try:
+        return bulk.import_records(db, entity, stream, format)
+    finally:
+        stream.detach()
+
+
+@router.get("/bulk/{entity}", dependencies=[Depends(require_admin_key)])
+def export_bulk(
+    entity: schemas.BulkEntity,
+    format: schemas.BulkFormat = schemas.BulkFormat.ndjson,
+    db: Session = Depends(get_db)
+) -> StreamingResponse:
+    """
+    Export all projects, likes or reviews as a streamed NDJSON or CSV file.
+    
+    Args:
+        entity: Record type.
+        format: Output format.
+        db: Database session.
+    
+    Returns:
+        Streaming response in import-compatible form.
+    """
+    return StreamingResponse(
+        stream_with_session(db, bulk.export_records(db, entity, format)),
+        media_type=BULK_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity.value}.{format.value}"'}
+    )
 
 
 @router.get("/{project_id}", response_model=schemas.ProjectWithUser)
-def get_project(project_id: int, db: Session = Depends(get_db)) -> schemas.ProjectWithUser:
+async def get_project(
+    project_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
+) -> Union[schemas.ProjectWithUser, Response]:
     """
     Get a single project by ID.
     
+    Runs on the event loop with the async engine and is served through the
+    read-through cache. The ETag is derived from the
+    project's version, which every like and review bumps.
+    
     Args:
         project_id: Project ID.
+        request: Incoming request.
         db: Database session.
     
     Returns:
-        Project data with owner and stats.
+        Project data with owner and stats, or 304.
     
     Raises:
         HTTPException: If project not found.
     """
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    if project is None:
+    row = await db.run_sync(read_cache.get_project, project_id)
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
     
-    likes_count = db.query(func.count(models.Like.id)).filter(
-        models.Like.project_id == project.id
-    ).scalar() or 0
-    reviews_count = db.query(func.count(models.Review.id)).filter(
-        models.Review.project_id == project.id
-    ).scalar() or 0
+    etag = http_cache.make_etag("project", row["id"], row["version"])
+    if http_cache.is_not_modified(request, etag):
+        return http_cache.not_modified(etag)
     
-    return schemas.ProjectWithUser(
-        id=project.id,
-        title=project.title,
-        description=project.description,
-        project_url=project.project_url,
-        user_id=project.user_id,
-        created_at=project.created_at,
-        username=project.user.username,
-        likes_count=likes_count,
-        reviews_count=reviews_count
+    return serialization.FastJSONResponse(
+        serialization.project_item(row),
+        headers=http_cache.cache_headers(etag)
     )
 
 
@@ -203,6 +576,12 @@ def like_project(
     """
     Like a project.
     
+    Runs as one INSERT ... ON CONFLICT DO NOTHING, so concurrent duplicate
+    likes cannot fail with an integrity error. Prefer the idempotent PUT.
+    The response carries the stored like, so with LIKE_WRITE_BEHIND the
+    user's buffered change to the project is committed first instead of
+    being applied after this like.
+    
     Args:
         project_id: Project ID to like.
         token: JWT access token.
@@ -212,78 +591,123 @@ def like_project(
         Created like data.
     
     Raises:
-        HTTPException: If already liked or project not found.
+        HTTPException: If already liked, project not found, or a buffered
+            change could not be committed.
     """
     user = get_authenticated_user(token, db)
     
-    project = db.query(models.Project).filter(models.Project.id == project_id).first()
-    if project is None:
+    if like_buffer.running and not like_buffer.settle(user.id, project_id):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Pending like change could not be saved"
         )
     
-    existing_like = db.query(models.Like).filter(
-        models.Like.user_id == user.id,
-        models.Like.project_id == project_id
-    ).first()
-    
-    if existing_like:
+    like = likes.add_like(db, user.id, project_id)
+    if like is None:
+        if not likes.project_exists(db, project_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found"
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Already liked this project"
         )
     
-    db_like = models.Like(user_id=user.id, project_id=project_id)
-    db.add(db_like)
     db.commit()
-    db.refresh(db_like)
+    read_cache.invalidate_project(project_id)
     
     return schemas.LikeResponse(
-        id=db_like.id,
-        user_id=db_like.user_id,
-        project_id=db_like.project_id,
-        created_at=db_like.created_at
+        id=like.id,
+        user_id=like.user_id,
+        project_id=like.project_id,
+        created_at=like.created_at
     )
 
 
-@router.delete("/{project_id}/like")
+@router.put("/{project_id}/like", response_model=schemas.LikeStatus)
+def put_like(
+    project_id: int,
+    token: str,
+    response: Response,
+    db: Session = Depends(get_db)
+) -> schemas.LikeStatus:
+    """
+    Idempotently like a project.
+    
+    Liking an already liked project succeeds without changing anything.
+    With LIKE_WRITE_BEHIND the like is buffered and 202 is returned.
+    
+    Args:
+        project_id: Project ID to like.
+        token: JWT access token.
+        response: Response whose status is set when the like is buffered.
+        db: Database session.
+    
+    Returns:
+        Like state of the project, which is always liked.
+    
+    Raises:
+        HTTPException: If project not found.
+    """
+    user = get_authenticated_user(token, db)
+    
+    if like_buffer.running:
+        return buffer_like_change(db, response, user.id, project_id, True)
+    
+    if likes.add_like(db, user.id, project_id) is not None:
+        db.commit()
+        read_cache.invalidate_project(project_id)
+    elif not likes.project_exists(db, project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+    
+    return schemas.LikeStatus(project_id=project_id, liked=True)
+
+
+@router.delete("/{project_id}/like", response_model=schemas.LikeStatus)
 def unlike_project(
     project_id: int,
     token: str,
+    response: Response,
     db: Session = Depends(get_db)
-) -> dict:
+) -> schemas.LikeStatus:
     """
-    Remove like from a project.
+    Idempotently remove a like from a project.
+    
+    Runs as one DELETE ... RETURNING; removing a like that does not exist
+    succeeds without changing anything. With LIKE_WRITE_BEHIND the change is
+    buffered and 202 is returned.
     
     Args:
         project_id: Project ID to unlike.
         token: JWT access token.
+        response: Response whose status is set when the change is buffered.
         db: Database session.
     
     Returns:
-        Success message.
+        Like state of the project, which is always not liked.
     
     Raises:
-        HTTPException: If like not found.
+        HTTPException: If project not found.
     """
     user = get_authenticated_user(token, db)
     
-    like = db.query(models.Like).filter(
-        models.Like.user_id == user.id,
-        models.Like.project_id == project_id
-    ).first()
+    if like_buffer.running:
+        return buffer_like_change(db, response, user.id, project_id, False)
     
-    if like is None:
+    if likes.remove_like(db, user.id, project_id):
+        db.commit()
+        read_cache.invalidate_project(project_id)
+    elif not likes.project_exists(db, project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Like not found"
+            detail="Project not found"
         )
     
-    db.delete(like)
-    db.commit()
-    
-    return {"message": "Like removed successfully"}
+    return schemas.LikeStatus(project_id=project_id, liked=False)
 
 
 @router.get("/{project_id}/liked", response_model=bool)
@@ -305,6 +729,10 @@ def check_liked(
     """
     user = get_authenticated_user(token, db)
     
+    pending = like_buffer.state(user.id, project_id)
+    if pending is not None:
+        return pending
+    
     like = db.query(models.Like).filter(
         models.Like.user_id == user.id,
         models.Like.project_id == project_id
@@ -355,15 +783,24 @@ def create_review(
             detail="Already reviewed this project"
         )
     
+    reviewed_at = datetime.now(timezone.utc)
     db_review = models.Review(
         user_id=user.id,
         project_id=project_id,
         content=review.content,
-        rating=review.rating
+        rating=review.rating,
+        created_at=reviewed_at
     )
     db.add(db_review)
+    counters.adjust_counters(
+        db, project_id, reviews=1, rating=review.rating,
+        trending_score=trending.added_score(
+            trending.event_score(trending.review_weight(review.rating), reviewed_at)
+        )
+    )
     db.commit()
     db.refresh(db_review)
+    read_cache.invalidate_project(project_id)
     
     return schemas.ReviewResponse(
         id=db_review.id,
@@ -376,82 +813,72 @@ def create_review(
     )
 
 
-@router.get("/{project_id}/reviews", response_model=List[schemas.ReviewResponse])
+@router.get("/{project_id}/reviews", response_model=schemas.Page[schemas.ReviewResponse])
 def get_project_reviews(
     project_id: int,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(pagination.DEFAULT_PAGE_SIZE, ge=1, le=pagination.MAX_PAGE_SIZE),
     db: Session = Depends(get_db)
-) -> List[schemas.ReviewResponse]:
+) -> Union[schemas.Page[schemas.ReviewResponse], Response]:
     """
-    Get all reviews for a project.
+    Get a page of reviews for a project, newest first.
+    
+    New reviews bump the project's version, so the ETag is checked with a
+    primary key lookup before the reviews themselves are loaded.
     
     Args:
         project_id: Project ID.
+        request: Incoming request.
+        response: Response whose caching headers are set.
+        cursor: Cursor from the previous page.
+        limit: Page size.
         db: Database session.
     
     Returns:
-        List of reviews.
+        Page of reviews, or 304.
+    
+    Raises:
+        HTTPException: If the cursor is invalid.
     """
-    reviews = db.query(models.Review).filter(
-        models.Review.project_id == project_id
-    ).all()
-    
-    result: List[schemas.ReviewResponse] = []
-    for review in reviews:
-        result.append(schemas.ReviewResponse(
-            id=review.id,
-            user_id=review.user_id,
-            project_id=review.project_id,
-            content=review.content,
-            rating=review.rating,
-            created_at=review.created_at,
-            username=review.user.username
-        ))
-    return result
+    version = db.scalar(
+        select(models.Project.version).where(models.Project.id == project_id)
+    )
+    etag = http_cache.make_etag("reviews", project_id, version, cursor, limit)
+    if http_cache.conditional(request, response, etag):
+        return http_cache.not_modified(etag)
+    
+    try:
+        return queries.list_reviews_page(db, project_id, cursor, limit)
+    except pagination.InvalidCursorError:
+        raise invalid_cursor()
 
 
 @router.get("/analytics/top", response_model=schemas.AnalyticsResponse)
-def get_analytics(db: Session = Depends(get_db)) -> schemas.AnalyticsResponse:
+def get_analytics(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+) -> Union[schemas.AnalyticsResponse, Response]:
     """
     Get platform analytics with top projects.
     
+    Served from the precomputed snapshot; the response reports when the
+    snapshot was generated and how stale it is. The ETag follows the
+    snapshot time and is weak, since stale_seconds differs per request.
+    
     Args:
+        request: Incoming request.
+        response: Response whose caching headers are set.
         db: Database session.
     
     Returns:
-        Analytics data with top projects and totals.
-    """
-    projects_with_likes = db.query(
-        models.Project,
-        func.count(models.Like.id).label('likes_count')
-    ).outerjoin(models.Like).group_by(models.Project.id).order_by(
-        func.count(models.Like.id).desc()
-    ).limit(10).all()
-    
-    top_projects: List[schemas.ProjectWithUser] = []
-    for project, likes_count in projects_with_likes:
-        reviews_count = db.query(func.count(models.Review.id)).filter(
-            models.Review.project_id == project.id
-        ).scalar() or 0
-        
-        top_projects.append(schemas.ProjectWithUser(
-            id=project.id,
-            title=project.title,
-            description=project.description,
-            project_url=project.project_url,
-            user_id=project.user_id,
-            created_at=project.created_at,
-            username=project.user.username,
-            likes_count=likes_count,
-            reviews_count=reviews_count
-        ))
-    
-    total_projects = db.query(func.count(models.Project.id)).scalar() or 0
-    total_likes = db.query(func.count(models.Like.id)).scalar() or 0
-    total_reviews = db.query(func.count(models.Review.id)).scalar() or 0
-    
-    return schemas.AnalyticsResponse(
-        top_projects=top_projects,
-        total_projects=total_projects,
-        total_likes=total_likes,
-        total_reviews=total_reviews
-    )
+        Analytics data with top projects and totals, or 304.
+    """
+    data = analytics.load_analytics(db, settings.ANALYTICS_SNAPSHOT_MAX_AGE_SECONDS)
+    
+    etag = http_cache.make_etag("analytics", data.generated_at, weak=True)
+    if http_cache.conditional(request, response, etag):
+        return http_cache.not_modified(etag)
+    return data
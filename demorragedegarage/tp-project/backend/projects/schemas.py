@@ -5,9 +5,12 @@ Contains request and response models for project-related endpoints.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from enum import Enum
+from typing import Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+T = TypeVar("T")
 
 
 class ProjectBase(BaseModel):
@@ -40,6 +43,31 @@ class ProjectWithUser(ProjectResponse):
     username: str
     likes_count: int = 0
     reviews_count: int = 0
+    average_rating: Optional[float] = None
+    liked_by_me: Optional[bool] = None
+
+
+class ProjectSort(str, Enum):
+    """Available orderings for project listings."""
+    
+    newest = "newest"
+    most_liked = "most_liked"
+    most_reviewed = "most_reviewed"
+    trending = "trending"
+
+
+class StreamFormat(str, Enum):
+    """Encodings for streamed listings."""
+    
+    ndjson = "ndjson"
+    json = "json"
+
+
+class Page(BaseModel, Generic[T]):
+    """Schema for a keyset-paginated list response."""
+    
+    items: List[T]
+    next_cursor: Optional[str] = None
 
 
 class LikeCreate(BaseModel):
@@ -59,6 +87,25 @@ class LikeResponse(BaseModel):
     created_at: datetime
 
 
+class LikedRequest(BaseModel):
+    """Schema for a batch liked-status request."""
+    
+    project_ids: List[int] = Field(max_length=100)
+
+
+class LikedResponse(BaseModel):
+    """Schema for the subset of requested projects liked by the user."""
+    
+    project_ids: List[int]
+
+
+class LikeStatus(BaseModel):
+    """Schema for the like state of a project after an idempotent write."""
+    
+    project_id: int
+    liked: bool
+
+
 class ReviewBase(BaseModel):
     """Base review schema with common fields."""
     
@@ -99,3 +146,60 @@ class AnalyticsResponse(BaseModel):
     total_projects: int
     total_likes: int
     total_reviews: int
+    generated_at: Optional[datetime] = None
+    stale_seconds: Optional[float] = None
+
+
+class BulkEntity(str, Enum):
+    """Record types supported by bulk import and export."""
+    
+    projects = "projects"
+    likes = "likes"
+    reviews = "reviews"
+
+
+class BulkFormat(str, Enum):
+    """File formats supported by bulk import and export."""
+    
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+class ProjectImport(ProjectCreate):
+    """Schema for one imported project; id is assigned when omitted."""
+    
+    id: Optional[int] = None
+    user_id: int
+    created_at: Optional[datetime] = None
+
+
+class LikeImport(LikeCreate):
+    """Schema for one imported like."""
+    
+    user_id: int
+    created_at: Optional[datetime] = None
+
+
+class ReviewImport(ReviewCreate):
+    """Schema for one imported review."""
+    
+    user_id: int
+    created_at: Optional[datetime] = None
+
+
+class BulkRowError(BaseModel):
+    """Schema for a rejected import row."""
+    
+    line: int
+    error: str
+
+
+class BulkImportReport(BaseModel):
+    """Schema for the outcome of a bulk import."""
+    
+    entity: BulkEntity
+    processed: int = 0
+    inserted: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[BulkRowError] = []
@@ -0,0 +1,302 @@
+"""
+Full-text search over project titles and descriptions.
+
+On PostgreSQL, search uses the generated projects.search_vector column
+(created by migration 0004 with a GIN index) and ranks matches with ts_rank.
+Other databases, such as the SQLite test setup, fall back to an in-process
+inverted index that is built on first use and kept up to date from committed
+ORM changes.
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Float, Select, cast, event, func, literal_column, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session
+
+from projects import models, pagination, queries, schemas
+
+TS_CONFIG: str = "simple"
+SEARCH_SORT: str = "search"
+TITLE_WEIGHT: float = 2.0
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        Tokens in order of appearance.
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    Thread-safe in-memory inverted index of project titles and descriptions.
+
+    Matches require every query term (AND semantics, like
+    websearch_to_tsquery) and are scored with a title-weighted TF-IDF.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._documents: Dict[int, Set[str]] = {}
+        self.built = False
+
+    def build(self, db: Session) -> None:
+        """
+        Index every project in the database.
+
+        Args:
+            db: Database session.
+        """
+        rows = db.execute(
+            select(models.Project.id, models.Project.title, models.Project.description)
+            .execution_options(yield_per=1000)
+        )
+        with self._lock:
+            self._postings.clear()
+            self._documents.clear()
+            for row in rows:
+                self._add(row.id, row.title, row.description)
+            self.built = True
+
+    def add(self, project_id: int, title: str, description: str) -> None:
+        """
+        Index or re-index one project.
+
+        Args:
+            project_id: Project ID.
+            title: Project title.
+            description: Project description.
+        """
+        with self._lock:
+            self._remove(project_id)
+            self._add(project_id, title, description)
+
+    def remove(self, project_id: int) -> None:
+        """
+        Drop a project from the index.
+
+        Args:
+            project_id: Project ID.
+        """
+        with self._lock:
+            self._remove(project_id)
+
+    def clear(self) -> None:
+        """Drop all entries; the index is rebuilt on next use."""
+        with self._lock:
+            self._postings.clear()
+            self._documents.clear()
+            self.built = False
+
+    def search(self, query: str) -> List[Tuple[float, int]]:
+        """
+        Find and rank projects matching every query term.
+
+        Args:
+            query: Search text.
+
+        Returns:
+            (score, project_id) pairs, best match first.
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        with self._lock:
+            postings = [self._postings.get(term, {}) for term in terms]
+            if not all(postings):
+                return []
+            total = len(self._documents)
+            postings.sort(key=len)
+            matches = set(postings[0]).intersection(*postings[1:])
+            scores = {
+                project_id: sum(
+                    weights[project_id] * math.log(1 + total / len(weights))
+                    for weights in postings
+                )
+                for project_id in matches
+            }
+        return sorted(((round(score, 6), project_id) for project_id, score in scores.items()), reverse=True)
+
+    def _add(self, project_id: int, title: str, description: str) -> None:
+        """Add a project; the caller must hold the lock."""
+        weights: Counter = Counter()
+        for token in tokenize(title or ""):
+            weights[token] += TITLE_WEIGHT
+        for token in tokenize(description or ""):
+            weights[token] += 1.0
+        for token, weight in weights.items():
+            self._postings.setdefault(token, {})[project_id] = weight
+        self._documents[project_id] = set(weights)
+
+    def _remove(self, project_id: int) -> None:
+        """Remove a project; the caller must hold the lock."""
+        for token in self._documents.pop(project_id, ()):
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(project_id, None)
+                if not posting:
+                    del self._postings[token]
+
+
+search_index = InvertedIndex()
+
+
+def _build_items(db: Session, ranked: List[Tuple[float, int]]) -> List[schemas.ProjectWithUser]:
+    """Load listing rows for ranked project IDs, preserving their order."""
+    if not ranked:
+        return []
+    rows = db.execute(
+        queries.project_listing_query().where(models.Project.id.in_([pid for _, pid in ranked]))
+    ).all()
+    by_id = {row.id: row for row in rows}
+    return [
+        queries.row_to_project_with_user(by_id[pid]._mapping)
+        for _, pid in ranked if pid in by_id
+    ]
+
+
+def postgres_search_query(query: str, cursor: Optional[str], limit: int) -> Select:
+    """
+    Build the PostgreSQL search statement for one keyset page.
+
+    ts_rank returns a single-precision real, which the driver hands back as
+    a shortened decimal that no longer equals the stored value. The rank is
+    therefore cast to double precision wherever it is selected, ordered or
+    compared, so a cursor holds the exact rank and pages split ties by ID
+    without repeating or skipping rows.
+
+    Args:
+        query: Search text in web search syntax.
+        cursor: Cursor returned with the previous page, if any.
+        limit: Page size.
+
+    Returns:
+        SELECT statement yielding listing columns plus "rank".
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    tsquery = func.websearch_to_tsquery(cast(TS_CONFIG, REGCONFIG), query)
+    search_vector = literal_column("projects.search_vector")
+    rank = cast(func.ts_rank(search_vector, tsquery), Float(53)).label("rank")
+
+    return pagination.paginate(
+        queries.project_listing_query()
+        .add_columns(rank)
+        .where(search_vector.op("@@")(tsquery)),
+        SEARCH_SORT,
+        [rank, models.Project.id],
+        cursor,
+        limit
+    )
+
+
+def _search_postgres(
+    db: Session,
+    query: str,
+    cursor: Optional[str],
+    limit: int
+) -> schemas.Page[schemas.ProjectWithUser]:
+    """Search with the tsvector column, GIN index and ts_rank."""
+    statement = postgres_search_query(query, cursor, limit)
+    rows, next_cursor = pagination.split_page(
+        db.execute(statement).all(), SEARCH_SORT, ("rank", "id"), limit
+    )
+    return schemas.Page[schemas.ProjectWithUser](
+        items=[queries.row_to_project_with_user(row._mapping) for row in rows],
+        next_cursor=next_cursor
+    )
+
+
+def _search_in_memory(
+    db: Session,
+    query: str,
+    cursor: Optional[str],
+    limit: int
+) -> schemas.Page[schemas.ProjectWithUser]:
+    """Search with the in-process inverted index."""
+    if not search_index.built:
+        search_index.build(db)
+
+    ranked = search_index.search(query)
+    if cursor:
+        after = tuple(pagination.decode_cursor(cursor, SEARCH_SORT, (float, int)))
+        ranked = [entry for entry in ranked if entry < after]
+
+    page = ranked[:limit]
+    next_cursor = None
+    if len(ranked) > limit:
+        next_cursor = pagination.encode_cursor(SEARCH_SORT, list(page[-1]))
+    return schemas.Page[schemas.ProjectWithUser](
+        items=_build_items(db, page), next_cursor=next_cursor
+    )
+
+
+def search_projects(
+    db: Session,
+    query: str,
+    cursor: Optional[str],
+    limit: int
+) -> schemas.Page[schemas.ProjectWithUser]:
+    """
+    Search projects by title and description, best match first.
+
+    Args:
+        db: Database session.
+        query: Search text (web search syntax on PostgreSQL).
+        cursor: Cursor returned with the previous page, if any.
+        limit: Page size.
+
+    Returns:
+        Page of matching projects and the cursor for the next page.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return _search_postgres(db, query, cursor, limit)
+    return _search_in_memory(db, query, cursor, limit)
+
+
+@event.listens_for(Session, "after_flush")
+def collect_search_changes(session: Session, flush_context: Any) -> None:
+    """Remember projects changed by a flush until the transaction commits."""
+    if not search_index.built:
+        return
+    changes = session.info.setdefault("search_changes", {})
+    for instance in list(session.new) + list(session.dirty):
+        if isinstance(instance, models.Project):
+            changes[instance.id] = (instance.title, instance.description)
+    for instance in session.deleted:
+        if isinstance(instance, models.Project):
+            changes[instance.id] = None
+
+
+@event.listens_for(Session, "after_commit")
+def apply_search_changes(session: Session) -> None:
+    """Apply committed project changes to the in-memory index."""
+    for project_id, document in session.info.pop("search_changes", {}).items():
+        if document is None:
+            search_index.remove(project_id)
+        else:
+            search_index.add(project_id, *document)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_search_changes(session: Session) -> None:
+    """Forget changes of a rolled back transaction."""
+    session.info.pop("search_changes", None)
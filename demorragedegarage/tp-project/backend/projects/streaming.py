@@ -0,0 +1,84 @@
+"""
+Streaming serialization of project listings.
+
+Turns an iterator of listing rows into NDJSON lines or a JSON array that is
+emitted piece by piece, so a response can start before the last row is read
+and never holds more than one chunk in memory.
+"""
+
+from typing import Any, Iterable, Iterator, Mapping
+
+from projects import schemas, serialization
+
+CHUNK_ROWS: int = 500
+
+MEDIA_TYPES = {
+    schemas.StreamFormat.ndjson: "application/x-ndjson",
+    schemas.StreamFormat.json: "application/json",
+}
+
+
+def _encoded_rows(rows: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    """Serialize listing rows to JSON objects one at a time."""
+    for row in rows:
+        yield serialization.dumps(serialization.project_item(row)).decode()
+
+
+def ndjson_chunks(rows: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    """
+    Encode rows as NDJSON, one object per line.
+
+    Args:
+        rows: Listing rows.
+
+    Yields:
+        Chunks of up to CHUNK_ROWS lines.
+    """
+    chunk = []
+    for encoded in _encoded_rows(rows):
+        chunk.append(encoded)
+        if len(chunk) >= CHUNK_ROWS:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+def json_array_chunks(rows: Iterable[Mapping[str, Any]]) -> Iterator[str]:
+    """
+    Encode rows as a single JSON array emitted incrementally.
+
+    Args:
+        rows: Listing rows.
+
+    Yields:
+        Chunks that concatenate to a valid JSON array.
+    """
+    yield "["
+    chunk = []
+    first = True
+    for encoded in _encoded_rows(rows):
+        chunk.append(encoded)
+        if len(chunk) >= CHUNK_ROWS:
+            yield ("" if first else ",") + ",".join(chunk)
+            first = False
+            chunk = []
+    if chunk:
+        yield ("" if first else ",") + ",".join(chunk)
+    yield "]"
+
+
+def encode(rows: Iterable[Mapping[str, Any]], fmt: schemas.StreamFormat) -> Iterator[str]:
+    """
+    Encode rows in the requested streaming format.
+
+    Args:
+        rows: Listing rows.
+        fmt: Output format.
+
+    Yields:
+        Response body chunks.
+    """
+    if fmt == schemas.StreamFormat.json:
+        return json_array_chunks(rows)
+    return ndjson_chunks(rows)
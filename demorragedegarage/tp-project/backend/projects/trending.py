@@ -0,0 +1,161 @@
+"""
+Trending score engine.
+
+Each project has a time-decayed popularity score: every event (creation,
+like, review) contributes its weight, halving every TRENDING_HALF_LIFE_HOURS.
+Because every score decays at the same rate, the ranking only depends on
+
+    trending_score = ln(sum(weight * exp(decay_rate * (event_time - EPOCH))))
+
+which never changes as time passes. Writes update it in place with a
+log-sum-exp expression in the same UPDATE that changes the counters, so the
+column can be indexed and served by keyset pagination; recompute_scores() rebuilds it from the source rows to repair
+drift or backfill existing data.
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import ColumnElement, bindparam, case, func, select, update
+from sqlalchemy.orm import Session
+
+from config import settings
+from projects import models
+
+EPOCH: datetime = datetime(2024, 1, 1, tzinfo=timezone.utc)
+CREATE_WEIGHT: float = 1.0
+LIKE_WEIGHT: float = 1.0
+NEUTRAL_RATING: float = 3.0
+RECOMPUTE_BATCH_SIZE: int = 1000
+
+
+def decay_rate() -> float:
+    """Return the decay rate per second derived from the configured half-life."""
+    return math.log(2) / (settings.TRENDING_HALF_LIFE_HOURS * 3600)
+
+
+def review_weight(rating: int) -> float:
+    """
+    Weight of a review: a neutral 3-star review counts as one like.
+
+    Args:
+        rating: Review rating (1-5).
+
+    Returns:
+        Event weight.
+    """
+    return rating / NEUTRAL_RATING
+
+
+def event_score(weight: float, at: Optional[datetime] = None) -> float:
+    """
+    Log-space score contributed by a single event.
+
+    Args:
+        weight: Event weight.
+        at: Event time (naive values are treated as UTC); defaults to now.
+
+    Returns:
+        ln(weight) plus the event's decay exponent.
+    """
+    if at is None:
+        at = datetime.now(timezone.utc)
+    elif at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return math.log(weight) + decay_rate() * (at - EPOCH).total_seconds()
+
+
+def log_add_exp(a: float, b: float) -> float:
+    """Return ln(exp(a) + exp(b)) without overflow."""
+    high, low = max(a, b), min(a, b)
+    return high + math.log1p(math.exp(low - high))
+
+
+def added_score(event: float, score: Optional[ColumnElement] = None) -> ColumnElement:
+    """
+    SQL expression for a trending score with an event added.
+
+    Meant for the SET clause of the UPDATE that also changes the project's
+    counters, so an event costs no statement of its own. Several events
+    can be added at once by combining their event_score() values with
+    log_add_exp first.
+
+    Args:
+        event: Log-space score to add.
+        score: Score expression to add to; defaults to the column.
+
+    Returns:
+        ln(exp(score) + exp(event)), computed without overflow.
+    """
+    score = models.Project.trending_score if score is None else score
+    return case(
+        (score >= event, score + func.ln(1 + func.exp(event - score))),
+        else_=event + func.ln(1 + func.exp(score - event))
+    )
+
+
+def retracted_score(event: float, score: Optional[ColumnElement] = None) -> ColumnElement:
+    """
+    SQL expression for a trending score with a recorded event removed.
+
+    If rounding leaves (almost) nothing, the score falls back to the
+    project's creation event, computed from projects.created_at in the
+    same expression rather than read beforehand.
+
+    Args:
+        event: Log-space score of the removed event, or of several
+            combined with log_add_exp.
+        score: Score expression to remove from; defaults to the column.
+
+    Returns:
+        ln(exp(score) - exp(event)), or the creation score.
+    """
+    score = models.Project.trending_score if score is None else score
+    created = func.extract("epoch", models.Project.created_at) - EPOCH.timestamp()
+    return case(
+        (score > event + 1e-9, score + func.ln(1 - func.exp(event - score))),
+        else_=math.log(CREATE_WEIGHT) + decay_rate() * created
+    )
+
+
+def recompute_scores(db: Session) -> int:
+    """
+    Rebuild every project's trending score from projects, likes and reviews.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        Number of projects updated.
+    """
+    scores: Dict[int, float] = {}
+    for row in db.execute(
+        select(models.Project.id, models.Project.created_at).execution_options(yield_per=RECOMPUTE_BATCH_SIZE)
+    ):
+        scores[row.id] = event_score(CREATE_WEIGHT, row.created_at)
+
+    def add(project_id: int, weight: float, at: Any) -> None:
+        if project_id in scores:
+            scores[project_id] = log_add_exp(scores[project_id], event_score(weight, at))
+
+    for row in db.execute(
+        select(models.Like.project_id, models.Like.created_at).execution_options(yield_per=RECOMPUTE_BATCH_SIZE)
+    ):
+        add(row.project_id, LIKE_WEIGHT, row.created_at)
+    for row in db.execute(
+        select(models.Review.project_id, models.Review.rating, models.Review.created_at)
+        .execution_options(yield_per=RECOMPUTE_BATCH_SIZE)
+    ):
+        add(row.project_id, review_weight(row.rating), row.created_at)
+
+    statement = (
+        update(models.Project.__table__)
+        .where(models.Project.__table__.c.id == bindparam("project_id"))
+        .values(trending_score=bindparam("score"))
+    )
+    items = [{"project_id": project_id, "score": score} for project_id, score in scores.items()]
+    for start in range(0, len(items), RECOMPUTE_BATCH_SIZE):
+        db.execute(statement, items[start:start + RECOMPUTE_BATCH_SIZE])
+    db.commit()
+    return len(items)
@@ -0,0 +1,340 @@
+"""
+Fan-out of project counter changes to connected clients.
+
+Transactions that change a project's likes or reviews record the new counters
+(see projects.counters.note_counters). When such a transaction commits, every
+open event stream receives one compact "counts" event per changed project, so
+clients update the numbers in place instead of refetching the listing.
+
+Across worker processes the events travel through PostgreSQL: they are sent
+with pg_notify() inside the committing transaction, which PostgreSQL delivers
+only on commit and in commit order, and every worker LISTENs on a dedicated
+connection and dispatches what it receives to its own streams. LISTEN needs a
+session-level connection, so with DB_PGBOUNCER the database URL must point
+past a transaction-pooling bouncer. On other databases, or with
+REALTIME_FANOUT=local, events are dispatched inside the committing process.
+
+Events carry absolute counts and the project's version rather than
+increments, so a stream that falls behind keeps only the newest event per
+project. A stream whose backlog grows past REALTIME_QUEUE_LIMIT projects gets
+a single "resync" event instead, telling the client to refetch; publishers
+never wait for slow consumers.
+"""
+
+import asyncio
+import json
+import logging
+import select
+import threading
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy import select as sql_select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from config import settings
+from projects import counters
+
+logger = logging.getLogger(__name__)
+
+CHANNEL: str = "project_counts"
+NOTIFY_PAYLOAD_LIMIT: int = 7000
+LISTEN_POLL_SECONDS: float = 5.0
+LISTEN_RETRY_SECONDS: float = 1.0
+
+
+def counts_event(changed: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Build the event sent for a project's changed counters.
+
+    Args:
+        changed: Counters recorded by projects.counters.note_counters.
+
+    Returns:
+        Project ID, counts, average rating and version.
+    """
+    return {
+        "project_id": changed["id"],
+        "likes_count": changed["likes_count"],
+        "reviews_count": changed["reviews_count"],
+        "average_rating": counters.average_rating(changed["reviews_count"], changed["rating_total"]),
+        "version": changed["version"],
+    }
+
+
+def format_event(name: str, data: Dict[str, Any]) -> str:
+    """
+    Encode one Server-Sent Event.
+
+    Args:
+        name: Event type.
+        data: JSON payload.
+
+    Returns:
+        Event in text/event-stream framing.
+    """
+    return f"event: {name}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+def notify_payloads(events: List[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Encode events as JSON arrays that each fit in one NOTIFY payload.
+
+    Args:
+        events: Counts events.
+
+    Yields:
+        JSON arrays of at most NOTIFY_PAYLOAD_LIMIT bytes (unless a single
+        event is larger).
+    """
+    chunk: List[str] = []
+    size = 2
+    for item in events:
+        encoded = json.dumps(item, separators=(",", ":"))
+        if chunk and size + len(encoded) + 1 > NOTIFY_PAYLOAD_LIMIT:
+            yield "[" + ",".join(chunk) + "]"
+            chunk, size = [], 2
+        chunk.append(encoded)
+        size += len(encoded) + 1
+    if chunk:
+        yield "[" + ",".join(chunk) + "]"
+
+
+class SubscriberLimitError(RuntimeError):
+    """Raised when a worker already serves REALTIME_MAX_SUBSCRIBERS streams."""
+
+
+class Subscriber:
+    """
+    Bounded, coalescing mailbox of one event stream.
+
+    Holds events already encoded as SSE frames, so each event is serialized
+    once per worker rather than once per stream. Only used from the event
+    loop thread.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._pending: Dict[int, Tuple[int, str]] = {}
+        self._resync = False
+        self._ready = asyncio.Event()
+
+    def offer(self, project_id: int, version: int, frame: str) -> None:
+        """
+        Queue an event, replacing an older one for the same project.
+
+        Args:
+            project_id: Project the event is about.
+            version: Project version the event reflects.
+            frame: Encoded event.
+        """
+        current = self._pending.get(project_id)
+        if current is not None:
+            if current[0] < version:
+                self._pending[project_id] = (version, frame)
+            return
+        if self._resync:
+            return
+        if len(self._pending) >= self.limit:
+            self._pending.clear()
+            self._resync = True
+        else:
+            self._pending[project_id] = (version, frame)
+        self._ready.set()
+
+    async def receive(self, timeout: float) -> Optional[Tuple[bool, List[str]]]:
+        """
+        Wait for queued events and take them all.
+
+        Args:
+            timeout: Seconds to wait.
+
+        Returns:
+            None if nothing arrived in time, otherwise whether the client must
+            resync and the queued event frames.
+        """
+        if not self._ready.is_set():
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        self._ready.clear()
+        frames = [frame for _, frame in self._pending.values()]
+        self._pending.clear()
+        resync, self._resync = self._resync, False
+        return resync, frames
+
+
+class PostgresListener(threading.Thread):
+    """Thread that LISTENs for counts events and hands them to the broker."""
+
+    def __init__(self, engine: Engine, broker: "Broker") -> None:
+        super().__init__(name="realtime-listener", daemon=True)
+        self.engine = engine
+        self.broker = broker
+        self._stopping = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Realtime listener failed; reconnecting")
+                self._stopping.wait(LISTEN_RETRY_SECONDS)
+
+    def stop(self) -> None:
+        """Stop listening and wait for the thread to exit."""
+        self._stopping.set()
+        self.join(LISTEN_POLL_SECONDS + 1)
+
+    def _listen(self) -> None:
+        """Hold a dedicated connection outside the pool and relay notifications."""
+        dialect = self.engine.dialect
+        cargs, cparams = dialect.create_connect_args(self.engine.url)
+        connection = dialect.loaded_dbapi.connect(*cargs, **cparams)
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            while not self._stopping.is_set():
+                if select.select([connection], [], [], LISTEN_POLL_SECONDS) == ([], [], []):
+                    continue
+                connection.poll()
+                events: List[Dict[str, Any]] = []
+                while connection.notifies:
+                    events.extend(json.loads(connection.notifies.pop(0).payload))
+                self.broker.publish(events)
+        finally:
+            connection.close()
+
+
+class Broker:
+    """Registry of a worker's event streams and the fan-out feeding them."""
+
+    def __init__(self, queue_limit: int, max_subscribers: int) -> None:
+        self.queue_limit = queue_limit
+        self.max_subscribers = max_subscribers
+        self.fanout = "local"
+        self.published = 0
+        self._subscribers: Set[Subscriber] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional[PostgresListener] = None
+
+    @property
+    def full(self) -> bool:
+        """Whether the worker is at REALTIME_MAX_SUBSCRIBERS."""
+        return len(self._subscribers) >= self.max_subscribers
+
+    def start(self, loop: asyncio.AbstractEventLoop, engine: Engine, fanout: str = "auto") -> None:
+        """
+        Start delivering events to streams served by a loop.
+
+        Args:
+            loop: Event loop the streams run on.
+            engine: Application engine; decides the fan-out in "auto" mode.
+            fanout: "postgres", "local" or "auto".
+        """
+        if fanout == "auto":
+            fanout = "postgres" if engine.dialect.name == "postgresql" else "local"
+        self._loop = loop
+        self.fanout = fanout
+        if fanout == "postgres":
+            self._listener = PostgresListener(engine, self)
+            self._listener.start()
+
+    def stop(self) -> None:
+        """Stop the fan-out; open streams stay registered until they close."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        self._loop = None
+        self.fanout = "local"
+
+    def subscribe(self) -> Subscriber:
+        """
+        Register a new stream.
+
+        Returns:
+            The stream's mailbox.
+
+        Raises:
+            SubscriberLimitError: If the worker serves too many streams.
+        """
+        if self.full:
+            raise SubscriberLimitError(self.max_subscribers)
+        subscriber = Subscriber(self.queue_limit)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a closed stream."""
+        self._subscribers.discard(subscriber)
+
+    def dispatch(self, events: List[Dict[str, Any]]) -> None:
+        """Offer events to every stream; runs on the event loop thread."""
+        encoded = [
+            (item["project_id"], item["version"], format_event("counts", item))
+            for item in events
+        ]
+        for subscriber in list(self._subscribers):
+            for project_id, version, frame in encoded:
+                subscriber.offer(project_id, version, frame)
+
+    def publish(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Deliver events to this worker's streams from any thread.
+
+        Args:
+            events: Counts events.
+        """
+        loop = self._loop
+        if loop is None or not events:
+            return
+        self.published += len(events)
+        try:
+            loop.call_soon_threadsafe(self.dispatch, events)
+        except RuntimeError:
+            pass
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Describe the broker for monitoring.
+
+        Returns:
+            Fan-out mode, open streams and events published.
+        """
+        return {
+            "fanout": self.fanout,
+            "subscribers": len(self._subscribers),
+            "published": self.published,
+        }
+
+
+broker = Broker(settings.REALTIME_QUEUE_LIMIT, settings.REALTIME_MAX_SUBSCRIBERS)
+
+
+@event.listens_for(Session, "before_commit")
+def notify_changed_counters(session: Session) -> None:
+    """Send the transaction's counter changes with pg_notify before it commits."""
+    if broker.fanout != "postgres":
+        return
+    changed = session.info.pop(counters.CHANGED_COUNTERS_KEY, None)
+    if changed:
+        events = [counts_event(item) for item in changed.values()]
+        for payload in notify_payloads(events):
+            session.execute(sql_select(func.pg_notify(CHANNEL, payload)))
+
+
+@event.listens_for(Session, "after_commit")
+def publish_changed_counters(session: Session) -> None:
+    """Publish the committed counter changes to this worker's streams."""
+    changed = session.info.pop(counters.CHANGED_COUNTERS_KEY, None)
+    if changed:
+        broker.publish([counts_event(item) for item in changed.values()])
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_changed_counters(session: Session) -> None:
+    """Forget counter changes of a rolled back transaction."""
+    session.info.pop(counters.CHANGED_COUNTERS_KEY, None)
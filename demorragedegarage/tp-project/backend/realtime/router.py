@@ -0,0 +1,76 @@
+"""
+Realtime router module.
+
+Serves the Server-Sent Events stream of project counter updates.
+"""
+
+from typing import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from config import settings
+from realtime.broker import broker, format_event
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+RETRY_MS: int = 3000
+
+
+async def event_stream(heartbeat: float) -> AsyncIterator[str]:
+    """
+    Produce a stream's body until the client disconnects.
+    
+    Events that arrive while a previous chunk is still being sent coalesce
+    in the stream's mailbox, so a slow client receives fewer, newer events.
+    
+    Args:
+        heartbeat: Idle seconds between keep-alive comments.
+    
+    Yields:
+        Chunks of the text/event-stream body.
+    
+    Raises:
+        SubscriberLimitError: If the worker serves too many streams.
+    """
+    subscriber = broker.subscribe()
+    try:
+        yield f"retry: {RETRY_MS}\n\n"
+        while True:
+            received = await subscriber.receive(heartbeat)
+            if received is None:
+                yield ": keep-alive\n\n"
+                continue
+            resync, frames = received
+            chunk = format_event("resync", {}) if resync else ""
+            yield chunk + "".join(frames)
+    finally:
+        broker.unsubscribe(subscriber)
+
+
+@router.get("")
+async def stream_events() -> StreamingResponse:
+    """
+    Stream project counter updates as Server-Sent Events.
+    
+    Each "counts" event carries a project's likes_count, reviews_count,
+    average_rating and version; clients apply it when the version is newer
+    than what they hold. A "resync" event means updates were dropped and the
+    client should refetch.
+    
+    Returns:
+        Never-ending text/event-stream response.
+    
+    Raises:
+        HTTPException: If the worker serves too many streams.
+    """
+    if broker.full:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many event streams"
+        )
+    return StreamingResponse(
+        event_stream(settings.REALTIME_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
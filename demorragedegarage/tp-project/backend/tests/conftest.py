@@ -4,19 +4,31 @@ Pytest configuration and fixtures.
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 import sys
 import os
+import tempfile
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("DB_SCHEMA_CHECK", "off")
+os.environ.setdefault("ANALYTICS_REFRESH_INTERVAL_SECONDS", "0")
+
 from main import app
-from database.connection import Base, get_db
+from database.connection import Base, get_async_db, get_db
+from auth.token_cache import token_cache
+from projects.read_cache import project_cache
+from projects.search import search_index
+from monitoring.timing import instrument_queries
 
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# A file rather than :memory:, so the sync and async engines share the data.
+DATABASE_PATH = os.path.join(tempfile.mkdtemp(prefix="luxury-tests-"), "test.db")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -24,6 +36,18 @@ engine = create_engine(
     poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+instrument_queries(engine)
+
+# NullPool: every TestClient runs its own event loop, so connections must not
+# outlive a request.
+async_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{DATABASE_PATH}",
+    poolclass=NullPool,
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+instrument_queries(async_engine.sync_engine)
 
 
 def override_get_db():
@@ -35,6 +59,12 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    """Provide test async database session."""
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Create fresh database for each test."""
@@ -48,7 +78,12 @@ def db_session():
 @pytest.fixture(scope="function")
 def client(db_session):
     """Create test client with overridden database."""
+    token_cache.clear()
+    project_cache.clear()
+    project_cache.stats.reset()
+    search_index.clear()
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     Base.metadata.create_all(bind=engine)
     
     with TestClient(app) as test_client:
@@ -94,3 +129,18 @@ def test_project_data():
         "description": "A test project description",
         "project_url": "https://example.com/project"
     }
+
+
+@pytest.fixture
+def query_counter():
+    """Count SQL statements executed against the test database."""
+    statements = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    for counted in (engine, async_engine.sync_engine):
+        event.listen(counted, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    for counted in (engine, async_engine.sync_engine):
+        event.remove(counted, "before_cursor_execute", before_cursor_execute)
@@ -2,8 +2,20 @@
 Tests for authentication endpoints.
 """
 
+import threading
+
 import pytest
 
+from auth import utils
+
+
+@pytest.fixture
+def exhausted_hash_queue(monkeypatch):
+    """Make the password hashing pool report that its queue is full."""
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    monkeypatch.setattr(utils, "hash_slots", slots)
+
 
 class TestUserRegistration:
     """Tests for user registration endpoint."""
@@ -56,6 +68,26 @@ class TestUserRegistration:
         assert response.status_code == 422
 
 
+class TestHashingBackpressure:
+    """Tests for rejecting auth requests when hashing is saturated."""
+    
+    def test_register_busy(self, client, test_user_data, exhausted_hash_queue):
+        """Test registration returns 503 when the hashing queue is full."""
+        response = client.post("/auth/register", json=test_user_data)
+        
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+    
+    def test_login_busy(self, client, test_user_data, registered_user, exhausted_hash_queue):
+        """Test login returns 503 when the hashing queue is full."""
+        response = client.post("/auth/login", json={
+            "username": test_user_data["username"],
+            "password": test_user_data["password"]
+        })
+        
+        assert response.status_code == 503
+
+
 class TestUserLogin:
     """Tests for user login endpoint."""
     
@@ -0,0 +1,177 @@
+"""
+Tests for bulk import and export.
+"""
+
+import json
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+
+ADMIN_KEY = "test-admin-key"
+
+
+@pytest.fixture
+def admin_headers(monkeypatch):
+    """Enable the bulk endpoints and return the admin header."""
+    monkeypatch.setattr(settings, "ADMIN_API_KEY", ADMIN_KEY)
+    return {"X-Admin-Key": ADMIN_KEY}
+
+
+def ndjson(*records):
+    """Encode records as NDJSON bytes."""
+    return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+class TestBulkImport:
+    """Tests for the bulk import endpoint."""
+    
+    def test_requires_admin_key(self, client, admin_headers):
+        """Test bulk endpoints reject missing or wrong keys."""
+        files = {"file": ("projects.ndjson", b"")}
+        
+        assert client.post("/projects/bulk/projects", files=files).status_code == 403
+        assert client.post(
+            "/projects/bulk/projects", files=files, headers={"X-Admin-Key": "wrong"}
+        ).status_code == 403
+    
+    def test_import_reports_row_errors(self, client, registered_user, admin_headers):
+        """Test valid rows are inserted and invalid ones reported by line."""
+        user_id = registered_user["id"]
+        payload = ndjson(
+            {"title": "A", "description": "d", "project_url": "https://a", "user_id": user_id},
+            {"title": "B", "description": "d", "project_url": "https://b", "user_id": 999},
+            {"title": "C", "project_url": "https://c", "user_id": user_id},
+        ) + b"{broken\n"
+        
+        response = client.post(
+            "/projects/bulk/projects",
+            files={"file": ("projects.ndjson", payload)},
+            headers=admin_headers
+        )
+        
+        assert response.status_code == 200
+        report = response.json()
+        assert report["inserted"] == 1
+        assert report["failed"] == 3
+        assert [error["line"] for error in report["errors"]] == [2, 3, 4]
+        assert "unknown user_id" in report["errors"][0]["error"]
+        assert len(client.get("/projects/").json()["items"]) == 1
+    
+    def test_import_likes_csv_updates_counters(
+        self, client, registered_user, auth_token, test_project_data, admin_headers
+    ):
+        """Test imported likes are deduplicated and reflected in counters."""
+        project_id = client.post(
+            "/projects/", json=test_project_data, params={"token": auth_token}
+        ).json()["id"]
+        client.get(f"/projects/{project_id}")
+        user_id = registered_user["id"]
+        payload = (
+            "user_id,project_id,created_at\n"
+            f"{user_id},{project_id},2025-01-01T00:00:00Z\n"
+            f"{user_id},{project_id},\n"
+        ).encode()
+        
+        report = client.post(
+            "/projects/bulk/likes",
+            files={"file": ("likes.csv", payload)},
+            headers=admin_headers
+        ).json()
+        
+        assert report["inserted"] == 1
+        assert report["skipped"] == 1
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 1
+    
+    def test_small_batches(self, db_session, client, registered_user):
+        """Test imports spanning several batches insert every row."""
+        import io
+        from projects import bulk, schemas
+        
+        records = ndjson(*[
+            {"title": f"P{i}", "description": "d", "project_url": "u", "user_id": registered_user["id"]}
+            for i in range(7)
+        ]).decode()
+        
+        report = bulk.import_records(
+            db_session, schemas.BulkEntity.projects, io.StringIO(records),
+            schemas.BulkFormat.ndjson, batch_size=3
+        )
+        
+        assert report.inserted == 7
+
+
+class TestBulkExport:
+    """Tests for the bulk export endpoint."""
+    
+    def test_export_round_trips(self, client, auth_token, test_project_data, admin_headers):
+        """Test exported NDJSON can be fed back to the importer."""
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        
+        response = client.get("/projects/bulk/projects", headers=admin_headers)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = response.text.splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["title"] == test_project_data["title"]
+        
+        report = client.post(
+            "/projects/bulk/projects",
+            files={"file": ("projects.ndjson", response.content)},
+            headers=admin_headers
+        ).json()
+        assert report["inserted"] == 0
+        assert report["skipped"] == 1
+    
+    def test_export_csv(self, client, auth_token, test_project_data, admin_headers):
+        """Test CSV export starts with a header row."""
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        
+        response = client.get(
+            "/projects/bulk/projects", params={"format": "csv"}, headers=admin_headers
+        )
+        
+        lines = response.text.splitlines()
+        assert lines[0] == "id,title,description,project_url,user_id,created_at"
+        assert len(lines) == 2
+    
+    def test_export_likes(self, client, registered_user, auth_token, test_project_data, admin_headers):
+        """Test likes export as user and project pairs."""
+        project_id = client.post(
+            "/projects/", json=test_project_data, params={"token": auth_token}
+        ).json()["id"]
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        response = client.get("/projects/bulk/likes", headers=admin_headers)
+        
+        assert response.status_code == 200
+        assert response.headers["content-disposition"] == 'attachment; filename="likes.ndjson"'
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [(record["user_id"], record["project_id"]) for record in records] == [
+            (registered_user["id"], project_id)
+        ]
+    
+    def test_export_reviews(self, client, registered_user, auth_token, test_project_data, admin_headers):
+        """Test GET /projects/bulk/reviews reaches the export, not the reviews listing."""
+        project_id = client.post(
+            "/projects/", json=test_project_data, params={"token": auth_token}
+        ).json()["id"]
+        client.post(
+            f"/projects/{project_id}/review",
+            json={"content": "Great", "rating": 5},
+            params={"token": auth_token}
+        )
+        
+        response = client.get(
+            "/projects/bulk/reviews", params={"format": "csv"}, headers=admin_headers
+        )
+        
+        assert response.status_code == 200
+        lines = response.text.splitlines()
+        assert lines[0] == "user_id,project_id,content,rating,created_at"
+        assert lines[1].startswith(f"{registered_user['id']},{project_id},Great,5,")
@@ -0,0 +1,68 @@
+"""
+Tests for the read-through cache backends.
+"""
+
+import time
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache.backends import MemoryCache, NullCache
+
+
+class TestMemoryCache:
+    """Tests for the in-process LRU+TTL backend."""
+    
+    def test_get_counts_hits_and_misses(self):
+        """Test lookups are counted as hits or misses."""
+        cache = MemoryCache(max_entries=10, ttl_seconds=60)
+        cache.set("key", {"value": 1})
+        
+        assert cache.get("key") == {"value": 1}
+        assert cache.get("missing") is None
+        assert cache.describe()["hits"] == 1
+        assert cache.describe()["misses"] == 1
+    
+    def test_entries_expire(self):
+        """Test entries are not served after their TTL."""
+        cache = MemoryCache(max_entries=10, ttl_seconds=60)
+        cache.set("key", "value", ttl_seconds=0.01)
+        time.sleep(0.02)
+        
+        assert cache.get("key") is None
+    
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted first."""
+        cache = MemoryCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+    
+    def test_incr_and_delete(self):
+        """Test counters increment and deleted keys disappear."""
+        cache = MemoryCache(max_entries=10, ttl_seconds=60)
+        assert cache.incr("generation") == 1
+        assert cache.incr("generation") == 2
+        
+        cache.set("key", "value")
+        cache.delete("key")
+        assert cache.get("key") is None
+
+
+class TestNullCache:
+    """Tests for the disabled backend."""
+    
+    def test_never_stores(self):
+        """Test the null backend always misses but still counts."""
+        cache = NullCache()
+        cache.set("key", "value")
+        
+        assert cache.get("key") is None
+        assert cache.incr("generation") == 1
+        assert cache.incr("generation") == 2
@@ -0,0 +1,92 @@
+"""
+Tests for database connection helpers.
+"""
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.pool import NullPool
+
+from config import settings
+from database.connection import async_database_url, engine_options
+from database.pool import InstrumentedQueuePool
+
+
+class TestAsyncDatabaseUrl:
+    """Tests for async driver URL rewriting."""
+    
+    def test_postgres_uses_asyncpg(self):
+        """Test PostgreSQL URLs switch to the asyncpg driver."""
+        url = async_database_url("postgresql://user:secret@db:5432/app")
+        
+        assert url == "postgresql+asyncpg://user:secret@db:5432/app"
+    
+    def test_explicit_sync_driver_replaced(self):
+        """Test an explicit psycopg2 driver is replaced."""
+        url = async_database_url("postgresql+psycopg2://user@db/app")
+        
+        assert url.startswith("postgresql+asyncpg://")
+    
+    def test_sqlite_uses_aiosqlite(self):
+        """Test SQLite URLs switch to the aiosqlite driver."""
+        assert async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    
+    def test_unsupported_backend(self):
+        """Test unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            async_database_url("mysql://user@db/app")
+
+
+class TestEngineOptions:
+    """Tests for engine pool options."""
+    
+    def test_sqlite_has_no_pool_sizing(self):
+        """Test SQLite engines keep their default pool."""
+        assert engine_options("sqlite:///:memory:") == {}
+    
+    def test_postgres_pool_sizing(self):
+        """Test PostgreSQL engines get configured pool sizes."""
+        options = engine_options("postgresql://user@db/app")
+        
+        assert options["pool_size"] == settings.DB_POOL_SIZE
+        assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+        assert options["poolclass"] is InstrumentedQueuePool
+    
+    def test_pgbouncer_mode(self, monkeypatch):
+        """Test PgBouncer mode disables pooling and prepared statements."""
+        monkeypatch.setattr(settings, "DB_PGBOUNCER", True)
+        
+        sync_options = engine_options("postgresql://user@db/app")
+        async_options = engine_options("postgresql+asyncpg://user@db/app")
+        
+        assert sync_options["poolclass"] is NullPool
+        assert "pool_size" not in sync_options
+        assert async_options["connect_args"]["statement_cache_size"] == 0
+        assert async_options["connect_args"]["prepared_statement_cache_size"] == 0
+    
+    def test_statement_timeout(self, monkeypatch):
+        """Test statement timeout is passed to the server for both drivers."""
+        monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+        
+        sync_options = engine_options("postgresql://user@db/app")
+        async_options = engine_options("postgresql+asyncpg://user@db/app")
+        
+        assert sync_options["connect_args"]["options"] == "-c statement_timeout=5000"
+        assert async_options["connect_args"]["server_settings"] == {"statement_timeout": "5000"}
+
+
+class TestHealth:
+    """Tests for the health endpoint."""
+    
+    def test_health_reports_pool(self, client):
+        """Test health endpoint exposes pool statistics."""
+        response = client.get("/health")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert "checked_out" in data["pool"]
+        assert "wait_seconds_max" in data["pool"]
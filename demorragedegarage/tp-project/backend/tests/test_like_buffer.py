@@ -0,0 +1,237 @@
+"""
+Tests for the write-behind like buffer.
+"""
+
+import json
+import os
+
+import pytest
+from sqlalchemy.orm import Session
+
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from projects import likes
+from projects.like_buffer import LikeBuffer
+
+
+def make_buffer(directory, db_session, **kwargs):
+    """Start a buffer without its flush thread, writing through the test engine."""
+    buffer = LikeBuffer(str(directory), 50, kwargs.pop("batch_size", 1000), fsync=False)
+    buffer.start(lambda: Session(bind=db_session.get_bind()), background=False)
+    return buffer
+
+
+def journal_files(directory):
+    """List journal segments on disk."""
+    return sorted(name for name in os.listdir(directory) if name.endswith(".journal"))
+
+
+@pytest.fixture
+def project(client, auth_token, test_project_data):
+    """Create a project and return its JSON."""
+    return client.post("/projects/", json=test_project_data, params={"token": auth_token}).json()
+
+
+@pytest.fixture
+def buffer(tmp_path, db_session, monkeypatch):
+    """Route like writes of the API through a running buffer."""
+    buffer = make_buffer(tmp_path, db_session)
+    monkeypatch.setattr("projects.router.like_buffer", buffer)
+    yield buffer
+    buffer.stop()
+
+
+class TestBufferedEndpoints:
+    """Tests for like endpoints in write-behind mode."""
+    
+    def test_put_is_accepted_and_read_your_writes(self, client, auth_token, project, buffer):
+        """Test a buffered like is visible to its author before the flush."""
+        project_id = project["id"]
+        
+        response = client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        assert response.status_code == 202
+        assert response.json() == {"project_id": project_id, "liked": True}
+        assert client.get(f"/projects/{project_id}/liked", params={"token": auth_token}).json() is True
+        listing = client.get("/projects/", params={"token": auth_token}).json()["items"]
+        assert listing[0]["liked_by_me"] is True
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 0
+        
+        assert buffer.flush() == 1
+        
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 1
+    
+    def test_buffered_unlike(self, client, auth_token, project, buffer):
+        """Test a buffered unlike removes a stored like at the next flush."""
+        project_id = project["id"]
+        client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+        buffer.flush()
+        
+        response = client.delete(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        assert response.status_code == 202
+        assert client.get(f"/projects/{project_id}/liked", params={"token": auth_token}).json() is False
+        buffer.flush()
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 0
+    
+    def test_post_like_commits_pending_unlike_first(self, client, auth_token, project, buffer):
+        """Test a buffered unlike cannot undo a later POST like."""
+        project_id = project["id"]
+        client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+        buffer.flush()
+        client.delete(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        response = client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        assert response.status_code == 200
+        assert buffer.describe()["pending"] == 0
+        assert buffer.flush() == 0
+        assert client.get(f"/projects/{project_id}/liked", params={"token": auth_token}).json() is True
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 1
+    
+    def test_post_like_fails_when_pending_change_cannot_be_saved(
+        self, client, auth_token, project, buffer, monkeypatch
+    ):
+        """Test POST like is refused while the pair's buffered change is unsaved."""
+        project_id = project["id"]
+        client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        def fail(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+        
+        with monkeypatch.context() as patch:
+            patch.setattr(likes, "write_batch", fail)
+            response = client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        assert response.status_code == 503
+        assert buffer.flush() == 1
+    
+    def test_missing_project(self, client, auth_token, buffer):
+        """Test buffered likes of missing projects are rejected up front."""
+        response = client.put("/projects/999/like", params={"token": auth_token})
+        
+        assert response.status_code == 404
+        assert buffer.describe()["pending"] == 0
+
+
+class TestLikeBuffer:
+    """Tests for buffering, flushing and journal recovery."""
+    
+    def test_deduplicates_per_pair(self, tmp_path, db_session, client, project):
+        """Test repeated changes to one pair collapse into the last one."""
+        buffer = make_buffer(tmp_path, db_session)
+        user_id, project_id = project["user_id"], project["id"]
+        
+        buffer.enqueue(user_id, project_id, True)
+        buffer.enqueue(user_id, project_id, False)
+        buffer.enqueue(user_id, project_id, True)
+        
+        assert buffer.describe()["pending"] == 1
+        assert buffer.flush() == 1
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 1
+        buffer.stop()
+    
+    def test_batches_commit_in_chunks(self, tmp_path, db_session, client, project):
+        """Test a flush larger than the batch size writes every change."""
+        buffer = make_buffer(tmp_path, db_session, batch_size=2)
+        for user_id in range(1, 6):
+            buffer.enqueue(user_id, project["id"], True)
+        
+        assert buffer.flush() == 5
+        
+        assert client.get(f"/projects/{project['id']}").json()["likes_count"] == 5
+        buffer.stop()
+    
+    def test_journal_survives_crash(self, tmp_path, db_session, client, project):
+        """Test acknowledged changes are replayed by the next start."""
+        crashed = make_buffer(tmp_path, db_session)
+        crashed.enqueue(project["user_id"], project["id"], True)
+        crashed.stop(flush=False)
+        assert len(journal_files(tmp_path)) == 1
+        
+        restarted = LikeBuffer(str(tmp_path), 50, 1000, fsync=False)
+        recovered = restarted.start(lambda: Session(bind=db_session.get_bind()), background=False)
+        
+        assert recovered == 1
+        assert client.get(f"/projects/{project['id']}").json()["likes_count"] == 1
+        assert len(journal_files(tmp_path)) == 1
+        restarted.stop()
+        assert journal_files(tmp_path) == []
+    
+    def test_torn_entry_is_ignored(self, tmp_path, db_session, client, project):
+        """Test a partially written last entry does not block recovery."""
+        crashed = make_buffer(tmp_path, db_session)
+        crashed.enqueue(project["user_id"], project["id"], True)
+        crashed.stop(flush=False)
+        with open(tmp_path / journal_files(tmp_path)[0], "a", encoding="utf-8") as journal:
+            journal.write('{"user_id": 1, "proj')
+        
+        restarted = make_buffer(tmp_path, db_session)
+        
+        assert client.get(f"/projects/{project['id']}").json()["likes_count"] == 1
+        restarted.stop()
+    
+    def test_recovery_keeps_newest_change(self, tmp_path, db_session, client, project):
+        """Test the newest change of a pair wins regardless of segment order."""
+        user_id, project_id = project["user_id"], project["id"]
+        entries = {
+            "likes-100-00000001.journal": (False, "2025-01-01T00:00:02+00:00"),
+            "likes-200-00000001.journal": (True, "2025-01-01T00:00:01+00:00"),
+        }
+        for name, (liked, at) in entries.items():
+            (tmp_path / name).write_text(json.dumps({
+                "user_id": user_id, "project_id": project_id, "liked": liked, "at": at
+            }) + "\n")
+        
+        restarted = make_buffer(tmp_path, db_session)
+        
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 0
+        restarted.stop()
+    
+    def test_second_process_refused(self, tmp_path, db_session):
+        """Test only one buffer at a time may run on a journal directory."""
+        running = make_buffer(tmp_path, db_session)
+        
+        with pytest.raises(RuntimeError, match="single worker"):
+            make_buffer(tmp_path, db_session)
+        
+        running.stop()
+        make_buffer(tmp_path, db_session).stop()
+    
+    def test_several_workers_refused(self, tmp_path, db_session, monkeypatch):
+        """Test the buffer does not start when uvicorn runs several workers."""
+        monkeypatch.setenv("WEB_CONCURRENCY", "4")
+        
+        with pytest.raises(RuntimeError, match="WEB_CONCURRENCY"):
+            make_buffer(tmp_path, db_session)
+    
+    def test_live_journal_is_not_replayed(self, tmp_path, db_session, project):
+        """Test a process does not replay segments another process holds."""
+        live = make_buffer(tmp_path, db_session)
+        live.enqueue(project["user_id"], project["id"], True)
+        
+        other = LikeBuffer(str(tmp_path), 50, 1000, fsync=False)
+        assert other.recover() == 0
+        
+        assert live.flush() == 1
+        live.stop()
+    
+    def test_failed_flush_is_retried(self, tmp_path, db_session, client, project, monkeypatch):
+        """Test changes and their journal are kept when a flush fails."""
+        buffer = make_buffer(tmp_path, db_session)
+        buffer.enqueue(project["user_id"], project["id"], True)
+        
+        def fail(*args, **kwargs):
+            raise RuntimeError("database unavailable")
+        
+        with monkeypatch.context() as patch:
+            patch.setattr(likes, "write_batch", fail)
+            assert buffer.flush() == 0
+        
+        assert buffer.state(project["user_id"], project["id"]) is True
+        assert len(journal_files(tmp_path)) == 2
+        assert buffer.flush() == 1
+        assert client.get(f"/projects/{project['id']}").json()["likes_count"] == 1
+        assert len(journal_files(tmp_path)) == 1
+        buffer.stop()
@@ -0,0 +1,124 @@
+"""
+Tests for the Alembic migration pipeline.
+"""
+
+import subprocess
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.connection import Base
+from database.migrations import SchemaVersionError, head_revision, upgrade_database, verify_schema
+
+
+def sqlite_engine(tmp_path):
+    """Create an engine on a fresh SQLite file."""
+    return create_engine(f"sqlite:///{tmp_path / 'migrations.db'}")
+
+
+class TestMigrations:
+    """Tests for applying migrations."""
+    
+    def test_head_matches_models(self, tmp_path):
+        """Test migrating an empty database yields the model schema."""
+        engine = sqlite_engine(tmp_path)
+        upgrade_database(engine)
+        
+        with engine.connect() as connection:
+            diff = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+        engine.dispose()
+        
+        assert diff == []
+    
+    def test_secondary_indexes_created(self, tmp_path):
+        """Test the per-project and per-user indexes exist after migrating."""
+        engine = sqlite_engine(tmp_path)
+        upgrade_database(engine)
+        
+        inspector = inspect(engine)
+        project_indexes = {index["name"] for index in inspector.get_indexes("projects")}
+        like_indexes = {index["name"] for index in inspector.get_indexes("likes")}
+        review_indexes = {index["name"] for index in inspector.get_indexes("reviews")}
+        engine.dispose()
+        
+        assert "ix_projects_user_id_created_at_id" in project_indexes
+        assert "ix_likes_project_id_created_at" in like_indexes
+        assert "ix_reviews_project_id_created_at_id" in review_indexes
+    
+    def test_legacy_schema_is_stamped_and_upgraded(self, tmp_path):
+        """Test a create_all-era database keeps its data and gains new columns."""
+        engine = sqlite_engine(tmp_path)
+        upgrade_database(engine, "0001_baseline")
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE alembic_version"))
+            connection.execute(text(
+                "INSERT INTO users (id, email, username, hashed_password, is_active) "
+                "VALUES (1, 'a@example.com', 'alice', 'x', 1)"
+            ))
+            connection.execute(text(
+                "INSERT INTO projects (id, title, description, project_url, user_id) "
+                "VALUES (1, 'P', 'D', 'https://example.com', 1)"
+            ))
+            connection.execute(text("INSERT INTO likes (id, user_id, project_id) VALUES (1, 1, 1)"))
+        
+        upgrade_database(engine)
+        
+        with engine.connect() as connection:
+            likes_count = connection.execute(
+                text("SELECT likes_count FROM projects WHERE id = 1")
+            ).scalar_one()
+        engine.dispose()
+        assert likes_count == 1
+    
+    def test_upgrade_is_idempotent(self, tmp_path):
+        """Test running migrations twice is a no-op."""
+        engine = sqlite_engine(tmp_path)
+        upgrade_database(engine)
+        upgrade_database(engine)
+        
+        with engine.connect() as connection:
+            revision = connection.execute(text("SELECT version_num FROM alembic_version")).scalar_one()
+        engine.dispose()
+        assert revision == head_revision()
+
+
+class TestSchemaCheck:
+    """Tests for the startup schema revision check."""
+    
+    def test_strict_rejects_unmigrated_database(self, tmp_path):
+        """Test strict mode refuses a database behind the head revision."""
+        engine = sqlite_engine(tmp_path)
+        upgrade_database(engine, "0002_counters_and_snapshots")
+        
+        with pytest.raises(SchemaVersionError):
+            verify_schema(engine, "strict")
+        verify_schema(engine, "off")
+        engine.dispose()
+    
+    def test_current_database_passes(self, tmp_path):
+        """Test a fully migrated database passes the strict check."""
+        engine = sqlite_engine(tmp_path)
+        upgrade_database(engine)
+        
+        verify_schema(engine, "strict")
+        engine.dispose()
+    
+    def test_import_does_not_touch_database(self):
+        """Test importing the app neither creates an engine nor connects."""
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, DATABASE_URL="postgresql://nobody@127.0.0.1:1/missing")
+        result = subprocess.run(
+            [
+                sys.executable, "-c",
+                "import main, database.connection as c; assert c._engine is None"
+            ],
+            cwd=backend_dir, env=env, capture_output=True, text=True, timeout=60
+        )
+        
+        assert result.returncode == 0, result.stderr
@@ -0,0 +1,223 @@
+"""
+Tests for request instrumentation.
+"""
+
+import logging
+import re
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import settings
+from monitoring import health, metrics
+from monitoring.health import ReadinessProbe
+
+
+def sample(name, **labels):
+    """Read a metric sample from the default registry (0 when absent)."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def use_probe(monkeypatch, **limits):
+    """Serve /health/ready from an uncached probe with the given limits."""
+    options = {
+        "cache_ms": 0, "db_timeout_ms": 1000, "max_pool_saturation": 0.9,
+        "max_loop_lag_ms": 1000, "max_threadpool_lag_ms": 1000,
+    }
+    options.update(limits)
+    probe = ReadinessProbe(**options)
+    monkeypatch.setattr("monitoring.router.readiness", probe)
+    return probe
+
+
+def server_timing(response):
+    """Parse a Server-Timing header into {metric: (duration, description)}."""
+    metrics = {}
+    for entry in response.headers["server-timing"].split(", "):
+        name, *params = entry.split(";")
+        values = dict(param.split("=", 1) for param in params)
+        metrics[name] = (float(values["dur"]), values.get("desc", "").strip('"'))
+    return metrics
+
+
+class TestRequestTiming:
+    """Tests for Server-Timing, slow-query and query-budget reporting."""
+    
+    def test_server_timing_counts_queries(self, client, auth_token, test_project_data, query_counter):
+        """Test the header reports the statements the request executed."""
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        query_counter.clear()
+        
+        response = client.get("/projects/")
+        
+        metrics = server_timing(response)
+        assert metrics["db"][1] == f"{len(query_counter)} queries"
+        assert len(query_counter) > 0
+        assert metrics["total"][0] >= metrics["db"][0]
+    
+    def test_requests_without_queries(self, client):
+        """Test requests that never touch the database report zero queries."""
+        metrics = server_timing(client.get("/"))
+        
+        assert metrics["db"] == (0.0, "0 queries")
+    
+    def test_server_timing_can_be_disabled(self, client, monkeypatch):
+        """Test SERVER_TIMING=False omits the header."""
+        monkeypatch.setattr(settings, "SERVER_TIMING", False)
+        
+        assert "server-timing" not in client.get("/").headers
+    
+    def test_slow_query_logged_with_route(self, client, monkeypatch, caplog):
+        """Test slow statements are logged with the route template."""
+        monkeypatch.setattr(settings, "SLOW_QUERY_MS", 1e-9)
+        
+        with caplog.at_level(logging.WARNING, logger="monitoring.timing"):
+            client.get("/projects/1")
+        
+        messages = [record.getMessage() for record in caplog.records]
+        assert any(
+            re.match(r"Slow query \(.* ms\) in GET /projects/\{project_id\}: SELECT", message)
+            for message in messages
+        )
+    
+    def test_query_budget_flags_request(self, client, auth_token, test_project_data, monkeypatch, caplog):
+        """Test requests over QUERY_BUDGET statements are logged."""
+        monkeypatch.setattr(settings, "QUERY_BUDGET", 1)
+        
+        with caplog.at_level(logging.WARNING, logger="monitoring.timing"):
+            client.post("/projects/", json=test_project_data, params={"token": auth_token})
+            client.get("/")
+        
+        flagged = [record.getMessage() for record in caplog.records if "budget" in record.getMessage()]
+        assert len(flagged) == 1
+        assert re.match(r"POST /projects/ issued \d+ queries \(budget 1\)", flagged[0])
+
+
+class TestMetrics:
+    """Tests for the Prometheus metrics."""
+    
+    def test_requests_labelled_by_route_template(self, client):
+        """Test requests are counted per route template, not raw path."""
+        labels = {"method": "GET", "route": "/projects/{project_id}"}
+        before = sample("http_requests_total", status="404", **labels)
+        observed = sample("http_request_duration_seconds_count", **labels)
+        
+        client.get("/projects/1")
+        client.get("/projects/2")
+        
+        assert sample("http_requests_total", status="404", **labels) == before + 2
+        assert sample("http_request_duration_seconds_count", **labels) == observed + 2
+        assert sample("http_requests_in_progress", method="GET") == 0
+    
+    def test_unmatched_paths_share_a_label(self, client):
+        """Test unknown paths do not create a label per path."""
+        before = sample("http_requests_total", method="GET", route="unmatched", status="404")
+        
+        client.get("/no-such-page-1")
+        client.get("/no-such-page-2")
+        
+        assert sample("http_requests_total", method="GET", route="unmatched", status="404") == before + 2
+    
+    def test_server_errors_counted(self):
+        """Test 5xx responses increment the error counter."""
+        labels = {"method": "POST", "route": "/test/errors"}
+        
+        metrics.record_request("POST", "/test/errors", 503, 0.01)
+        metrics.record_request("POST", "/test/errors", 200, 0.01)
+        
+        assert sample("http_request_errors_total", **labels) == 1
+    
+    def test_password_hashing_observed(self, client, test_user_data):
+        """Test Argon2 hashing and verification durations are recorded."""
+        hashed = sample("password_hash_duration_seconds_count", operation="hash")
+        verified = sample("password_hash_duration_seconds_count", operation="verify")
+        
+        client.post("/auth/register", json=test_user_data)
+        client.post("/auth/login", json={
+            "username": test_user_data["username"],
+            "password": test_user_data["password"]
+        })
+        
+        assert sample("password_hash_duration_seconds_count", operation="hash") == hashed + 1
+        assert sample("password_hash_duration_seconds_count", operation="verify") == verified + 1
+    
+    def test_metrics_endpoint(self, client):
+        """Test /metrics serves the Prometheus text format."""
+        client.get("/")
+        
+        response = client.get("/metrics")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'http_requests_total{method="GET",route="/",status="200"}' in response.text
+        assert "db_pool_checked_out" in response.text
+
+
+class TestHealthProbes:
+    """Tests for the liveness and readiness endpoints."""
+    
+    def test_liveness(self, client):
+        """Test liveness answers without dependencies."""
+        assert client.get("/health/live").json() == {"status": "alive"}
+    
+    def test_ready(self, client, monkeypatch):
+        """Test a healthy worker is ready and reports its checks."""
+        use_probe(monkeypatch)
+        
+        response = client.get("/health/ready")
+        
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "ready"
+        assert body["database"]["ok"] is True
+        assert body["reasons"] == []
+        assert {"event_loop_lag_ms", "threadpool", "pool"} <= body.keys()
+    
+    def test_slow_database_is_not_ready(self, client, monkeypatch):
+        """Test a SELECT 1 over the timeout flips readiness."""
+        use_probe(monkeypatch, db_timeout_ms=20)
+        monkeypatch.setattr(health, "select_one", lambda engine: time.sleep(0.2))
+        
+        response = client.get("/health/ready")
+        
+        assert response.status_code == 503
+        assert response.json()["reasons"] == ["database unavailable"]
+    
+    def test_saturated_pool_is_not_ready(self, client, monkeypatch):
+        """Test an exhausted pool flips readiness without querying."""
+        use_probe(monkeypatch)
+        monkeypatch.setattr(health, "pool_stats", lambda engine: {
+            "checked_out": 15, "size": 5, "max_overflow": 10,
+        })
+        monkeypatch.setattr(health, "select_one", lambda engine: pytest.fail("queried"))
+        
+        response = client.get("/health/ready")
+        
+        assert response.status_code == 503
+        assert response.json()["reasons"] == ["connection pool saturated"]
+        assert response.json()["pool"]["saturation"] == 1.0
+    
+    def test_threadpool_lag_is_not_ready(self, client, monkeypatch):
+        """Test threadpool lag over the limit flips readiness."""
+        use_probe(monkeypatch, max_threadpool_lag_ms=0)
+        
+        response = client.get("/health/ready")
+        
+        assert response.status_code == 503
+        assert response.json()["reasons"] == ["threadpool lag"]
+    
+    def test_results_are_cached(self, client, monkeypatch):
+        """Test repeated probes within the cache period do not query again."""
+        use_probe(monkeypatch, cache_ms=60000)
+        calls = []
+        monkeypatch.setattr(health, "select_one", lambda engine: calls.append(engine) or 0.0)
+        
+        for _ in range(5):
+            assert client.get("/health/ready").status_code == 200
+        
+        assert len(calls) == 1
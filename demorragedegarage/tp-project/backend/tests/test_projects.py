@@ -2,7 +2,23 @@
 Tests for project endpoints.
 """
 
+import json
+import os
+import re
+from datetime import datetime, timezone
+
 import pytest
+from anyio import to_thread
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from auth.models import User
+from database.connection import Base
+from database.migrations import upgrade_database
+from projects import models, pagination, schemas, search
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
 
 
 class TestProjectCreation:
@@ -43,7 +59,7 @@ class TestGetProjects:
         response = client.get("/projects/")
         
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {"items": [], "next_cursor": None}
     
     def test_get_projects_with_data(self, client, auth_token, test_project_data):
         """Test getting projects after creation."""
@@ -56,12 +72,170 @@ class TestGetProjects:
         response = client.get("/projects/")
         
         assert response.status_code == 200
-        projects = response.json()
+        projects = response.json()["items"]
         assert len(projects) == 1
         assert projects[0]["title"] == test_project_data["title"]
         assert "username" in projects[0]
         assert "likes_count" in projects[0]
         assert "reviews_count" in projects[0]
+    
+    def test_get_projects_counts(self, client, auth_token, test_project_data):
+        """Test listing reports like and review counts per project."""
+        create_response = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        )
+        project_id = create_response.json()["id"]
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        client.post(
+            f"/projects/{project_id}/review",
+            json={"content": "Solid", "rating": 4},
+            params={"token": auth_token}
+        )
+        
+        projects = client.get("/projects/").json()["items"]
+        
+        assert projects[0]["likes_count"] == 1
+        assert projects[0]["reviews_count"] == 1
+        assert projects[0]["username"] == "testuser"
+    
+    def test_get_projects_query_count_constant(
+        self, client, auth_token, test_project_data, query_counter
+    ):
+        """Test listing issues the same number of queries regardless of size."""
+        def listing_query_count() -> int:
+            query_counter.clear()
+            response = client.get("/projects/")
+            assert response.status_code == 200
+            return len(query_counter)
+        
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        single_project_queries = listing_query_count()
+        
+        for _ in range(5):
+            client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        many_projects_queries = listing_query_count()
+        
+        assert many_projects_queries == single_project_queries
+    
+    def test_get_projects_without_free_threads(self, client, auth_token, test_project_data):
+        """Test listing and detail reads do not wait for the request threadpool."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        
+        async def exhaust_threadpool():
+            limiter = to_thread.current_default_thread_limiter()
+            borrowers = [object() for _ in range(int(limiter.total_tokens))]
+            for borrower in borrowers:
+                await limiter.acquire_on_behalf_of(borrower)
+            return limiter, borrowers
+        
+        limiter, borrowers = client.portal.call(exhaust_threadpool)
+        try:
+            listing = client.get("/projects/", params={"token": auth_token}, timeout=5)
+            detail = client.get(f"/projects/{project_id}", timeout=5)
+        finally:
+            for borrower in borrowers:
+                client.portal.call(limiter.release_on_behalf_of, borrower)
+        
+        assert listing.status_code == 200
+        assert listing.json()["items"][0]["liked_by_me"] is False
+        assert detail.status_code == 200
+
+
+class TestProjectPagination:
+    """Tests for keyset pagination of project listings."""
+    
+    def create_projects(self, client, auth_token, count):
+        """Create numbered projects and return their IDs."""
+        ids = []
+        for index in range(count):
+            response = client.post(
+                "/projects/",
+                json={
+                    "title": f"Project {index}",
+                    "description": "Paginated project",
+                    "project_url": f"https://example.com/{index}"
+                },
+                params={"token": auth_token}
+            )
+            ids.append(response.json()["id"])
+        return ids
+    
+    def test_pages_cover_all_projects_newest_first(self, client, auth_token):
+        """Test following next_cursor visits every project exactly once."""
+        ids = self.create_projects(client, auth_token, 5)
+        
+        seen = []
+        params = {"limit": 2}
+        while True:
+            page = client.get("/projects/", params=params).json()
+            assert len(page["items"]) <= 2
+            seen.extend(project["id"] for project in page["items"])
+            if page["next_cursor"] is None:
+                break
+            params = {"limit": 2, "cursor": page["next_cursor"]}
+        
+        assert seen == sorted(ids, reverse=True)
+    
+    def test_sort_most_liked(self, client, auth_token):
+        """Test most_liked ordering puts liked projects first."""
+        ids = self.create_projects(client, auth_token, 3)
+        client.post(f"/projects/{ids[0]}/like", params={"token": auth_token})
+        
+        first_page = client.get("/projects/", params={"sort": "most_liked", "limit": 1}).json()
+        second_page = client.get(
+            "/projects/",
+            params={"sort": "most_liked", "limit": 2, "cursor": first_page["next_cursor"]}
+        ).json()
+        
+        assert first_page["items"][0]["id"] == ids[0]
+        assert [project["id"] for project in second_page["items"]] == [ids[2], ids[1]]
+        assert second_page["next_cursor"] is None
+    
+    def test_invalid_cursor(self, client):
+        """Test malformed cursor is rejected."""
+        response = client.get("/projects/", params={"cursor": "not-a-cursor"})
+        
+        assert response.status_code == 400
+        assert "Invalid cursor" in response.json()["detail"]
+    
+    def test_cursor_from_other_sort_rejected(self, client, auth_token):
+        """Test cursor issued for one ordering cannot be reused for another."""
+        self.create_projects(client, auth_token, 2)
+        page = client.get("/projects/", params={"limit": 1}).json()
+        
+        response = client.get(
+            "/projects/",
+            params={"sort": "most_reviewed", "cursor": page["next_cursor"]}
+        )
+        
+        assert response.status_code == 400
+    
+    @pytest.mark.parametrize("sort,values", [
+        ("newest", ["2024-01-01", 1]),
+        ("newest", [datetime(2024, 1, 1), "1"]),
+        ("most_liked", [True, datetime(2024, 1, 1), 1]),
+        ("trending", [1.5, 2.5]),
+    ])
+    def test_cursor_value_types_checked(self, client, sort, values):
+        """Test cursor values must match the types of the sort keys."""
+        cursor = pagination.encode_cursor(sort, values)
+        
+        response = client.get("/projects/", params={"sort": sort, "cursor": cursor})
+        
+        assert response.status_code == 400
+        assert "Invalid cursor" in response.json()["detail"]
+    
+    def test_cursor_with_integral_float_key(self, client):
+        """Test a whole-number value is accepted for a float sort key."""
+        cursor = pagination.encode_cursor("trending", [3, 1])
+        
+        assert client.get("/projects/", params={"sort": "trending", "cursor": cursor}).status_code == 200
 
 
 class TestGetMyProjects:
@@ -78,7 +252,7 @@ class TestGetMyProjects:
         response = client.get("/projects/my", params={"token": auth_token})
         
         assert response.status_code == 200
-        projects = response.json()
+        projects = response.json()["items"]
         assert len(projects) == 1
     
     def test_get_my_projects_unauthorized(self, client):
@@ -165,6 +339,114 @@ class TestProjectLikes:
             params={"token": auth_token}
         )
         assert liked.json() is True
+    
+    def test_batch_liked(self, client, auth_token, test_project_data):
+        """Test batch liked endpoint returns only liked project IDs."""
+        ids = [
+            client.post(
+                "/projects/",
+                json=test_project_data,
+                params={"token": auth_token}
+            ).json()["id"]
+            for _ in range(3)
+        ]
+        client.post(f"/projects/{ids[1]}/like", params={"token": auth_token})
+        
+        response = client.post(
+            "/projects/liked",
+            json={"project_ids": ids + [999]},
+            params={"token": auth_token}
+        )
+        
+        assert response.status_code == 200
+        assert response.json() == {"project_ids": [ids[1]]}
+    
+    def test_listing_liked_by_me(self, client, auth_token, test_project_data):
+        """Test listing flags liked projects when a token is given."""
+        create_response = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        )
+        project_id = create_response.json()["id"]
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        anonymous = client.get("/projects/").json()["items"]
+        personal = client.get("/projects/", params={"token": auth_token}).json()["items"]
+        
+        assert anonymous[0]["liked_by_me"] is None
+        assert personal[0]["liked_by_me"] is True
+    
+    def test_put_like_is_idempotent(self, client, auth_token, test_project_data):
+        """Test repeating PUT leaves a single like."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        
+        for _ in range(2):
+            response = client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+            assert response.status_code == 200
+            assert response.json() == {"project_id": project_id, "liked": True}
+        
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 1
+    
+    def test_delete_like_is_idempotent(self, client, auth_token, test_project_data):
+        """Test repeating DELETE succeeds and only removes the like once."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        for _ in range(2):
+            response = client.delete(f"/projects/{project_id}/like", params={"token": auth_token})
+            assert response.status_code == 200
+            assert response.json() == {"project_id": project_id, "liked": False}
+        
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 0
+    
+    @pytest.mark.parametrize("method", ["post", "put", "delete"])
+    def test_like_missing_project(self, client, auth_token, method):
+        """Test like writes on a missing project return 404."""
+        response = getattr(client, method)("/projects/999/like", params={"token": auth_token})
+        
+        assert response.status_code == 404
+    
+    def test_like_is_single_statement(
+        self, client, auth_token, test_project_data, query_counter
+    ):
+        """Test a like writes with one INSERT and no existence SELECTs."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        
+        query_counter.clear()
+        client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        writes = [s.split()[0] for s in query_counter]
+        assert writes.count("INSERT") == 1
+        assert "SELECT" not in writes
+    
+    def test_concurrent_duplicate_is_noop(self, db_session, client, auth_token, test_project_data):
+        """Test a duplicate insert racing past the first is a no-op, not an error."""
+        from projects import likes
+        project = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()
+        project_id, user_id = project["id"], project["user_id"]
+        
+        assert likes.add_like(db_session, user_id, project_id) is not None
+        assert likes.add_like(db_session, user_id, project_id) is None
+        db_session.commit()
+        
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 1
 
 
 class TestProjectReviews:
@@ -227,11 +509,64 @@ class TestProjectReviews:
         reviews_response = client.get(f"/projects/{project_id}/reviews")
         
         assert reviews_response.status_code == 200
-        reviews = reviews_response.json()
+        reviews = reviews_response.json()["items"]
         assert len(reviews) == 1
         assert reviews[0]["content"] == "Nice work!"
 
 
+class TestProjectCounters:
+    """Tests for denormalized like/review counters."""
+    
+    def test_counters_follow_writes(self, client, auth_token, test_project_data):
+        """Test like, unlike and review keep project counters in sync."""
+        create_response = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        )
+        project_id = create_response.json()["id"]
+        
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        client.post(
+            f"/projects/{project_id}/review",
+            json={"content": "Good", "rating": 4},
+            params={"token": auth_token}
+        )
+        project = client.get(f"/projects/{project_id}").json()
+        assert project["likes_count"] == 1
+        assert project["reviews_count"] == 1
+        assert project["average_rating"] == 4.0
+        
+        client.delete(f"/projects/{project_id}/like", params={"token": auth_token})
+        project = client.get(f"/projects/{project_id}").json()
+        assert project["likes_count"] == 0
+    
+    def test_reconcile_counters(self, client, db_session, auth_token, test_project_data):
+        """Test reconciliation repairs drifted counters."""
+        from sqlalchemy import update
+        from projects import counters, models
+        
+        create_response = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        )
+        project_id = create_response.json()["id"]
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        db_session.execute(
+            update(models.Project).values(likes_count=42, reviews_count=3)
+        )
+        db_session.commit()
+        
+        assert counters.reconcile_counters(db_session) == 1
+        assert counters.reconcile_counters(db_session) == 0
+        project = client.get(f"/projects/{project_id}").json()
+        assert project["likes_count"] == 1
+        assert project["reviews_count"] == 0
+        assert project["average_rating"] is None
+
+
 class TestAnalytics:
     """Tests for analytics endpoint."""
     
@@ -260,3 +595,602 @@ class TestAnalytics:
         data = response.json()
         assert data["total_projects"] == 1
         assert len(data["top_projects"]) == 1
+    
+    def test_get_analytics_served_from_snapshot(
+        self, client, auth_token, test_project_data, query_counter
+    ):
+        """Test repeated analytics calls read the snapshot and report staleness."""
+        client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        )
+        first = client.get("/projects/analytics/top").json()
+        assert first["generated_at"] is not None
+        
+        client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        )
+        query_counter.clear()
+        second = client.get("/projects/analytics/top").json()
+        
+        assert len(query_counter) == 1
+        assert second["total_projects"] == 1
+        assert second["generated_at"] == first["generated_at"]
+        assert second["stale_seconds"] >= 0
+    
+    def test_stale_snapshot_served_while_refreshing(
+        self, client, db_session, auth_token, test_project_data, monkeypatch
+    ):
+        """Test an expired snapshot is served as is and refreshed in the background."""
+        from sqlalchemy import update
+        from projects import analytics
+        
+        first = client.get("/projects/analytics/top").json()
+        db_session.execute(update(models.AnalyticsSnapshot).values(
+            refreshed_at=datetime(2020, 1, 1)
+        ))
+        db_session.commit()
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        threads = []
+        refresh = analytics.refresh_in_background
+        monkeypatch.setattr(
+            analytics, "refresh_in_background", lambda *args: threads.append(refresh(*args))
+        )
+        
+        stale = client.get("/projects/analytics/top").json()
+        for thread in threads:
+            thread.join()
+        fresh = client.get("/projects/analytics/top").json()
+        
+        assert first["total_projects"] == 0
+        assert stale["total_projects"] == 0
+        assert stale["stale_seconds"] > 60
+        assert len(threads) == 1
+        assert fresh["total_projects"] == 1
+        assert fresh["generated_at"] != first["generated_at"]
+    
+    def test_recent_snapshot_not_recomputed(self, client, db_session, query_counter):
+        """Test a refresh keeps a snapshot younger than min_age_seconds."""
+        from projects import analytics
+        
+        first = analytics.refresh_snapshot(db_session)
+        generated_at = first.refreshed_at
+        query_counter.clear()
+        
+        kept = analytics.refresh_snapshot(db_session, min_age_seconds=60)
+        
+        assert kept.refreshed_at == generated_at
+        assert all("FROM analytics_snapshots" in statement for statement in query_counter)
+
+
+class TestHttpCaching:
+    """Tests for ETag validation and Cache-Control headers."""
+    
+    def test_project_not_modified(self, client, auth_token, test_project_data):
+        """Test a matching If-None-Match returns 304 without a body."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        
+        first = client.get(f"/projects/{project_id}")
+        etag = first.headers["etag"]
+        assert "public" in first.headers["cache-control"]
+        
+        second = client.get(f"/projects/{project_id}", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+    
+    def test_like_changes_etags(self, client, auth_token, test_project_data):
+        """Test a like invalidates the project and listing ETags."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        project_etag = client.get(f"/projects/{project_id}").headers["etag"]
+        listing_etag = client.get("/projects/").headers["etag"]
+        
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        project = client.get(f"/projects/{project_id}", headers={"If-None-Match": project_etag})
+        listing = client.get("/projects/", headers={"If-None-Match": listing_etag})
+        assert project.status_code == 200
+        assert project.json()["likes_count"] == 1
+        assert listing.status_code == 200
+        assert listing.headers["etag"] != listing_etag
+    
+    def test_review_changes_reviews_etag(self, client, auth_token, test_project_data):
+        """Test a new review invalidates the reviews ETag."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        etag = client.get(f"/projects/{project_id}/reviews").headers["etag"]
+        assert client.get(
+            f"/projects/{project_id}/reviews", headers={"If-None-Match": etag}
+        ).status_code == 304
+        
+        client.post(
+            f"/projects/{project_id}/review",
+            json={"content": "Nice", "rating": 5},
+            params={"token": auth_token}
+        )
+        
+        response = client.get(f"/projects/{project_id}/reviews", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 1
+    
+    def test_personalized_listing_is_private(self, client, auth_token):
+        """Test listings requested with a token are not publicly cacheable."""
+        response = client.get("/projects/", params={"token": auth_token})
+        
+        assert response.status_code == 200
+        assert response.headers["cache-control"].startswith("private")
+    
+    def test_analytics_not_modified(self, client):
+        """Test analytics revalidate against the snapshot time."""
+        etag = client.get("/projects/analytics/top").headers["etag"]
+        
+        response = client.get("/projects/analytics/top", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+
+class TestReadCache:
+    """Tests for the read-through project cache."""
+    
+    def test_project_detail_served_from_cache(
+        self, client, auth_token, test_project_data, query_counter
+    ):
+        """Test a repeated detail read issues no queries."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        client.get(f"/projects/{project_id}")
+        
+        query_counter.clear()
+        response = client.get(f"/projects/{project_id}")
+        
+        assert response.status_code == 200
+        assert query_counter == []
+    
+    def test_like_invalidates_detail_and_listing(
+        self, client, auth_token, test_project_data
+    ):
+        """Test writes invalidate the affected cached reads."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        client.get(f"/projects/{project_id}")
+        client.get("/projects/")
+        
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        assert client.get(f"/projects/{project_id}").json()["likes_count"] == 1
+        assert client.get("/projects/").json()["items"][0]["likes_count"] == 1
+    
+    def test_like_keeps_cached_listing_page(
+        self, client, auth_token, test_project_data, query_counter
+    ):
+        """Test a like refreshes only the liked row of a cached page."""
+        first_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        client.get("/projects/")
+        
+        client.post(f"/projects/{first_id}/like", params={"token": auth_token})
+        query_counter.clear()
+        items = client.get("/projects/").json()["items"]
+        
+        assert [item["likes_count"] for item in items] == [0, 1]
+        assert len(query_counter) == 1
+        assert "LIMIT" not in query_counter[0]
+    
+    def test_create_keeps_other_sorts_cached(
+        self, client, auth_token, test_project_data, query_counter
+    ):
+        """Test a new project only retires the sorts it enters at the top."""
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        client.get("/projects/", params={"sort": "most_liked"})
+        
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        query_counter.clear()
+        client.get("/projects/", params={"sort": "most_liked"})
+        
+        assert query_counter == []
+    
+    def test_create_invalidates_listing(self, client, auth_token, test_project_data):
+        """Test a new project appears in a previously cached listing."""
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        assert len(client.get("/projects/").json()["items"]) == 1
+        
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        assert len(client.get("/projects/").json()["items"]) == 2
+    
+    def test_health_reports_cache_stats(self, client, auth_token, test_project_data):
+        """Test the health endpoint exposes hit/miss counters."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        client.get(f"/projects/{project_id}")
+        client.get(f"/projects/{project_id}")
+        
+        cache = client.get("/health").json()["cache"]
+        assert cache["backend"] == "memory"
+        assert cache["hits"] >= 1
+        assert cache["misses"] >= 1
+
+
+class TestProjectSearch:
+    """Tests for full-text project search (in-memory index on SQLite)."""
+    
+    def create(self, client, auth_token, title, description):
+        """Create a project and return its ID."""
+        return client.post(
+            "/projects/",
+            json={
+                "title": title,
+                "description": description,
+                "project_url": "https://example.com"
+            },
+            params={"token": auth_token}
+        ).json()["id"]
+    
+    def test_search_ranks_title_matches_first(self, client, auth_token):
+        """Test title matches outrank description-only matches."""
+        in_description = self.create(client, auth_token, "Tracker", "Rocket telemetry dashboard")
+        in_title = self.create(client, auth_token, "Rocket launcher", "Launch scheduling")
+        self.create(client, auth_token, "Unrelated", "Nothing to see here")
+        
+        response = client.get("/projects/search", params={"q": "rocket"})
+        
+        assert response.status_code == 200
+        ids = [item["id"] for item in response.json()["items"]]
+        assert ids == [in_title, in_description]
+    
+    def test_search_requires_all_terms(self, client, auth_token):
+        """Test every query word must match."""
+        both = self.create(client, auth_token, "Solar farm", "Solar energy analytics")
+        self.create(client, auth_token, "Solar toy", "A small gadget")
+        
+        items = client.get("/projects/search", params={"q": "solar energy"}).json()["items"]
+        
+        assert [item["id"] for item in items] == [both]
+    
+    def test_search_sees_new_projects(self, client, auth_token):
+        """Test projects created after the index was built are found."""
+        self.create(client, auth_token, "First", "Alpha")
+        assert client.get("/projects/search", params={"q": "beta"}).json()["items"] == []
+        
+        created = self.create(client, auth_token, "Second", "Beta")
+        items = client.get("/projects/search", params={"q": "beta"}).json()["items"]
+        
+        assert [item["id"] for item in items] == [created]
+    
+    def test_search_pagination(self, client, auth_token):
+        """Test search results page through every match once."""
+        created = {self.create(client, auth_token, f"Widget {i}", "Widget maker") for i in range(5)}
+        
+        seen = []
+        cursor = None
+        while True:
+            params = {"q": "widget", "limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            page = client.get("/projects/search", params=params).json()
+            seen.extend(item["id"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        
+        assert sorted(seen) == sorted(created)
+    
+    def test_search_pagination_with_tied_ranks(self, client, auth_token):
+        """Test pages of equally ranked matches follow ID order without overlap."""
+        created = [self.create(client, auth_token, "Widget", "Widget maker") for _ in range(5)]
+        
+        first = client.get("/projects/search", params={"q": "widget", "limit": 2}).json()
+        second = client.get(
+            "/projects/search", params={"q": "widget", "limit": 2, "cursor": first["next_cursor"]}
+        ).json()
+        third = client.get(
+            "/projects/search", params={"q": "widget", "limit": 2, "cursor": second["next_cursor"]}
+        ).json()
+        
+        ids = [item["id"] for page in (first, second, third) for item in page["items"]]
+        assert ids == sorted(created, reverse=True)
+        assert third["next_cursor"] is None
+    
+    def test_search_cursor_value_types_checked(self, client):
+        """Test a search cursor with a non-numeric rank is rejected."""
+        cursor = pagination.encode_cursor(search.SEARCH_SORT, ["high", 1])
+        
+        response = client.get("/projects/search", params={"q": "widget", "cursor": cursor})
+        
+        assert response.status_code == 400
+    
+    def test_postgres_rank_compared_as_double(self):
+        """Test the PostgreSQL rank is cast to double precision for ordering and cursors."""
+        cursor = pagination.encode_cursor(search.SEARCH_SORT, [0.0607927, 3])
+        
+        sql = str(search.postgres_search_query("widget", cursor, 2).compile(dialect=postgresql.dialect()))
+        
+        assert re.search(r"CAST\(ts_rank\(.*\) AS FLOAT\(53\)\) AS rank", sql)
+        assert re.search(r"\(CAST\(ts_rank\(.*\) AS FLOAT\(53\)\), projects\.id\) < ", sql)
+        assert "ORDER BY rank DESC, projects.id DESC" in sql
+    
+    def test_search_rejects_empty_query(self, client):
+        """Test a missing or empty query is a validation error."""
+        assert client.get("/projects/search").status_code == 422
+        assert client.get("/projects/search", params={"q": ""}).status_code == 422
+
+
+@pytest.fixture
+def pg_session():
+    """Migrate the database in TEST_POSTGRES_URL and drop everything afterwards."""
+    pg_engine = create_engine(POSTGRES_URL)
+    upgrade_database(pg_engine)
+    session = Session(pg_engine)
+    yield session
+    session.close()
+    Base.metadata.drop_all(pg_engine)
+    with pg_engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    pg_engine.dispose()
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+class TestPostgresSearch:
+    """Tests for tsvector search against a disposable PostgreSQL database."""
+    
+    def test_pagination_with_tied_ranks(self, pg_session):
+        """Test equally ranked matches page in ID order without repeats or gaps."""
+        owner = User(email="pg@example.com", username="pg", hashed_password="x")
+        pg_session.add(owner)
+        pg_session.flush()
+        projects = [
+            models.Project(
+                title="Widget", description="Widget maker",
+                project_url="https://example.com", user_id=owner.id
+            )
+            for _ in range(5)
+        ]
+        pg_session.add_all(projects)
+        pg_session.commit()
+        
+        seen = []
+        cursor = None
+        while True:
+            page = search.search_projects(pg_session, "widget", cursor, 2)
+            seen.extend(item.id for item in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        assert seen == sorted((project.id for project in projects), reverse=True)
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+class TestPostgresAnalytics:
+    """Tests for cross-worker analytics refresh against a disposable PostgreSQL database."""
+    
+    def test_refresh_skipped_while_another_worker_refreshes(self, pg_session):
+        """Test a non-waiting refresh gives up while the advisory lock is held."""
+        from projects import analytics
+        
+        with Session(pg_session.get_bind()) as other:
+            other.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": analytics.ANALYTICS_LOCK_ID})
+            
+            assert analytics.refresh_snapshot(pg_session, wait=False) is None
+            other.rollback()
+        
+        assert analytics.refresh_snapshot(pg_session, wait=False) is not None
+
+
+class TestTrending:
+    """Tests for time-decayed trending scores."""
+    
+    def create(self, client, auth_token, title):
+        """Create a project and return its ID."""
+        return client.post(
+            "/projects/",
+            json={"title": title, "description": "d", "project_url": "https://example.com"},
+            params={"token": auth_token}
+        ).json()["id"]
+    
+    def test_liked_project_trends_first(self, client, auth_token):
+        """Test a like lifts an older project above a newer one."""
+        older = self.create(client, auth_token, "Older")
+        newer = self.create(client, auth_token, "Newer")
+        client.post(f"/projects/{older}/like", params={"token": auth_token})
+        
+        response = client.get("/projects/trending")
+        
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [older, newer]
+    
+    def test_unlike_restores_ranking(self, client, auth_token):
+        """Test retracting a like removes its contribution."""
+        older = self.create(client, auth_token, "Older")
+        newer = self.create(client, auth_token, "Newer")
+        client.post(f"/projects/{older}/like", params={"token": auth_token})
+        client.delete(f"/projects/{older}/like", params={"token": auth_token})
+        
+        items = client.get("/projects/trending").json()["items"]
+        
+        assert [item["id"] for item in items] == [newer, older]
+    
+    def test_like_and_unlike_update_project_once(self, client, db_session, auth_token, query_counter):
+        """Test counters, version and trending score move in a single UPDATE."""
+        from projects import likes
+        
+        project_id = self.create(client, auth_token, "Counted")
+        user_id = client.get("/auth/me", params={"token": auth_token}).json()["id"]
+        query_counter.clear()
+        
+        likes.add_like(db_session, user_id, project_id)
+        likes.remove_like(db_session, user_id, project_id)
+        db_session.commit()
+        
+        updates = [statement for statement in query_counter if statement.startswith("UPDATE projects")]
+        assert len(updates) == 2
+        assert len(query_counter) == 4
+    
+    def test_retract_falls_back_to_creation_score(self, client, db_session, auth_token):
+        """Test a score rounded away falls back to the creation event in the same UPDATE."""
+        from sqlalchemy import update
+        from projects import likes, models, trending
+        
+        project_id = self.create(client, auth_token, "Drifted")
+        user_id = client.get("/auth/me", params={"token": auth_token}).json()["id"]
+        likes.add_like(db_session, user_id, project_id)
+        db_session.execute(update(models.Project).values(trending_score=0.0))
+        
+        likes.remove_like(db_session, user_id, project_id)
+        db_session.commit()
+        
+        project = db_session.get(models.Project, project_id)
+        expected = trending.event_score(trending.CREATE_WEIGHT, project.created_at)
+        assert project.trending_score == pytest.approx(expected, abs=1e-4)
+    
+    def test_old_events_decay(self):
+        """Test an event one half-life older is worth half as much."""
+        from datetime import timedelta
+        from config import settings
+        from projects import trending
+        
+        now = trending.EPOCH + timedelta(days=365)
+        earlier = now - timedelta(hours=settings.TRENDING_HALF_LIFE_HOURS)
+        
+        assert trending.event_score(1.0, earlier) == pytest.approx(trending.event_score(0.5, now))
+    
+    def test_recompute_matches_incremental(self, client, db_session, auth_token):
+        """Test rebuilding scores from source rows reproduces incremental updates."""
+        from projects import models, trending
+        
+        project_id = self.create(client, auth_token, "Scored")
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        client.post(
+            f"/projects/{project_id}/review",
+            json={"content": "Good", "rating": 4},
+            params={"token": auth_token}
+        )
+        incremental = db_session.get(models.Project, project_id).trending_score
+        
+        assert trending.recompute_scores(db_session) == 1
+        db_session.expire_all()
+        
+        assert db_session.get(models.Project, project_id).trending_score == pytest.approx(incremental)
+    
+    def test_trending_pagination(self, client, auth_token):
+        """Test trending pages cover every project once."""
+        created = {self.create(client, auth_token, f"P{i}") for i in range(5)}
+        
+        first = client.get("/projects/trending", params={"limit": 3}).json()
+        second = client.get(
+            "/projects/trending", params={"limit": 3, "cursor": first["next_cursor"]}
+        ).json()
+        
+        seen = [item["id"] for item in first["items"] + second["items"]]
+        assert sorted(seen) == sorted(created)
+        assert second["next_cursor"] is None
+
+
+class TestStreamingListing:
+    """Tests for the streamed project listing."""
+    
+    def test_stream_ndjson(self, client, auth_token, test_project_data):
+        """Test every project is streamed as one JSON line, newest first."""
+        ids = [
+            client.post("/projects/", json=test_project_data, params={"token": auth_token}).json()["id"]
+            for _ in range(3)
+        ]
+        
+        response = client.get("/projects/stream")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["id"] for line in lines] == list(reversed(ids))
+        assert lines[0]["username"] == "testuser"
+    
+    def test_stream_json_array_across_chunks(
+        self, client, auth_token, test_project_data, monkeypatch
+    ):
+        """Test the chunked JSON array stays valid when split over chunks."""
+        from projects import streaming
+        monkeypatch.setattr(streaming, "CHUNK_ROWS", 2)
+        for _ in range(5):
+            client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        
+        response = client.get("/projects/stream", params={"format": "json", "limit": 4})
+        
+        assert len(response.json()) == 4
+    
+    def test_stream_empty(self, client):
+        """Test an empty catalogue streams an empty array."""
+        assert client.get("/projects/stream", params={"format": "json"}).json() == []
+
+
+class TestFastSerialization:
+    """Tests for the orjson listing serializer."""
+    
+    def _row(self, created_at, reviews_count=2, rating_total=9):
+        return {
+            "id": 7, "title": "Title", "description": "Description",
+            "project_url": "https://example.com", "user_id": 3,
+            "created_at": created_at, "username": "owner",
+            "likes_count": 4, "reviews_count": reviews_count,
+            "rating_total": rating_total, "version": 1, "trending_score": 0.0,
+        }
+    
+    @pytest.mark.parametrize("created_at", [
+        datetime(2024, 5, 1, 12, 30, 15, 123456),
+        datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+    ])
+    @pytest.mark.parametrize("liked", [None, set(), {7}])
+    def test_matches_schema_output(self, created_at, liked):
+        """Test the fast path encodes exactly what the Pydantic schema does."""
+        from projects import queries, serialization
+        row = self._row(created_at)
+        
+        expected = queries.row_to_project_with_user(row)
+        if liked is not None:
+            expected.liked_by_me = 7 in liked
+        
+        assert serialization.dumps(serialization.project_item(row, liked)) == expected.model_dump_json().encode()
+    
+    def test_no_reviews_has_null_rating(self):
+        """Test a project without reviews is encoded with a null rating."""
+        from projects import serialization
+        item = serialization.project_item(self._row(datetime(2024, 1, 1), 0, 0))
+        
+        assert item["average_rating"] is None
+    
+    def test_listing_response(self, client, auth_token, test_project_data):
+        """Test the listing keeps its schema, content type and caching headers."""
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        
+        response = client.get("/projects/", params={"token": auth_token})
+        
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["cache-control"].startswith("private")
+        assert "etag" in response.headers
+        item = response.json()["items"][0]
+        assert set(item) == set(schemas.ProjectWithUser.model_fields)
+        assert item["liked_by_me"] is False
@@ -0,0 +1,156 @@
+"""
+Tests for realtime counter updates.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from realtime import broker as broker_module
+from realtime.broker import Broker, Subscriber, notify_payloads
+from realtime.router import event_stream
+
+
+def counts(project_id, version, likes_count=0):
+    """Build a counts event."""
+    return {
+        "project_id": project_id, "likes_count": likes_count, "reviews_count": 0,
+        "average_rating": None, "version": version,
+    }
+
+
+@pytest.fixture
+def published(monkeypatch):
+    """Capture events published by committed transactions."""
+    events = []
+    monkeypatch.setattr(broker_module.broker, "publish", events.extend)
+    return events
+
+
+class TestSubscriber:
+    """Tests for per-stream coalescing and backpressure."""
+    
+    def test_keeps_newest_version_per_project(self):
+        """Test queued events for one project collapse into the newest."""
+        async def scenario():
+            subscriber = Subscriber(limit=10)
+            subscriber.offer(1, 2, "a2")
+            subscriber.offer(1, 1, "a1")
+            subscriber.offer(2, 1, "b1")
+            subscriber.offer(1, 3, "a3")
+            return await subscriber.receive(1)
+        
+        assert asyncio.run(scenario()) == (False, ["a3", "b1"])
+    
+    def test_overflow_asks_for_resync(self):
+        """Test a backlog over the limit is replaced by one resync."""
+        async def scenario():
+            subscriber = Subscriber(limit=2)
+            for project_id in range(5):
+                subscriber.offer(project_id, 1, str(project_id))
+            first = await subscriber.receive(1)
+            subscriber.offer(9, 1, "9")
+            return first, await subscriber.receive(1)
+        
+        first, second = asyncio.run(scenario())
+        
+        assert first == (True, [])
+        assert second == (False, ["9"])
+    
+    def test_receive_times_out(self):
+        """Test an idle stream wakes up for heartbeats."""
+        assert asyncio.run(Subscriber(limit=1).receive(0.01)) is None
+
+
+class TestEventStream:
+    """Tests for the Server-Sent Events stream."""
+    
+    def test_stream_delivers_events_and_unsubscribes(self, monkeypatch):
+        """Test dispatched events are framed as SSE and the stream cleans up."""
+        broker = Broker(queue_limit=10, max_subscribers=1)
+        monkeypatch.setattr("realtime.router.broker", broker)
+        
+        async def scenario():
+            stream = event_stream(heartbeat=0.01)
+            chunks = [await stream.__anext__()]
+            broker.dispatch([counts(7, 4, likes_count=4)])
+            chunks.append(await stream.__anext__())
+            chunks.append(await stream.__anext__())
+            subscribed = broker.describe()["subscribers"]
+            await stream.aclose()
+            return chunks, subscribed
+        
+        chunks, subscribed = asyncio.run(scenario())
+        
+        assert chunks[0].startswith("retry:")
+        name, data = chunks[1].strip().split("\n")
+        assert name == "event: counts"
+        assert json.loads(data.removeprefix("data: "))["likes_count"] == 4
+        assert chunks[2] == ": keep-alive\n\n"
+        assert subscribed == 1
+        assert broker.describe()["subscribers"] == 0
+    
+    def test_subscriber_limit(self, client, monkeypatch):
+        """Test streams beyond the per-worker limit are refused."""
+        monkeypatch.setattr(broker_module.broker, "max_subscribers", 0)
+        
+        assert client.get("/events").status_code == 503
+    
+    def test_notify_payloads_fit_limit(self):
+        """Test large batches are split into NOTIFY-sized JSON arrays."""
+        events = [counts(project_id, 1) for project_id in range(500)]
+        
+        payloads = list(notify_payloads(events))
+        
+        assert len(payloads) > 1
+        assert all(len(payload) <= broker_module.NOTIFY_PAYLOAD_LIMIT for payload in payloads)
+        assert [item for payload in payloads for item in json.loads(payload)] == events
+
+
+class TestPublishedCounts:
+    """Tests for events published by write endpoints."""
+    
+    def test_create_like_review_publish_counts(
+        self, client, auth_token, test_project_data, published
+    ):
+        """Test every counter change publishes the project's new counts."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+        client.post(
+            f"/projects/{project_id}/review",
+            json={"content": "Great", "rating": 4},
+            params={"token": auth_token}
+        )
+        client.delete(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        assert [
+            (item["likes_count"], item["reviews_count"], item["average_rating"], item["version"])
+            for item in published
+        ] == [(0, 0, None, 1), (1, 0, None, 2), (1, 1, 4.0, 3), (0, 1, 4.0, 4)]
+        assert {item["project_id"] for item in published} == {project_id}
+    
+    def test_noop_and_failed_writes_publish_nothing(
+        self, client, auth_token, test_project_data, published
+    ):
+        """Test idempotent no-ops and rejected writes do not publish."""
+        project_id = client.post(
+            "/projects/",
+            json=test_project_data,
+            params={"token": auth_token}
+        ).json()["id"]
+        client.post(f"/projects/{project_id}/like", params={"token": auth_token})
+        published.clear()
+        
+        assert client.post(f"/projects/{project_id}/like", params={"token": auth_token}).status_code == 400
+        client.put(f"/projects/{project_id}/like", params={"token": auth_token})
+        
+        assert published == []
@@ -0,0 +1,96 @@
+"""
+Tests for the verified token cache.
+"""
+
+import time
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth.token_cache import TokenCache, TokenIdentity
+from auth.utils import decode_token
+
+
+class TestTokenCache:
+    """Tests for the TokenCache container."""
+    
+    def test_get_returns_cached_identity(self):
+        """Test a cached token resolves to its identity."""
+        cache = TokenCache(max_entries=10, ttl_seconds=60)
+        identity = TokenIdentity(id=1, username="alice", is_active=True)
+        cache.set("token", identity)
+        
+        assert cache.get("token") == identity
+        assert cache.get("other") is None
+    
+    def test_ttl_bounded_by_token_expiry(self):
+        """Test entries never outlive the token's exp claim."""
+        cache = TokenCache(max_entries=10, ttl_seconds=60)
+        identity = TokenIdentity(id=1, username="alice", is_active=True)
+        cache.set("expired", identity, token_expires_at=time.time() - 1)
+        
+        assert cache.get("expired") is None
+    
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted first."""
+        cache = TokenCache(max_entries=2, ttl_seconds=60)
+        for index in range(2):
+            cache.set(f"t{index}", TokenIdentity(id=index, username=f"u{index}", is_active=True))
+        cache.get("t0")
+        cache.set("t2", TokenIdentity(id=2, username="u2", is_active=True))
+        
+        assert cache.get("t0") is not None
+        assert cache.get("t1") is None
+        assert cache.get("t2") is not None
+    
+    def test_invalidate_user(self):
+        """Test invalidation drops all tokens of one user only."""
+        cache = TokenCache(max_entries=10, ttl_seconds=60)
+        alice = TokenIdentity(id=1, username="alice", is_active=True)
+        bob = TokenIdentity(id=2, username="bob", is_active=True)
+        cache.set("a1", alice)
+        cache.set("a2", alice)
+        cache.set("b1", bob)
+        
+        cache.invalidate_user(1)
+        
+        assert cache.get("a1") is None
+        assert cache.get("a2") is None
+        assert cache.get("b1") == bob
+
+
+class TestTokenResolution:
+    """Tests for token resolution in request handling."""
+    
+    def test_login_token_carries_user_id(self, auth_token, registered_user):
+        """Test issued tokens include the user_id claim."""
+        assert decode_token(auth_token)["user_id"] == registered_user["id"]
+    
+    def test_cached_token_skips_user_query(
+        self, client, auth_token, test_project_data, query_counter
+    ):
+        """Test repeated authenticated calls do not query the users table."""
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        query_counter.clear()
+        
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        
+        assert not any("FROM users" in statement for statement in query_counter)
+    
+    def test_deactivation_invalidates_cache(
+        self, client, db_session, auth_token, registered_user, test_project_data
+    ):
+        """Test a deactivated user is rejected even with a cached token."""
+        from auth import models
+        
+        client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        
+        user = db_session.get(models.User, registered_user["id"])
+        user.is_active = False
+        db_session.commit()
+        
+        response = client.post("/projects/", json=test_project_data, params={"token": auth_token})
+        
+        assert response.status_code == 403
+        assert "Inactive user" in response.json()["detail"]
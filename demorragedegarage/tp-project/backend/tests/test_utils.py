@@ -2,6 +2,8 @@
 Tests for utility functions.
 """
 
+import asyncio
+import threading
 import pytest
 from datetime import timedelta
 
@@ -9,6 +11,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from auth import utils
 from auth.utils import (
     get_password_hash,
     verify_password,
@@ -23,7 +26,7 @@ class TestPasswordHashing:
     def test_hash_password(self):
         """Test password hashing returns different value."""
         password = "testpassword123"
-        hashed = get_password_hash(password)
+        hashed = asyncio.run(get_password_hash(password))
         
         assert hashed != password
         assert len(hashed) > 0
@@ -31,27 +34,53 @@ class TestPasswordHashing:
     def test_verify_correct_password(self):
         """Test verifying correct password returns True."""
         password = "testpassword123"
-        hashed = get_password_hash(password)
+        hashed = asyncio.run(get_password_hash(password))
         
-        assert verify_password(password, hashed) is True
+        assert asyncio.run(verify_password(password, hashed)) is True
     
     def test_verify_wrong_password(self):
         """Test verifying wrong password returns False."""
         password = "testpassword123"
-        hashed = get_password_hash(password)
+        hashed = asyncio.run(get_password_hash(password))
         
-        assert verify_password("wrongpassword", hashed) is False
+        assert asyncio.run(verify_password("wrongpassword", hashed)) is False
     
     def test_different_hashes_for_same_password(self):
         """Test same password produces different hashes (salt)."""
         password = "testpassword123"
-        hash1 = get_password_hash(password)
-        hash2 = get_password_hash(password)
+        hash1 = asyncio.run(get_password_hash(password))
+        hash2 = asyncio.run(get_password_hash(password))
         
         assert hash1 != hash2
-        assert verify_password(password, hash1) is True
-        assert verify_password(password, hash2) is True
+        assert asyncio.run(verify_password(password, hash1)) is True
+        assert asyncio.run(verify_password(password, hash2)) is True
 
+    
+    def test_slot_held_until_hash_finishes(self, monkeypatch):
+        """Test a cancelled caller does not free its slot while hashing runs."""
+        slots = threading.BoundedSemaphore(1)
+        monkeypatch.setattr(utils, "hash_slots", slots)
+        started = threading.Event()
+        finish = threading.Event()
+        
+        def slow_hash(password):
+            started.set()
+            finish.wait(5)
+            return password
+        
+        async def scenario():
+            task = asyncio.ensure_future(utils.run_hashing_task(slow_hash, "a"))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+            try:
+                with pytest.raises(utils.HashingOverloadedError):
+                    await utils.run_hashing_task(slow_hash, "b")
+            finally:
+                finish.set()
+        
+        asyncio.run(scenario())
+        
+        assert slots.acquire(timeout=5) is True
 
 class TestJWTTokens:
     """Tests for JWT token functions."""
@@ -16,6 +16,7 @@ const HomePage = observer(() => {
 
   useEffect(() => {
     projectStore.fetchProjects();
+    return projectStore.subscribeToCounts();
   }, []);
 
   const handleAddProjectClick = () => {
@@ -75,10 +76,18 @@ const HomePage = observer(() => {
                 <ProjectCard 
                   key={project.id} 
                   project={project} 
-                  onUpdate={() => projectStore.fetchProjects()}
                 />
               ))}
             </div>
+            {projectStore.nextCursor && (
+              <button
+                className="btn-green-outline"
+                onClick={() => projectStore.fetchMoreProjects()}
+                disabled={projectStore.isLoading}
+              >
+                Показать ещё
+              </button>
+            )}
             {projectStore.projects.length === 0 && (
               <div className="empty-projects">
                 <p>Проектов пока нет. Будьте первым!</p>
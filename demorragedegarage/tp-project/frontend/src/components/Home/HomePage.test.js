@@ -10,6 +10,7 @@ jest.mock('../../stores/projectStore', () => ({
   __esModule: true,
   default: {
     fetchProjects: jest.fn(),
+    subscribeToCounts: jest.fn(() => jest.fn()),
     projects: []
   }
 }));
@@ -6,21 +6,14 @@ import ReviewModal from './ReviewModal';
 import './ProjectCard.css';
 
 const ProjectCard = observer(({ project, onUpdate }) => {
-  const [liked, setLiked] = useState(false);
+  const [liked, setLiked] = useState(Boolean(project.liked_by_me));
   const [showReviews, setShowReviews] = useState(false);
   const [reviews, setReviews] = useState([]);
   const [showReviewModal, setShowReviewModal] = useState(false);
 
   useEffect(() => {
-    if (authStore.isAuthenticated) {
-      checkIfLiked();
-    }
-  }, [project.id, authStore.isAuthenticated]);
-
-  const checkIfLiked = async () => {
-    const isLiked = await projectStore.checkLiked(project.id);
-    setLiked(isLiked);
-  };
+    setLiked(Boolean(project.liked_by_me));
+  }, [project.id, project.liked_by_me]);
 
   const handleLikeToggle = async () => {
     if (!authStore.isAuthenticated) return;
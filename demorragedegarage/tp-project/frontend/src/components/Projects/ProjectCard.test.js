@@ -90,6 +90,14 @@ describe('ProjectCard Component', () => {
     expect(screen.getByText(/Review/)).toBeInTheDocument();
   });
 
+  test('uses the liked flag from the listing without a request', () => {
+    authStore.isAuthenticated = true;
+    render(<ProjectCard project={{ ...mockProject, liked_by_me: true }} />);
+    
+    expect(screen.getByText('❤️ Liked')).toBeInTheDocument();
+    expect(projectStore.checkLiked).not.toHaveBeenCalled();
+  });
+
   test('renders show reviews button', () => {
     render(<ProjectCard project={mockProject} />);
     
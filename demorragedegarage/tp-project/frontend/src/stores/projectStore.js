@@ -1,13 +1,19 @@
 import { makeAutoObservable, flow } from 'mobx';
 import api from '../services/api';
+import { API_BASE_URL } from '../utils/constants';
+
+const PAGE_SIZE = 20;
 
 class ProjectStore {
   projects = [];
+  nextCursor = null;
   myProjects = [];
+  sort = 'newest';
   topProjects = [];
   analytics = null;
   isLoading = false;
   error = null;
+  countVersions = {};
 
   constructor() {
     makeAutoObservable(this);
@@ -36,12 +42,40 @@ class ProjectStore {
     }
   }.bind(this));
 
-  fetchProjects = flow(function* () {
+  fetchProjects = flow(function* (sort = 'newest') {
     this.isLoading = true;
     this.error = null;
     try {
-      const response = yield api.get('/projects/');
-      this.projects = response.data;
+      const response = yield api.get('/projects/', {
+        params: { sort, limit: PAGE_SIZE, ...this.viewerParams() }
+      });
+      this.projects = response.data.items;
+      this.nextCursor = response.data.next_cursor;
+      this.sort = sort;
+      yield this.loadLikedFlags(this.projects);
+    } catch (error) {
+      this.error = this.extractErrorMessage(error);
+    } finally {
+      this.isLoading = false;
+    }
+  }.bind(this));
+
+  fetchMoreProjects = flow(function* () {
+    if (!this.nextCursor || this.isLoading) return;
+    this.isLoading = true;
+    this.error = null;
+    try {
+      const response = yield api.get('/projects/', {
+        params: {
+          sort: this.sort,
+          limit: PAGE_SIZE,
+          cursor: this.nextCursor,
+          ...this.viewerParams()
+        }
+      });
+      this.projects.push(...response.data.items);
+      this.nextCursor = response.data.next_cursor;
+      yield this.loadLikedFlags(this.projects.slice(-response.data.items.length));
     } catch (error) {
       this.error = this.extractErrorMessage(error);
     } finally {
@@ -56,7 +90,7 @@ class ProjectStore {
       const response = yield api.get('/projects/my', {
         params: { token: localStorage.getItem("token") }
       });
-      this.myProjects = response.data;
+      this.myProjects = response.data.items;
     } catch (error) {
       this.error = this.extractErrorMessage(error);
     } finally {
@@ -80,10 +114,10 @@ class ProjectStore {
 
   likeProject = flow(function* (projectId) {
     try {
-      yield api.post(`/projects/${projectId}/like`, {}, {
+      yield api.put(`/projects/${projectId}/like`, {}, {
         params: { token: localStorage.getItem("token") }
       });
-      yield this.fetchProjects();
+      this.setLikedByMe(projectId, true);
     } catch (error) {
       this.error = this.extractErrorMessage(error);
       throw error;
@@ -95,7 +129,7 @@ class ProjectStore {
       yield api.delete(`/projects/${projectId}/like`, {
         params: { token: localStorage.getItem("token") }
       });
-      yield this.fetchProjects();
+      this.setLikedByMe(projectId, false);
     } catch (error) {
       this.error = this.extractErrorMessage(error);
       throw error;
@@ -113,6 +147,28 @@ class ProjectStore {
     }
   }.bind(this));
 
+  fetchLikedIds = flow(function* (projectIds) {
+    try {
+      const response = yield api.post('/projects/liked', {
+        project_ids: projectIds
+      }, {
+        params: { token: localStorage.getItem("token") }
+      });
+      return response.data.project_ids;
+    } catch (error) {
+      return [];
+    }
+  }.bind(this));
+
+  loadLikedFlags = flow(function* (projects) {
+    const unknown = projects.filter(project => project.liked_by_me == null);
+    if (unknown.length === 0 || !localStorage.getItem("token")) return;
+    const liked = new Set(yield this.fetchLikedIds(unknown.map(project => project.id)));
+    unknown.forEach(project => {
+      project.liked_by_me = liked.has(project.id);
+    });
+  }.bind(this));
+
   createReview = flow(function* (projectId, content, rating) {
     try {
       const response = yield api.post(`/projects/${projectId}/review`, {
@@ -131,13 +187,48 @@ class ProjectStore {
   fetchProjectReviews = flow(function* (projectId) {
     try {
       const response = yield api.get(`/projects/${projectId}/reviews`);
-      return response.data;
+      return response.data.items;
     } catch (error) {
       this.error = this.extractErrorMessage(error);
       return [];
     }
   }.bind(this));
 
+  setLikedByMe(projectId, liked) {
+    const project = this.projects.find(item => item.id === projectId);
+    if (project) project.liked_by_me = liked;
+  }
+
+  subscribeToCounts() {
+    if (typeof EventSource === 'undefined') return () => {};
+    const source = new EventSource(`${API_BASE_URL}/events`);
+    source.addEventListener('counts', (event) => {
+      this.applyCounts(JSON.parse(event.data));
+    });
+    source.addEventListener('resync', () => {
+      this.fetchProjects(this.sort);
+    });
+    return () => source.close();
+  }
+
+  applyCounts(update) {
+    const known = this.countVersions[update.project_id];
+    if (known !== undefined && known >= update.version) return;
+    this.countVersions[update.project_id] = update.version;
+    [...this.projects, ...this.topProjects]
+      .filter(project => project.id === update.project_id)
+      .forEach(project => {
+        project.likes_count = update.likes_count;
+        project.reviews_count = update.reviews_count;
+        project.average_rating = update.average_rating;
+      });
+  }
+
+  viewerParams() {
+    const token = localStorage.getItem("token");
+    return token ? { token } : {};
+  }
+
   extractErrorMessage(error) {
     if (error.response?.data?.detail) {
       const detail = error.response.data.detail;
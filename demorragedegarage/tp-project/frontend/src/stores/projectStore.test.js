@@ -5,6 +5,7 @@ jest.mock('../services/api', () => ({
   default: {
     get: jest.fn(),
     post: jest.fn(),
+    put: jest.fn(),
     delete: jest.fn()
   }
 }));
@@ -68,6 +69,79 @@ describe('ProjectStore', () => {
     });
   });
 
+  describe('realtime counts', () => {
+    beforeEach(() => {
+      ProjectStore.projects = [{ id: 1, likes_count: 0, reviews_count: 0, average_rating: null }];
+      ProjectStore.countVersions = {};
+    });
+
+    test('applies newer counts in place', () => {
+      ProjectStore.applyCounts({
+        project_id: 1, likes_count: 3, reviews_count: 1, average_rating: 4, version: 5
+      });
+
+      expect(ProjectStore.projects[0].likes_count).toBe(3);
+      expect(ProjectStore.projects[0].average_rating).toBe(4);
+    });
+
+    test('ignores counts older than the ones applied', () => {
+      ProjectStore.applyCounts({
+        project_id: 1, likes_count: 3, reviews_count: 0, average_rating: null, version: 5
+      });
+      ProjectStore.applyCounts({
+        project_id: 1, likes_count: 2, reviews_count: 0, average_rating: null, version: 4
+      });
+
+      expect(ProjectStore.projects[0].likes_count).toBe(3);
+    });
+
+    test('liking does not refetch the listing', async () => {
+      api.put.mockResolvedValue({ data: { project_id: 1, liked: true } });
+
+      await ProjectStore.likeProject(1);
+
+      expect(api.get).not.toHaveBeenCalled();
+      expect(ProjectStore.projects[0].liked_by_me).toBe(true);
+    });
+  });
+
+  describe('liked flags', () => {
+    beforeEach(() => {
+      localStorage.setItem('token', 'token');
+    });
+
+    afterEach(() => {
+      localStorage.removeItem('token');
+      ProjectStore.projects = [];
+    });
+
+    test('resolves missing flags of a page in one request', async () => {
+      api.get.mockResolvedValue({
+        data: {
+          items: [{ id: 1, liked_by_me: null }, { id: 2, liked_by_me: null }, { id: 3, liked_by_me: false }],
+          next_cursor: null
+        }
+      });
+      api.post.mockResolvedValue({ data: { project_ids: [2] } });
+
+      await ProjectStore.fetchProjects();
+
+      expect(api.post).toHaveBeenCalledTimes(1);
+      expect(api.post.mock.calls[0][1]).toEqual({ project_ids: [1, 2] });
+      expect(ProjectStore.projects.map(project => project.liked_by_me)).toEqual([false, true, false]);
+    });
+
+    test('skips the request when every flag is known', async () => {
+      api.get.mockResolvedValue({
+        data: { items: [{ id: 1, liked_by_me: true }], next_cursor: null }
+      });
+
+      await ProjectStore.fetchProjects();
+
+      expect(api.post).not.toHaveBeenCalled();
+    });
+  });
+
   describe('initial state', () => {
     test('has correct initial values', () => {
       expect(ProjectStore.projects).toEqual([]);